@@ -1,17 +1,20 @@
 from .apply_style import apply_style
 from .format import format
-from .logger import Logger, PrintLogger, VoidLogger
+from .logger import FlightRecorderLogger, Logger, PrintLogger, VoidLogger
 from .pp_context import PPContext
+from .pp_spec import PPField, PPSpec, pp_fields
 from .pp_styles import PPStyles
 from .print import print
-from .typing import StyleOptions
+from .typing import StyleOptions, Truncation
 from .utils import (
     dict_lt, is_dict, is_multiliner, is_oneliner, is_set, is_tuple, lt,
+    pp_sort_key,
 )
 
 __all__ = [
     "apply_style",
     "dict_lt",
+    "FlightRecorderLogger",
     "format",
     "is_dict",
     "is_multiliner",
@@ -21,9 +24,14 @@ __all__ = [
     "Logger",
     "lt",
     "PPContext",
+    "PPField",
+    "pp_fields",
+    "pp_sort_key",
+    "PPSpec",
     "PPStyles",
     "PrintLogger",
     "print",
     "StyleOptions",
+    "Truncation",
     "VoidLogger",
 ]
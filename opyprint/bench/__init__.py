@@ -0,0 +1,18 @@
+from .cases import BenchCase, default_cases
+from .runner import (
+    Comparison, compare, format_comparison, format_results, load_results, run,
+    run_case, save_results,
+)
+
+__all__ = [
+    "BenchCase",
+    "compare",
+    "Comparison",
+    "default_cases",
+    "format_comparison",
+    "format_results",
+    "load_results",
+    "run",
+    "run_case",
+    "save_results",
+]
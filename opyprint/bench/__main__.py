@@ -0,0 +1,80 @@
+"""
+Runs the opyprint benchmarks or compares two saved runs.
+
+Usage::
+
+    python -m opyprint.bench [run] [-k PATTERN] [-o RESULTS.json]
+    python -m opyprint.bench compare BASELINE.json CURRENT.json [-t 0.1]
+    python -m opyprint.bench list
+
+The 'compare' command exits with status 1 when any case regressed by more
+than the threshold.
+"""
+
+import sys
+from argparse import ArgumentParser
+from typing import List
+
+from .cases import default_cases
+from .runner import (
+    compare, format_comparison, format_results, load_results, run,
+    save_results,
+)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = ArgumentParser(prog="python -m opyprint.bench",
+                            description="Benchmarks for opyprint.")
+    commands = parser.add_subparsers(dest="command")
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-k", "--pattern",
+                            help="only run cases whose name contains this")
+    run_parser.add_argument("-o", "--output",
+                            help="save the results as JSON to this path")
+    run_parser.add_argument("--min-time", type=float, default=0.2,
+                            help="minimal duration of a round in seconds")
+    run_parser.add_argument("--repeat", type=int, default=5,
+                            help="number of rounds")
+
+    compare_parser = commands.add_parser("compare",
+                                         help="compare two saved runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=0.1,
+                                help="relative slowdown considered as a "
+                                     "regression, e.g. 0.1 for 10%%")
+
+    commands.add_parser("list", help="list the benchmark cases")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for case in default_cases():
+            print(f"{case.name}: {case.description}")
+        return 0
+
+    if args.command == "compare":
+        comparisons = compare(load_results(args.baseline),
+                              load_results(args.current),
+                              threshold=args.threshold)
+        print(format_comparison(comparisons))
+        regressions = [c.name for c in comparisons if c.regression]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): "
+                  f"{', '.join(regressions)}")
+            return 1
+        return 0
+
+    results = run(min_time=getattr(args, "min_time", 0.2),
+                  pattern=getattr(args, "pattern", None),
+                  repeat=getattr(args, "repeat", 5))
+    print(format_results(results))
+    output = getattr(args, "output", None)
+    if output:
+        save_results(results, output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
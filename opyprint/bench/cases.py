@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import sys
+from typing import Callable, List, TextIO, cast
+
+from frozendict import FrozenDict
+
+from ..logger import FlightRecorderLogger, Logger, PrintLogger
+from ..pp_context import PPContext
+from ..pp_styles import PPStyles
+
+LOREM = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do "
+         "eiusmod tempor incididunt ut labore et dolore magna aliqua. ")
+
+
+class BenchCase:
+    """A named benchmark case, i.e. a function without arguments."""
+
+    __slots__ = [
+        "description",
+        "func",
+        "name",
+    ]
+
+    description: str
+    func: Callable[[], object]
+    name: str
+
+    def __init__(self,
+                 name: str,
+                 func: Callable[[], object],
+                 description: str = ""):
+        self.description = description
+        self.func = func
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"BenchCase({self.name!r})"
+
+
+class NullWriter:
+    """A minimal text stream that discards everything written to it."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def writelines(self, lines) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+class Node:
+    """A custom object with a ppc-aware '__str__' method."""
+
+    def __init__(self, ident: int):
+        self.ident = ident
+        self.children = [ident * 10 + i for i in range(3)]
+
+    def __str__(self, ppc: PPContext = None) -> str:
+        ppc = ppc or PPContext()
+        ppc(f"Node {self.ident}")
+        with ppc.bullets():
+            ppc("children", self.children)
+        return ppc.flush()
+
+
+def nested_dict(depth: int, fanout: int, frozen: bool = False):
+    """Creates a nested dict with the given depth and fanout."""
+    cls = FrozenDict if frozen else dict
+    if depth == 0:
+        return "leaf"
+    return cls({f"key-{i}": nested_dict(depth - 1, fanout, frozen)
+                for i in range(fanout)})
+
+
+def _format(obj, truncate: int = 0, **kwargs) -> Callable[[], str]:
+    def func() -> str:
+        return PPContext(truncate=truncate).format(obj, **kwargs)
+
+    return func
+
+
+def _log(level: int, method: str) -> Callable[[], None]:
+    logger = PrintLogger(level)
+    log = getattr(logger, method)
+    record = {"iteration": 12, "loss": 0.125, "labels": ["a", "b", "c"]}
+    # The writer only needs to support what the logger uses of 'sys.stdout':
+    writer = cast(TextIO, NullWriter())
+
+    def func() -> None:
+        ori_stdout = sys.stdout
+        sys.stdout = writer
+        try:
+            log("record", record)
+        finally:
+            sys.stdout = ori_stdout
+
+    return func
+
+
+def _record(level: int, **kwargs) -> Callable[[], None]:
+    recorder = FlightRecorderLogger(level, **kwargs)
+
+    def func() -> None:
+        recorder.trace("step", 12)
+
+    return func
+
+
+def default_cases() -> List[BenchCase]:
+    """Creates the default benchmark cases."""
+    styled_record = {f"key-{i}": [i, str(i), {"value": i}] for i in range(20)}
+    return [
+        BenchCase("wide_list",
+                  _format(list(range(2000))),
+                  "A list of 2000 ints, without truncation."),
+        BenchCase("nested_dict",
+                  _format(nested_dict(5, 4)),
+                  "A dict nested 5 levels deep with 4 keys per level."),
+        BenchCase("nested_frozendict",
+                  _format(nested_dict(5, 4, frozen=True)),
+                  "A frozendict nested 5 levels deep with 4 keys per level."),
+        BenchCase("long_string",
+                  _format(LOREM * 200),
+                  "A 24k-character string that is wrapped."),
+        BenchCase("large_set_truncated",
+                  _format(set(range(100_000)), truncate=14),
+                  "A set of 100k ints, truncated to 14 elements."),
+        BenchCase("custom_str",
+                  _format([Node(i) for i in range(100)]),
+                  "100 objects with a ppc-aware '__str__' method."),
+        BenchCase("unstyled",
+                  _format(styled_record),
+                  "A dict of 20 mixed records, without styling."),
+        BenchCase("styled",
+                  _format(styled_record,
+                          key_style=PPStyles.bold,
+                          style=PPStyles.blue),
+                  "The same dict of 20 mixed records, with styling."),
+        BenchCase("logger_enabled",
+                  _log(Logger.TRACE, "trace"),
+                  "A 'trace' call on a print logger with level 'trace'."),
+        BenchCase("logger_disabled",
+                  _log(Logger.INFO, "trace"),
+                  "A 'trace' call on a print logger with level 'info'."),
+        # The recording itself, i.e. the difference with 'recorder_disabled',
+        # should take a few hundred nanoseconds; it measured about 0.35 µs,
+        # and about 1 µs with 'max_bytes', on CPython 3.11:
+        BenchCase("recorder_enabled",
+                  _record(Logger.TRACE),
+                  "A 'trace' call on a flight recorder with level 'trace'."),
+        BenchCase("recorder_max_bytes",
+                  _record(Logger.TRACE, max_bytes=1 << 20),
+                  "The same call on a flight recorder with a byte budget."),
+        BenchCase("recorder_disabled",
+                  _record(Logger.INFO),
+                  "A 'trace' call on a flight recorder with level 'info'."),
+    ]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import platform
+from statistics import mean, median, stdev
+from time import time
+from timeit import Timer
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..logger.span import format_duration
+from ..pp_context import PPContext
+from ..utils import align_columns
+from .cases import BenchCase, default_cases
+
+Results = Dict[str, Any]
+
+
+def run_case(case: BenchCase,
+             min_time: float = 0.2,
+             repeat: int = 5) -> Dict[str, Any]:
+    """
+    Times the given benchmark case.
+
+    :param case: The benchmark case.
+    :param min_time: The minimal duration of a round, in seconds. The number
+        of calls per round is calibrated accordingly.
+    :param repeat: The number of rounds.
+    :return: The minimum, median, mean and standard deviation of the time per
+        call, in seconds, and the number of calls per round and of rounds.
+    """
+    timer = Timer(case.func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2,
+                     int(number * min_time / max(elapsed, 1e-6)))
+    times = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": median(times),
+        "mean": mean(times),
+        "stdev": stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(cases: Iterable[BenchCase] = None,
+        min_time: float = 0.2,
+        pattern: str = None,
+        repeat: int = 5,
+        verbose: bool = False) -> Results:
+    """
+    Runs the given or default benchmark cases.
+
+    :param cases: The benchmark cases. Defaults to the default cases.
+    :param min_time: The minimal duration of a round, in seconds.
+    :param pattern: When given, only the cases whose name contains this
+        substring are run.
+    :param repeat: The number of rounds.
+    :param verbose: When true, the timings of each case are printed as soon
+        as they are available.
+    :return: The results, which can be saved as JSON.
+    """
+    results: Results = {
+        "meta": {
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "timestamp": time(),
+        },
+        "cases": {},
+    }
+    for case in default_cases() if cases is None else cases:
+        if pattern and pattern not in case.name:
+            continue
+        timings = run_case(case, min_time=min_time, repeat=repeat)
+        results["cases"][case.name] = timings
+        if verbose:
+            print(f"{case.name}: {format_duration(timings['min'])}")
+    return results
+
+
+def save_results(results: Results, path: str) -> None:
+    """Saves the given benchmark results as JSON."""
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Results:
+    """Loads benchmark results saved as JSON."""
+    with open(path) as file:
+        return json.load(file)
+
+
+class Comparison:
+    """The comparison of the timings of a benchmark case in two runs."""
+
+    __slots__ = [
+        "baseline",
+        "current",
+        "name",
+        "threshold",
+    ]
+
+    baseline: Optional[float]
+    current: Optional[float]
+    name: str
+    threshold: float
+
+    def __init__(self,
+                 name: str,
+                 baseline: Optional[float],
+                 current: Optional[float],
+                 threshold: float):
+        self.baseline = baseline
+        self.current = current
+        self.name = name
+        self.threshold = threshold
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """The ratio of the current to the baseline time, when available."""
+        if self.baseline and self.current is not None:
+            return self.current / self.baseline
+        return None
+
+    @property
+    def regression(self) -> bool:
+        """True when the case got slower by more than the threshold."""
+        ratio = self.ratio
+        return ratio is not None and ratio > 1.0 + self.threshold
+
+    @property
+    def improvement(self) -> bool:
+        """True when the case got faster by more than the threshold."""
+        ratio = self.ratio
+        return ratio is not None and ratio < 1.0 / (1.0 + self.threshold)
+
+    @property
+    def status(self) -> str:
+        if self.baseline is None:
+            return "new"
+        if self.current is None:
+            return "missing"
+        if self.regression:
+            return "REGRESSION"
+        if self.improvement:
+            return "improved"
+        return "ok"
+
+
+def compare(baseline: Results,
+            current: Results,
+            threshold: float = 0.1) -> List[Comparison]:
+    """
+    Compares the minimal time per call of the cases of two benchmark runs.
+
+    :param baseline: The results of the baseline run.
+    :param current: The results of the current run.
+    :param threshold: The relative slowdown, e.g. 0.1 for 10%, above which a
+        case is considered to have regressed.
+    """
+    if threshold < 0:
+        msg = "Expected a non-negative number as 'threshold', got '{}'."
+        raise ValueError(msg.format(threshold))
+    base_cases = baseline["cases"]
+    cur_cases = current["cases"]
+    names = [*base_cases, *(name for name in cur_cases
+                            if name not in base_cases)]
+    return [Comparison(name,
+                       base_cases[name]["min"] if name in base_cases else None,
+                       cur_cases[name]["min"] if name in cur_cases else None,
+                       threshold)
+            for name in names]
+
+
+def format_results(results: Results, ppc: PPContext = None) -> str:
+    """Formats the given benchmark results as a table."""
+    rows = [(name,
+             format_duration(timings["min"]),
+             format_duration(timings["median"]),
+             str(timings["number"]))
+            for name, timings in results["cases"].items()]
+    return _format_table(("case", "min", "median", "calls/round"), rows,
+                         ppc or PPContext())
+
+
+def format_comparison(comparisons: List[Comparison],
+                      ppc: PPContext = None) -> str:
+    """Formats the given comparisons as a table."""
+    def duration(seconds: Optional[float]) -> str:
+        return "-" if seconds is None else format_duration(seconds)
+
+    rows = [(comparison.name,
+             duration(comparison.baseline),
+             duration(comparison.current),
+             "-" if comparison.ratio is None else f"{comparison.ratio:.2f}x",
+             comparison.status)
+            for comparison in comparisons]
+    return _format_table(("case", "baseline", "current", "ratio", "status"),
+                         rows, ppc or PPContext())
+
+
+def _format_table(header: Tuple[str, ...],
+                  rows: Sequence[Tuple[str, ...]],
+                  ppc: PPContext) -> str:
+    right = [False] + [True] * (len(header) - 1)
+    for line in align_columns([header, *rows], right):
+        ppc(line)
+    return ppc.flush()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from .pp_context import PPContext
-from .typing import StyleOptions
+from .typing import StyleOptions, Truncation
 
 
 # noinspection PyShadowingBuiltins
@@ -9,9 +9,10 @@ def format(*args,
            bullet: str = None,
            indent: str = "",
            key_style: StyleOptions = None,
+           max_depth: int = 0,
            style: StyleOptions = None,
-           truncate: int = PPContext.default_truncate,
-           width: int = PPContext.default_width) -> None:
+           truncate: Truncation = PPContext.default_truncate,
+           width: int = PPContext.default_width) -> str:
     """
     Utility for getting the pp-formatted string.
 
@@ -26,20 +27,26 @@ def format(*args,
     :param indent: The indentation prefix string.
     :param key_style: Optional style specifications for the key part of
         key-value pairs.
+    :param max_depth: When not 0, the containers that are nested deeper than
+        this number of enclosing containers are rendered as a summary, such
+        as ``{…12 keys}`` or ``[…3000 items]``, without iterating over them.
     :param style: Optional style specifications.
     :param truncate: The truncation setting. When this value is 0, no
         truncation is applied. When any other positive integer value *n* is
         given, then no more than *n* list/tuple/set elements or dictionary
         items will be included and no more than *n* lines of a wrapped
-        string will be included. Defaults to the value of the
+        string will be included. When a tuple *(head, tail)* is given, then
+        the first *head* and the last *tail* elements or items will be
+        included. Defaults to the value of the
         :attr:`PPContext.default_truncate` class attribute.
     :param width: Total width in characters, including bullets and
         indentation. Defaults to the value of the 'default_width' class
         attribute of the :class:`~opyprint.pp_context.PPContext` class.
     """
-    PPContext(indent=indent,
-              width=width,
-              truncate=truncate).format(*args,
-                                        bullet=bullet,
-                                        style=style,
-                                        key_style=key_style)
+    return PPContext(indent=indent,
+                     max_depth=max_depth,
+                     width=width,
+                     truncate=truncate).format(*args,
+                                               bullet=bullet,
+                                               style=style,
+                                               key_style=key_style)
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from typing import Any, ClassVar, DefaultDict, Dict, List, Optional, Tuple
+from urllib.request import Request, urlopen
+
+from .json_lines import LEVEL_NAMES
+from .logger.logger import LoggerBase
+from .pp_context import PPContext
+
+
+class Instrumentation:
+    """
+    Collects opt-in metrics about the cost of pretty-printing and logging:
+
+    - the number of emitted log records, per level,
+    - the number of suppressed log records, per level and reason, i.e.
+      ``"level"`` when the log level is not enabled or ``"policy"`` when
+      suppressed by a sampling or deduplication policy,
+    - the number of bytes emitted by the loggers,
+    - the time spent by the loggers on formatting and on writing, with a
+      histogram of the formatting time per record,
+    - the number of objects formatted by :class:`~opyprint.PPContext` and the
+      (exclusive) time spent formatting them, per type, where lists of
+      scalars that are converted in bulk count as one ``list [scalars]``
+      object.
+
+    Use :func:`enable_instrumentation` to start collecting metrics. When no
+    instrumentation is enabled, the instrumented code paths only check a
+    class attribute.
+    """
+
+    format_buckets: ClassVar[Tuple[float, ...]] = (
+        1e-5, 2.5e-5, 1e-4, 2.5e-4, 1e-3, 2.5e-3, 1e-2, 0.1)
+    """The upper bounds, in seconds, of the format-time histogram buckets."""
+
+    __slots__ = [
+        "bytes_emitted",
+        "format_histogram",
+        "format_seconds",
+        "records",
+        "suppressed",
+        "type_calls",
+        "type_seconds",
+        "write_seconds",
+        "_local",
+    ]
+
+    bytes_emitted: int
+    format_histogram: List[int]
+    format_seconds: float
+    records: DefaultDict[int, int]
+    suppressed: DefaultDict[str, DefaultDict[int, int]]
+    type_calls: DefaultDict[str, int]
+    type_seconds: DefaultDict[str, float]
+    write_seconds: float
+    _local: threading.local
+
+    def __init__(self):
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets all metrics."""
+        self.bytes_emitted = 0
+        self.format_histogram = [0] * (len(self.format_buckets) + 1)
+        self.format_seconds = 0.0
+        self.records = defaultdict(int)
+        self.suppressed = defaultdict(lambda: defaultdict(int))
+        self.type_calls = defaultdict(int)
+        self.type_seconds = defaultdict(float)
+        self.write_seconds = 0.0
+
+    # -- Recording --------------- --- --  -
+
+    def timed_dispatch(self, ppc: PPContext, obj, **kwargs):
+        """
+        Delegates to the format-dispatch generator of the given pp-context and
+        records the time spent, excluding the time spent on nested dispatches,
+        for the type of the given object.
+        """
+        stack: Optional[List[float]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            return (yield from ppc._format_dispatch(obj, **kwargs))
+        finally:
+            self._record_type(type(obj).__qualname__, stack, start)
+
+    def timed_scalars(self, items, elided: int = None) -> Optional[List[str]]:
+        """
+        Delegates to the bulk scalar conversion of :class:`~opyprint.PPContext`
+        and records the time spent as a single ``list [scalars]`` object, when
+        the items are all scalars.
+        """
+        stack: Optional[List[float]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = perf_counter()
+        result = PPContext._format_scalars(items, elided)
+        if result is None:
+            # The time spent on the check is attributed to the enclosing type:
+            stack.pop()
+        else:
+            self._record_type(f"{type(items).__qualname__} [scalars]", stack,
+                              start)
+        return result
+
+    def record_emitted(self,
+                       level: int,
+                       num_bytes: int,
+                       format_seconds: float,
+                       write_seconds: float) -> None:
+        """Records an emitted log record."""
+        self.records[level] += 1
+        self.bytes_emitted += num_bytes
+        self.format_histogram[bisect_left(self.format_buckets,
+                                          format_seconds)] += 1
+        self.format_seconds += format_seconds
+        self.write_seconds += write_seconds
+
+    def record_suppressed(self, level: int, reason: str = "level") -> None:
+        """Records a suppressed log record."""
+        self.suppressed[reason][level] += 1
+
+    def _record_type(self, name: str, stack: List[float],
+                     start: float) -> None:
+        """
+        Records the time spent since the given start time, excluding the time
+        spent on nested dispatches, for the given type name.
+        """
+        elapsed = perf_counter() - start
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        self.type_calls[name] += 1
+        self.type_seconds[name] += elapsed - nested
+
+    # -- Reporting --------------- --- --  -
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the collected metrics."""
+        return {
+            "records": {_level_name(level): count
+                        for level, count in sorted(self.records.items())},
+            "suppressed": {
+                reason: {_level_name(level): count
+                         for level, count in sorted(counts.items())}
+                for reason, counts in sorted(self.suppressed.items())
+            },
+            "bytes_emitted": self.bytes_emitted,
+            "format_seconds": self.format_seconds,
+            "format_histogram": dict(zip(
+                [*map(repr, self.format_buckets), "+Inf"],
+                accumulate(self.format_histogram))),
+            "write_seconds": self.write_seconds,
+            "types": {
+                name: {"calls": self.type_calls[name],
+                       "seconds": self.type_seconds[name]}
+                for name in sorted(self.type_calls)
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "opyprint") -> str:
+        """
+        Returns the collected metrics in the Prometheus text exposition
+        format.
+
+        :param prefix: The prefix for the metric names.
+        """
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, doc: str, samples) -> None:
+            lines.append(f"# HELP {prefix}_{name} {doc}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        metric("log_records_total", "counter",
+               "Emitted log records.",
+               [(_labels(level=_level_name(level)), count)
+                for level, count in sorted(self.records.items())])
+        metric("log_records_suppressed_total", "counter",
+               "Suppressed log records.",
+               [(_labels(level=_level_name(level), reason=reason), count)
+                for reason, counts in sorted(self.suppressed.items())
+                for level, count in sorted(counts.items())])
+        metric("log_bytes_total", "counter",
+               "Bytes emitted by the loggers.",
+               [("", self.bytes_emitted)])
+        cumulative = list(accumulate(self.format_histogram))
+        metric("log_format_seconds", "histogram",
+               "Time spent by the loggers on formatting a record.",
+               [*(("_bucket" + _labels(le=repr(bound)), count)
+                  for bound, count in zip(self.format_buckets, cumulative)),
+                ("_bucket" + _labels(le="+Inf"), cumulative[-1]),
+                ("_sum", repr(self.format_seconds)),
+                ("_count", cumulative[-1])])
+        metric("log_write_seconds_total", "counter",
+               "Time spent by the loggers on writing.",
+               [("", repr(self.write_seconds))])
+        metric("format_calls_total", "counter",
+               "Objects formatted, per type.",
+               [(_labels(type=name), count)
+                for name, count in sorted(self.type_calls.items())])
+        metric("format_seconds_total", "counter",
+               "Exclusive time spent formatting objects, per type.",
+               [(_labels(type=name), repr(seconds))
+                for name, seconds in sorted(self.type_seconds.items())])
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self,
+                          target: str,
+                          prefix: str = "opyprint",
+                          timeout: float = 5.0) -> None:
+        """
+        Exports the collected metrics in the Prometheus text exposition
+        format.
+
+        :param target: Either an HTTP(S) URL, such as the URL of a Pushgateway
+            job, to which the metrics are posted, or the path of a local file,
+            such as a file read by the textfile collector of the node
+            exporter, which is replaced atomically.
+        :param prefix: The prefix for the metric names.
+        :param timeout: The timeout in seconds when posting to a URL.
+        """
+        content = self.to_prometheus(prefix=prefix).encode("utf-8")
+        if target.startswith(("http://", "https://")):
+            request = Request(target,
+                              data=content,
+                              headers={"Content-Type":
+                                       "text/plain; version=0.0.4"},
+                              method="POST")
+            with urlopen(request, timeout=timeout):
+                pass
+        else:
+            directory = os.path.dirname(os.path.abspath(target))
+            with NamedTemporaryFile("wb", dir=directory, delete=False) as file:
+                file.write(content)
+            os.replace(file.name, target)
+
+
+def enable_instrumentation(
+        instrumentation: Instrumentation = None) -> Instrumentation:
+    """
+    Enables the instrumentation of the pp-contexts and loggers.
+
+    :param instrumentation: The instrumentation object that collects the
+        metrics. A new one is created when not given.
+    :return: The enabled instrumentation object.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    PPContext.instrumentation = instrumentation
+    LoggerBase.instrumentation = instrumentation
+    return instrumentation
+
+
+def disable_instrumentation() -> None:
+    """Disables the instrumentation of the pp-contexts and loggers."""
+    PPContext.instrumentation = None
+    LoggerBase.instrumentation = None
+
+
+def stats() -> Dict[str, Any]:
+    """
+    Returns a snapshot of the metrics collected by the enabled
+    instrumentation, or an empty dict when no instrumentation is enabled.
+    """
+    instrumentation = PPContext.instrumentation
+    return instrumentation.stats() if instrumentation else {}
+
+
+def _labels(**labels: str) -> str:
+    content = ",".join(
+        '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels.items())
+    return "{" + content + "}"
+
+
+def _level_name(level: int) -> str:
+    return LEVEL_NAMES.get(level, str(level))
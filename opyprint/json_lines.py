@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections import Counter
+from inspect import isgenerator
+from json import dumps
+from math import isfinite
+from typing import Iterable, Iterator, List, Optional, Set, TextIO
+
+from .pp_context import PPContext
+from .utils import (
+    bounded_str, is_dict, is_huge_int, is_set, pp_sorted, summarize_int,
+)
+
+LEVEL_NAMES = {
+    0: "disabled",
+    1: "debug",
+    2: "trace",
+    3: "info",
+}
+"""Maps the log levels on the names used in JSON-lines records."""
+
+
+def iter_json(obj, ppc: PPContext = None) -> Iterator[str]:
+    """
+    Encodes the given object as JSON, yielding the encoded content in chunks
+    such that large values are not built in memory twice.
+
+    The encoding honors the truncation settings of the given pp-context:
+
+    - No more than *n* list/tuple/set elements or dictionary items are
+      included, followed by a ``"..."`` element, when the truncation setting
+      *n* is not 0. When the truncation setting is a tuple *(head, tail)*,
+      the first *head* and the last *tail* elements or items are included,
+      with an element such as ``"... (12 more)"`` in between.
+    - Strings are cut off at the maximal number of characters a wrapped string
+      can show in the pp-context, i.e. the content width times the truncation
+      setting.
+
+    The containers that are nested beyond the maximal depth of the given
+    pp-context are encoded as strings holding a summary, such as
+    ``"{…12 keys}"``.
+    Containers that contain themselves are encoded as a string holding a
+    back-reference marker, such as ``"<cycle: list>"``, where they recur.
+    Integers with more than :func:`~opyprint.utils.max_int_digits` digits are
+    encoded as strings holding a summary of their digits, see
+    :func:`~opyprint.utils.summarize_int`.
+
+    Dictionaries are encoded as JSON objects, with their keys sorted, see
+    :func:`~opyprint.utils.pp_sorted`, and converted to strings. Non-string
+    keys whose string collides with another key, such as ``1`` and ``"1"``,
+    are converted to their type and repr, such as ``"int(1)"``. Other
+    collections are encoded as JSON arrays. Objects without a native JSON
+    representation are encoded as strings holding their pretty-printed
+    representation.
+
+    :param obj: The object to encode.
+    :param ppc: The pp-context that provides the truncation settings and that
+        pretty-prints custom objects. A default context is used when not
+        given.
+    """
+    return _iter_json_root(obj, ppc, 0)
+
+
+def iter_json_record(msgs: Iterable,
+                     *,
+                     depth: int = 0,
+                     level: int = 2,
+                     name: Optional[str] = None,
+                     ppc: PPContext = None,
+                     timestamp: float = 0.0) -> Iterator[str]:
+    """
+    Encodes a log record as a single line of JSON, yielding the encoded
+    content in chunks.
+
+    :param msgs: The log messages.
+    :param depth: The indentation depth of the logger.
+    :param level: The log level.
+    :param name: The name of the logger.
+    :param ppc: The pp-context used to encode the messages, see
+        :func:`iter_json`.
+    :param timestamp: The time of the log call in seconds since the epoch.
+    """
+    yield '{"time":'
+    yield float.__repr__(timestamp)
+    yield ',"level":'
+    yield _quote(LEVEL_NAMES.get(level, str(level)))
+    yield ',"depth":'
+    yield int.__repr__(depth)
+    yield ',"logger":'
+    yield "null" if name is None else _quote(name)
+    yield ',"args":'
+    # The messages are at the top level, like when they are pretty-printed:
+    yield from _iter_json_root(list(msgs), ppc, -1)
+    yield "}\n"
+
+
+def write_json_record(file: TextIO, msgs: Iterable, **kwargs) -> None:
+    """
+    Writes a log record as a single line of JSON to the given file-like object.
+    The keyword arguments are passed on to :func:`iter_json_record`.
+
+    The line is encoded in full before it is written, in one call, such that
+    a failure to encode the record never leaves a partial line in the file.
+    """
+    file.write("".join(iter_json_record(msgs, **kwargs)))
+
+
+def _iter_json_root(obj, ppc: Optional[PPContext], depth: int) \
+        -> Iterator[str]:
+    # Custom objects are formatted in a context without indentation or bullet:
+    ppc = ppc._squash() if ppc else PPContext()
+    # The total number of items, including the last ones:
+    truncate = ppc._truncate
+    max_length = ppc.content_width * truncate if truncate else 0
+    return _iter_json(obj, ppc, truncate, max_length, ppc.max_depth, depth,
+                      set())
+
+
+def _iter_json(obj,
+               ppc: PPContext,
+               truncate: int,
+               max_length: int,
+               max_depth: int,
+               depth: int,
+               ancestors: Set[int]) -> Iterator[str]:
+    if obj is None:
+        yield "null"
+    elif obj is True:
+        yield "true"
+    elif obj is False:
+        yield "false"
+    elif isinstance(obj, str):
+        yield _encode_str(obj, max_length)
+    elif isinstance(obj, int):
+        if is_huge_int(obj):
+            # Converting huge ints to strings is quadratic in the number of
+            # digits, and fails beyond the interpreter's digits limit:
+            yield _quote(summarize_int(obj))
+        else:
+            yield int.__repr__(obj)
+    elif isinstance(obj, float):
+        if isfinite(obj):
+            yield float.__repr__(obj)
+        else:
+            yield _quote(float.__repr__(obj))
+    elif is_dict(obj):
+        if max_depth and depth >= max_depth:
+            yield _quote(PPContext._summarize(obj))
+            return
+        if id(obj) in ancestors:
+            yield _quote(f"<cycle: {type(obj).__qualname__}>")
+            return
+        keys = pp_sorted(obj.keys())
+        truncated = bool(truncate) and len(keys) > truncate
+        elided = None
+        if truncated and ppc._tail:
+            elided = truncate - ppc._tail
+            keys = ppc._truncate_items(keys)
+            truncated = False
+        elif truncated:
+            keys = keys[:truncate]
+        names = _key_strs(keys)
+        ancestors.add(id(obj))
+        yield "{"
+        for index, key in enumerate(keys):
+            if index:
+                yield ","
+            if index == elided:
+                yield _quote(key) + ':"..."'
+                continue
+            yield _encode_str(names[index], max_length)
+            yield ":"
+            yield from _iter_json(obj[key], ppc, truncate, max_length,
+                                  max_depth, depth + 1, ancestors)
+        ancestors.discard(id(obj))
+        if truncated:
+            yield ',"...":"..."'
+        yield "}"
+    elif isinstance(obj, (list, tuple, range)) or is_set(obj) or \
+            isgenerator(obj):
+        if max_depth and depth >= max_depth:
+            yield _quote(PPContext._summarize(obj))
+            return
+        if id(obj) in ancestors:
+            yield _quote(f"<cycle: {type(obj).__qualname__}>")
+            return
+        items = obj
+        if is_set(obj):
+            items = pp_sorted(obj)
+        limit = truncate
+        if truncate and ppc._tail:
+            # The first and last items, with the ellipsis as an item:
+            if isgenerator(items):
+                items = ppc._generate_items_aux(items)
+            elif len(items) > truncate:
+                items = ppc._truncate_items(items)
+            limit = 0
+        ancestors.add(id(obj))
+        yield "["
+        for index, item in enumerate(items):
+            if limit and index == limit:
+                yield ',"..."' if index else '"..."'
+                break
+            if index:
+                yield ","
+            yield from _iter_json(item, ppc, truncate, max_length,
+                                  max_depth, depth + 1, ancestors)
+        ancestors.discard(id(obj))
+        yield "]"
+    else:
+        yield _encode_str(ppc.format(obj), max_length)
+
+
+def _encode_str(txt: str, max_length: int) -> str:
+    if max_length and len(txt) > max_length:
+        txt = txt[:max_length] + " [...]"
+    return _quote(txt)
+
+
+def _key_strs(keys: list) -> List[str]:
+    """
+    Converts the given dict keys to the names of JSON object members, where
+    non-string keys that collide with another key, such as ``1`` and ``"1"``,
+    are named after their type and repr, such as ``"int(1)"``.
+    """
+    names = [key if isinstance(key, str) else bounded_str(key) for key in keys]
+    if len(set(names)) < len(names):
+        counts = Counter(names)
+        names = [name if isinstance(key, str) or counts[name] == 1 else
+                 # The repr of huge ints fails like their string conversion:
+                 f"{type(key).__qualname__}("
+                 f"{name if isinstance(key, int) else repr(key)})"
+                 for key, name in zip(keys, names)]
+    return names
+
+
+def _quote(txt: str) -> str:
+    return dumps(txt, ensure_ascii=False)
@@ -1,11 +1,23 @@
+from .flight_recorder_logger import FlightRecorderLogger
 from .logged_mixin import LoggedMixin
 from .logger import Logger, LoggerBase, VoidLogger
 from .print_logger import PrintLogger
+from .sampling import (
+    Deduplicate, EveryNth, LogPolicy, Probabilistic, TokenBucket,
+)
+from .traced import traced
 
 __all__ = [
+    "Deduplicate",
+    "EveryNth",
+    "FlightRecorderLogger",
     "Logger",
     "LoggedMixin",
     "LoggerBase",
+    "LogPolicy",
     "PrintLogger",
+    "Probabilistic",
+    "TokenBucket",
+    "traced",
     "VoidLogger",
 ]
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import signal
+import sys
+from copy import copy
+from datetime import datetime
+from io import StringIO
+from time import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+from .logger import Logger, LoggerBase
+from .sampling import LogPolicy
+from ..pp_context import PPContext
+
+_SNAPSHOT_TYPES = (bytearray, dict, list, set)
+
+
+class FlightRecorderLogger(LoggerBase):
+    """
+    Logger that keeps the most recent log records in an in-memory ring buffer
+    without formatting them.
+
+    The raw log arguments (or shallow snapshots of them) are recorded and only
+    rendered when :meth:`~dump` is called, either on demand or automatically
+    on an unhandled exception (see :meth:`~dump_on_exception`) or on a signal
+    (see :meth:`~dump_on_signal`). This affords trace-level detail around a
+    crash without paying the cost of continuously formatting and writing trace
+    logs.
+
+    Example::
+
+        recorder = FlightRecorderLogger(capacity=500).dump_on_exception()
+        obj = Target(logger=recorder)  # a LoggedMixin subclass
+    """
+
+    # -- Instance Initialization ---------------- --- --  -
+
+    __slots__ = [
+        "_capacity",
+        "_count",
+        "_max_bytes",
+        "_next",
+        "_prev_excepthook",
+        "_prev_signal_handlers",
+        "_records",
+        "_size",
+        "_sizes",
+        "_snapshot",
+    ]
+
+    _capacity: int
+    _count: int
+    _max_bytes: int
+    _next: int
+    _prev_excepthook: Optional[Callable]
+    _prev_signal_handlers: Dict[int, Any]
+    _records: List[Optional[tuple]]
+    _size: int
+    _sizes: List[int]
+    _snapshot: bool
+
+    def __init__(self,
+                 level: int = 2,
+                 capacity: int = 1000,
+                 dedupe: bool = False,
+                 json_lines: bool = False,
+                 max_bytes: int = 0,
+                 max_depth: int = 0,
+                 name: str = None,
+                 parent: Logger = None,
+                 sampling: LogPolicy = None,
+                 snapshot: bool = False,
+                 truncate: int = 0,
+                 width: int = 100):
+        """
+        :param level: log level
+        :param capacity: The maximum number of records that are kept.
+        :param dedupe: See :class:`~opyprint.logger.logger.LoggerBase`.
+        :param json_lines: When true, the records are dumped as JSON lines.
+        :param max_bytes: When non-zero, the oldest records are also discarded
+            when the approximate (shallow) size of the recorded arguments
+            exceeds this number of bytes.
+        :param max_depth: See :class:`~opyprint.logger.logger.LoggerBase`.
+        :param name: Optional logger name, included in JSON-lines records.
+        :param parent: When given, the indentation of this parent logger is
+            added to the indentation of this "dependent" logger.
+        :param sampling: See :class:`~opyprint.logger.logger.LoggerBase`.
+        :param snapshot: When true, mutable list, dict, set and bytearray
+            arguments are shallow-copied when recorded, such that the dump
+            shows their state at the time of the log call.
+        :param truncate: The truncation setting used when dumping.
+        :param width: max content width
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            msg = "Expected a positive int as 'capacity', got '{}'."
+            raise ValueError(msg.format(capacity))
+
+        super().__init__(level=level,
+                         dedupe=dedupe,
+                         json_lines=json_lines,
+                         max_depth=max_depth,
+                         name=name,
+                         parent=parent,
+                         sampling=sampling,
+                         truncate=truncate,
+                         width=width)
+        self._capacity = capacity
+        self._count = 0
+        self._max_bytes = max_bytes
+        self._next = 0
+        self._prev_excepthook = None
+        self._prev_signal_handlers = {}
+        self._records = [None] * capacity
+        self._size = 0
+        self._sizes = [0] * capacity if max_bytes else []
+        self._snapshot = snapshot
+
+    # -- Accessors ---------------- --- --  -
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of records that are kept."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """The number of records that are currently kept."""
+        return self._count
+
+    # -- Methods ---------------- --- --  -
+
+    def log(self,
+            *msgs,
+            bullet=None,
+            indent="",
+            key_style=None,
+            level=LoggerBase.TRACE,
+            margin=0,
+            style=None,
+            truncate=None):
+        # Record directly instead of delegating to 'handle_log' to keep the
+        # per-record overhead as low as possible:
+        if 0 < self._level <= level:
+            if self._policies and not self._admit(msgs, level):
+                if self.instrumentation is not None:
+                    self.instrumentation.record_suppressed(level, "policy")
+                return
+            if self._parent is None and not self._snapshot and \
+                    not self._max_bytes:
+                # The common case, inlined. The oldest record is overwritten
+                # when the buffer is full:
+                slot = self._next
+                self._records[slot] = (time(), level, msgs, (
+                    self._indent, self._ppc.indentation, indent, bullet,
+                    key_style, margin, style, truncate))
+                self._next = (slot + 1) % self._capacity
+                if self._count < self._capacity:
+                    self._count += 1
+            else:
+                self._record(msgs, bullet, indent, key_style, level, margin,
+                             style, truncate)
+            if self.instrumentation is not None:
+                self.instrumentation.record_emitted(level, 0, 0.0, 0.0)
+        elif self.instrumentation is not None:
+            self.instrumentation.record_suppressed(level)
+
+    def handle_log(self,
+                   *msgs,
+                   bullet=None,
+                   indent="",
+                   key_style=None,
+                   level=LoggerBase.TRACE,
+                   margin=0,
+                   style=None,
+                   truncate=None):
+        self._record(msgs, bullet, indent, key_style, level, margin, style,
+                     truncate)
+
+    def clear(self) -> None:
+        """Discards all recorded log records."""
+        self._records = [None] * self._capacity
+        self._count = 0
+        self._next = 0
+        self._size = 0
+
+    def dump(self,
+             file: TextIO = None,
+             clear: bool = False,
+             styled: bool = True,
+             timestamps: bool = False) -> str:
+        """
+        Renders the recorded log records, from oldest to newest, as
+        pretty-printed text or, when the logger is in JSON-lines mode, as JSON
+        lines.
+
+        :param file: When given, the rendered records are also written to this
+            file-like object.
+        :param clear: When true, the recorded log records are discarded.
+        :param styled: When false, the recorded style options are ignored.
+        :param timestamps: When true, each record is preceded by the time at
+            which it was recorded. JSON-lines records always include the time.
+        :return: The rendered records.
+        """
+        # Record the pending policy summaries, such as suppressed repeats:
+        self.close()
+        if self._json_lines:
+            result = self._dump_json_lines()
+        else:
+            result = self._dump_text(styled, timestamps)
+
+        if clear:
+            self.clear()
+
+        if file is not None:
+            file.write(result + "\n")
+            file.flush()
+        return result
+
+    def dump_on_exception(self, file: TextIO = None) -> FlightRecorderLogger:
+        """
+        Installs a :func:`sys.excepthook` that dumps the recorded log records
+        when an unhandled exception occurs, before delegating to the
+        previously installed hook.
+
+        :param file: The file-like object to dump to. Defaults to
+            ``sys.stderr``.
+        """
+        prev_excepthook = sys.excepthook
+
+        def excepthook(exc_type, exc_value, exc_traceback):
+            self.dump(file=file or sys.stderr, clear=True)
+            prev_excepthook(exc_type, exc_value, exc_traceback)
+
+        self._prev_excepthook = prev_excepthook
+        sys.excepthook = excepthook
+        return self
+
+    def dump_on_signal(self,
+                       *signums: int,
+                       file: TextIO = None) -> FlightRecorderLogger:
+        """
+        Installs signal handlers that dump the recorded log records when one of
+        the given signals is received, before delegating to the previously
+        installed handler when that is a callable.
+
+        :param signums: The signal numbers, e.g. ``signal.SIGUSR1``.
+        :param file: The file-like object to dump to. Defaults to
+            ``sys.stderr``.
+        """
+        for signum in signums:
+            prev_handler = signal.getsignal(signum)
+            self._prev_signal_handlers[signum] = prev_handler
+            signal.signal(signum, self._signal_handler(prev_handler, file))
+        return self
+
+    def uninstall(self) -> FlightRecorderLogger:
+        """
+        Restores the exception hook and signal handlers that were replaced by
+        :meth:`~dump_on_exception` and :meth:`~dump_on_signal`.
+        """
+        if self._prev_excepthook is not None:
+            sys.excepthook = self._prev_excepthook
+            self._prev_excepthook = None
+        for signum, handler in self._prev_signal_handlers.items():
+            signal.signal(signum, handler)
+        self._prev_signal_handlers = {}
+        return self
+
+    # -- System Methods ---------------- --- --  -
+
+    def _dump_json_lines(self) -> str:
+        buffer = StringIO()
+        for record in self._iter_records():
+            timestamp, level, msgs, layout = record
+            (depth, own_indent, indent, bullet, key_style, margin, style,
+             truncate) = layout
+            try:
+                self._write_json_record(buffer,
+                                        msgs,
+                                        depth=depth,
+                                        level=level,
+                                        timestamp=timestamp,
+                                        truncate=truncate)
+            except Exception as error:
+                self._write_json_record(
+                    buffer,
+                    [f"<failed to render record: {error!r}>"],
+                    depth=depth,
+                    level=level,
+                    timestamp=timestamp)
+        return buffer.getvalue()[:-1]
+
+    def _dump_text(self, styled: bool, timestamps: bool) -> str:
+        ppc = PPContext(width=self._width,
+                        max_depth=self._ppc.max_depth,
+                        truncate=self._ppc.truncation)
+        for record in self._iter_records():
+            timestamp, level, msgs, layout = record
+            (depth, own_indent, indent, bullet, key_style, margin, style,
+             truncate) = layout
+            if not styled:
+                key_style = style = None
+            for i in range(margin):
+                ppc.newline()
+            ppc.indentation = own_indent
+            if timestamps:
+                stamp = datetime.fromtimestamp(timestamp)
+                ppc(f"[{stamp:%H:%M:%S.%f}]", indent=indent)
+            try:
+                ppc(*msgs,
+                    bullet=bullet,
+                    indent=indent,
+                    key_style=key_style,
+                    style=style,
+                    truncate=truncate)
+            except Exception as error:
+                # Dumps typically happen while handling a crash, so never let
+                # a single misbehaving object prevent the rest of the dump:
+                ppc(f"<failed to render record: {error!r}>", indent=indent)
+            for i in range(margin):
+                ppc.newline()
+        ppc.indentation = ""
+        return ppc.flush()
+
+    def _iter_records(self) -> Iterator[tuple]:
+        """Iterates over the recorded records, from oldest to newest."""
+        oldest = self._next - self._count
+        for index in range(oldest, oldest + self._count):
+            record = self._records[index % self._capacity]
+            assert record is not None
+            yield record
+
+    def _record(self, msgs, bullet, indent, key_style, level, margin, style,
+                truncate) -> None:
+        depth = self._indent
+        if self._parent:
+            indent += self._parent.indentation
+            depth += self._parent.indent_depth
+        if self._snapshot:
+            msgs = tuple(copy(msg) if isinstance(msg, _SNAPSHOT_TYPES)
+                         else msg
+                         for msg in msgs)
+
+        # Overwrite the oldest record when the buffer is full:
+        slot = self._next
+        self._records[slot] = (time(), level, msgs, (
+            depth, self._ppc.indentation, indent, bullet, key_style, margin,
+            style, truncate))
+        self._next = (slot + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+        elif self._max_bytes:
+            self._size -= self._sizes[slot]
+
+        if self._max_bytes:
+            # The shallow size of the arguments, which is cheap to compute:
+            size = sum(map(sys.getsizeof, msgs))
+            self._sizes[slot] = size
+            self._size += size
+            while self._size > self._max_bytes and self._count > 1:
+                oldest = (self._next - self._count) % self._capacity
+                self._records[oldest] = None
+                self._size -= self._sizes[oldest]
+                self._count -= 1
+
+    def _signal_handler(self, prev_handler, file: Optional[TextIO]) \
+            -> Callable:
+        def handler(signum, frame):
+            self.dump(file=file or sys.stderr, clear=True)
+            if callable(prev_handler):
+                prev_handler(signum, frame)
+
+        return handler
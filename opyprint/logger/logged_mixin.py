@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from types import FunctionType
+from typing import ClassVar, Optional
 
 from .logger import Logger
+from .sampling import LogPolicy
+from .traced import TracedMethod
 from ..typing import StyleOptions
 
 
@@ -10,13 +14,39 @@ class LoggedMixin:
     """
     A mixin class that adds common log methods and accessors for the logger
     object to which those log methods delegate.
+
+    Provide ``trace_methods=True`` as class keyword argument to trace all
+    public methods defined in a subclass, as if decorated with
+    :func:`~opyprint.logger.traced.traced`::
+
+        class Solver(LoggedMixin, trace_methods=True):
+            ...
     """
     _logger: Logger
 
+    log_sampling: ClassVar[Optional[LogPolicy]] = None
+    """
+    Optional sampling or deduplication policy, shared by all instances of the
+    class, that is checked before delegating a log call to the logger, e.g.::
+
+        class Solver(LoggedMixin):
+            log_sampling = EveryNth(1000)
+    """
+
     def __init__(self, logger: Logger):
         self._logger = logger
         super().__init__()
 
+    def __init_subclass__(cls, trace_methods: bool = False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if trace_methods:
+            for name, value in list(vars(cls).items()):
+                if not name.startswith("_") and \
+                        isinstance(value, FunctionType):
+                    method = TracedMethod(value)
+                    method.__set_name__(cls, name)
+                    setattr(cls, name, method)
+
     # -- Logger Methods --------------- --- --  -
 
     @property
@@ -52,6 +82,9 @@ class LoggedMixin:
               margin: int = 0,
               style: StyleOptions = None):
         """See :meth:`logger.debug <.Logger.debug>`."""
+        if self.log_sampling is not None and \
+                not self._admit_log(msgs, Logger.DEBUG):
+            return
         self._logger.debug(*msgs,
                            bullet=bullet,
                            indent=indent,
@@ -67,6 +100,9 @@ class LoggedMixin:
               margin: int = 0,
               style: StyleOptions = None):
         """See :meth:`logger.trace <.Logger.trace>`."""
+        if self.log_sampling is not None and \
+                not self._admit_log(msgs, Logger.TRACE):
+            return
         self._logger.trace(*msgs,
                            bullet=bullet,
                            indent=indent,
@@ -82,6 +118,9 @@ class LoggedMixin:
              margin: int = 0,
              style: StyleOptions = None):
         """See :meth:`logger.info <.Logger.info>`."""
+        if self.log_sampling is not None and \
+                not self._admit_log(msgs, Logger.INFO):
+            return
         self._logger.info(*msgs,
                           bullet=bullet,
                           indent=indent,
@@ -133,3 +172,23 @@ class LoggedMixin:
                 yield
         finally:
             pass
+
+    # -- System Methods --------------- --- --  -
+
+    def _admit_log(self, msgs: tuple, level: int) -> bool:
+        """
+        Checks the :attr:`log_sampling` policy for a log call at the given
+        level, and emits the policy summary when the call is admitted.
+        """
+        logger = self._logger
+        if not 0 < logger.level <= level:
+            # The logger drops the record anyway, so do not affect the policy:
+            return True
+        policy = self.log_sampling
+        assert policy is not None
+        if not policy.admit(msgs):
+            return False
+        summary = policy.summary()
+        if summary:
+            logger.log(summary, level=level)
+        return True
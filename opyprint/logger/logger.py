@@ -2,17 +2,25 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import ClassVar, Optional
+from time import time
+from typing import (
+    TYPE_CHECKING, ClassVar, Dict, Iterable, List, Optional, TextIO, Tuple)
 
 try:
     from typing import Protocol, runtime_checkable
 except ImportError:
     from typing_extensions import Protocol, runtime_checkable  # type: ignore
 
+from ..json_lines import write_json_record
 from ..pp_context import PPContext
+from .sampling import Deduplicate, LogPolicy
+from .span import NullSpan, Span, SpanStats
 from ..pp_styles import PPStyles
 from ..typing import StyleOptions
 
+if TYPE_CHECKING:
+    from ..instrumentation import Instrumentation  # noqa: F401
+
 
 @runtime_checkable
 class Logger(Protocol):
@@ -71,6 +79,18 @@ class Logger(Protocol):
         """The current indentation string."""
         raise NotImplementedError()
 
+    @property
+    def json_lines(self) -> bool:
+        """
+        True when log records are rendered as JSON lines instead of
+        pretty-printed text.
+        """
+        raise NotImplementedError()
+
+    @json_lines.setter
+    def json_lines(self, json_lines: bool) -> None:
+        raise NotImplementedError()
+
     @property
     def level(self) -> int:
         """The current log level."""
@@ -80,6 +100,11 @@ class Logger(Protocol):
     def level(self, level: int) -> None:
         raise NotImplementedError()
 
+    @property
+    def name(self) -> Optional[str]:
+        """The optional name of the logger."""
+        raise NotImplementedError()
+
     @property
     def width(self) -> int:
         """The current width at which line breaking is preferred."""
@@ -99,6 +124,11 @@ class Logger(Protocol):
         """The pretty-print context object."""
         raise NotImplementedError()
 
+    @property
+    def span_stats(self) -> SpanStats:
+        """The aggregated timings of the spans, see :meth:`~span`."""
+        raise NotImplementedError()
+
     # -- Abstract Methods ---------------- --- --  -
 
     def handle_log(self,
@@ -167,6 +197,28 @@ class Logger(Protocol):
         """Increase the indentation for the subsequent log calls."""
         raise NotImplementedError()
 
+    def span(self, name: str, level: int = TRACE):
+        """
+        Returns a context manager, which can also be used as a decorator, that
+        logs the given name, indents the subsequent log calls and, on exit,
+        logs the elapsed wall and CPU time, when the given log level is
+        enabled. The timings are also aggregated per span path in
+        :attr:`~span_stats`.
+
+        Example::
+
+            with logger.span("solve"):
+                ...
+
+            @logger.span("step")
+            def step():
+                ...
+
+        :param name: The span name.
+        :param level: The log level.
+        """
+        raise NotImplementedError()
+
     def dedent(self):
         """Decrease the indentation for the subsequent log calls."""
         raise NotImplementedError()
@@ -269,6 +321,13 @@ class Logger(Protocol):
         """Resets the LOGGER, i.e. resets indentation to 0."""
         raise NotImplementedError()
 
+    def close(self) -> None:
+        """
+        Emits the pending summaries of the sampling and deduplication
+        policies, such as the number of suppressed repeats of the last record.
+        """
+        raise NotImplementedError()
+
     # noinspection PyShadowingBuiltins
     def log_connectum(self,
                       cnm,
@@ -320,36 +379,77 @@ class LoggerBase(Logger, ABC):
 
     Void: ClassVar[Logger]
 
+    instrumentation: ClassVar[Optional[Instrumentation]] = None
+    """
+    The instrumentation that collects metrics about the emitted and suppressed
+    records, or None. See :func:`~opyprint.instrumentation.\
+enable_instrumentation`.
+    """
+
     # -- Instance Initialization ---------------- --- --  -
 
     __slots__ = [
+        "_dedupe",
         "_indent",
+        "_json_lines",
         "_level",
         "_log_history",
         "_log_resolve_state",
+        "_name",
         "_parent",
+        "_policies",
         "_ppc",
+        "_sampling",
+        "_span_stack",
+        "_span_stats",
         "_width",
     ]
 
+    _dedupe: Optional[Deduplicate]
     _indent: int
+    _json_lines: bool
     _level: int
+    _name: Optional[str]
+    _policies: Tuple[LogPolicy, ...]
     _ppc: PPContext
+    _sampling: Optional[LogPolicy]
+    _span_stack: List[str]
+    _span_stats: SpanStats
     _width: int
 
     def __init__(self,
                  level: int = 2,
+                 dedupe: bool = False,
+                 json_lines: bool = False,
                  log_history: bool = False,
                  log_resolve_state: bool = True,
+                 max_depth: int = 0,
+                 name: str = None,
                  parent: Logger = None,
+                 sampling: LogPolicy = None,
                  truncate: int = 0,
                  width: int = 100):
         """
         :param level: log level
+        :param dedupe: When true, records with messages identical to those of
+            the previous record are suppressed and the number of suppressed
+            repeats is reported when a different record is emitted, or when
+            the logger is reset or closed.
+        :param json_lines: When true, log records are rendered as JSON lines,
+            each holding the level, timestamp, indentation depth, logger name
+            and the messages of a record, instead of as pretty-printed text.
         :param log_history: See 'log_connectum' method.
         :param log_resolve_state: See 'log_connectum' method.
+        :param max_depth: When not 0, the containers that are nested deeper
+            than this number of enclosing containers are rendered as a
+            summary, such as ``{…12 keys}`` or ``[…3000 items]``, without
+            iterating over them.
+        :param name: Optional logger name, included in JSON-lines records.
         :param parent: When given, the indentation of this parent logger is
             added to the indentation of this "dependent" logger.
+        :param sampling: Optional sampling policy, such as
+            :class:`~opyprint.logger.sampling.EveryNth`, that is checked before
+            any formatting happens.
         :param truncate: The truncation setting. When this value is 0, no
             truncation is applied. When any other positive integer value *n* is
             given, then no more than *n* list/tuple/set elements or dictionary
@@ -357,16 +457,38 @@ class LoggerBase(Logger, ABC):
             string will be included.
         :param width: max content width
         """
+        self._dedupe = Deduplicate() if dedupe else None
         self._indent = 0
+        self._json_lines = json_lines
         self._level = level
         self._log_history = log_history
         self._log_resolve_state = log_resolve_state
+        self._name = name
         self._parent = parent
-        self._ppc = PPContext(width=width, truncate=truncate)
+        self._ppc = PPContext(width=width,
+                              max_depth=max_depth,
+                              truncate=truncate)
+        self._sampling = sampling
+        self._span_stack = []
+        self._span_stats = SpanStats()
         self._width = width
+        self._update_policies()
 
     # -- Accessors ---------------- --- --  -
 
+    @property
+    def dedupe(self) -> bool:
+        """True when identical consecutive records are suppressed."""
+        return self._dedupe is not None
+
+    @dedupe.setter
+    def dedupe(self, dedupe: bool) -> None:
+        if dedupe and self._dedupe is None:
+            self._dedupe = Deduplicate()
+        elif not dedupe:
+            self._dedupe = None
+        self._update_policies()
+
     @property
     def enabled(self):
         return self._level > 0
@@ -401,6 +523,14 @@ class LoggerBase(Logger, ABC):
         else:
             return self.ppc.indentation
 
+    @property
+    def json_lines(self):
+        return self._json_lines
+
+    @json_lines.setter
+    def json_lines(self, json_lines):
+        self._json_lines = json_lines
+
     @property
     def level(self):
         return self._level
@@ -409,6 +539,10 @@ class LoggerBase(Logger, ABC):
     def level(self, level):
         self._level = level
 
+    @property
+    def name(self):
+        return self._name
+
     @property
     def width(self):
         return self._width
@@ -425,6 +559,31 @@ class LoggerBase(Logger, ABC):
     def ppc(self):
         return self._ppc
 
+    @property
+    def sampling(self) -> Optional[LogPolicy]:
+        """The optional sampling policy."""
+        return self._sampling
+
+    @sampling.setter
+    def sampling(self, sampling: Optional[LogPolicy]) -> None:
+        self._sampling = sampling
+        self._update_policies()
+
+    @property
+    def span_stats(self):
+        return self._span_stats
+
+    @property
+    def suppressed(self) -> Dict[str, int]:
+        """
+        The number of records suppressed by the sampling policy and by the
+        deduplication, for monitoring purposes.
+        """
+        return {
+            "dedupe": self._dedupe.suppressed if self._dedupe else 0,
+            "sampling": self._sampling.suppressed if self._sampling else 0,
+        }
+
     # -- Methods ---------------- --- --  -
 
     def enable(self, level=2):
@@ -487,6 +646,9 @@ class LoggerBase(Logger, ABC):
         self._indent = to or self._indent + 1
         self._ppc.indentation += self._ppc.default_indent
 
+    def span(self, name, level=TRACE):
+        return Span(self, name, level)
+
     def dedent(self):
         self._indent = max(self._indent - 1, 0)
         new_indent_len = max(0, (len(self._ppc.indentation) -
@@ -559,6 +721,10 @@ class LoggerBase(Logger, ABC):
             style=None,
             truncate=None):
         if 0 < self._level <= level:
+            if self._policies and not self._admit(msgs, level):
+                if self.instrumentation is not None:
+                    self.instrumentation.record_suppressed(level, "policy")
+                return
             self.handle_log(*msgs,
                             bullet=bullet,
                             indent=indent,
@@ -567,12 +733,22 @@ class LoggerBase(Logger, ABC):
                             margin=margin,
                             style=style,
                             truncate=truncate)
+        elif self.instrumentation is not None:
+            self.instrumentation.record_suppressed(level)
 
     def reset(self):
-        """Resets the LOGGER, i.e. resets indentation to 0."""
+        """
+        Resets the LOGGER, i.e. emits the pending policy summaries, see
+        :meth:`close`, and resets indentation to 0.
+        """
+        self.close()
         self._indent = 0
         self._ppc.indentation = ""
 
+    def close(self):
+        if self._policies and self._level > 0:
+            self._emit_summaries(max(self._level, Logger.TRACE))
+
     # noinspection PyShadowingBuiltins
     def log_connectum(self,
                       cnm,
@@ -589,10 +765,61 @@ class LoggerBase(Logger, ABC):
                       truncate=0) -> None:
         raise NotImplementedError()
 
+    # -- System Methods ---------------- --- --  -
+
+    def _admit(self, msgs: tuple, level: int) -> bool:
+        """
+        Checks the sampling and deduplication policies for a log record that
+        passed the level check, and emits the policy summaries, such as the
+        number of suppressed repeats, when the record is admitted.
+        """
+        for policy in self._policies:
+            if not policy.admit(msgs):
+                return False
+        self._emit_summaries(level)
+        return True
+
+    def _emit_summaries(self, level: int) -> None:
+        """Emits the pending policy summaries at the given level."""
+        for policy in self._policies:
+            summary = policy.summary()
+            if summary:
+                self.handle_log(summary, level=level)
+
+    def _update_policies(self) -> None:
+        self._policies = tuple(policy
+                               for policy in (self._sampling, self._dedupe)
+                               if policy is not None)
+
+    def _write_json_record(self,
+                           file: TextIO,
+                           msgs: Iterable,
+                           depth: int = None,
+                           level: int = TRACE,
+                           timestamp: float = None,
+                           truncate: int = None) -> None:
+        """Writes a log record as a JSON line to the given file."""
+        if truncate is None:
+            ppc = self._ppc
+        else:
+            ppc = PPContext(width=self._width,
+                            max_depth=self._ppc.max_depth,
+                            truncate=truncate)
+        write_json_record(file,
+                          msgs,
+                          depth=self.indent_depth if depth is None else depth,
+                          level=level,
+                          name=self._name,
+                          ppc=ppc,
+                          timestamp=time() if timestamp is None else timestamp)
+
 
 class VoidLogger(LoggerBase):
     """A logger that does nothing."""
 
+    def span(self, name, level=LoggerBase.TRACE):
+        return NullSpan()
+
     def debug(self,
               *msgs,
               bullet=None,
@@ -648,6 +875,9 @@ class VoidLogger(LoggerBase):
                    truncate=None):
         pass
 
+    def close(self):
+        pass
+
     # noinspection PyShadowingBuiltins
     def log_connectum(self,
                       cnm,
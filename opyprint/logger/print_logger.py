@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC
+from io import StringIO
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 from .logger import LoggerBase
 
+if TYPE_CHECKING:
+    from ..instrumentation import Instrumentation
+
 
 class PrintLogger(LoggerBase, ABC):
     """Logger that simply prints to stdout."""
@@ -17,6 +24,26 @@ class PrintLogger(LoggerBase, ABC):
                    margin=0,
                    style=None,
                    truncate=None):
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = perf_counter()
+
+        if self._json_lines:
+            if instrumentation is None:
+                self._write_json_record(sys.stdout,
+                                        msgs,
+                                        level=level,
+                                        truncate=truncate)
+                return
+            buffer = StringIO()
+            self._write_json_record(buffer,
+                                    msgs,
+                                    level=level,
+                                    truncate=truncate)
+            self._write_instrumented(instrumentation, buffer.getvalue(), level,
+                                     start)
+            return
+
         if margin:
             for i in range(margin):
                 self.ppc.newline()
@@ -35,4 +62,25 @@ class PrintLogger(LoggerBase, ABC):
             for i in range(margin):
                 self.ppc.newline()
 
-        self.ppc.print()
+        if instrumentation is None:
+            self.ppc.print()
+        else:
+            self._write_instrumented(instrumentation, self.ppc.flush() + "\n",
+                                     level, start)
+
+    def _write_instrumented(self,
+                            instrumentation: Instrumentation,
+                            text: str,
+                            level: int,
+                            start: float) -> None:
+        """
+        Writes the given formatted record to stdout and records the number of
+        bytes and the time spent on formatting, since the given start time,
+        and on writing.
+        """
+        formatted = perf_counter()
+        sys.stdout.write(text)
+        instrumentation.record_emitted(level,
+                                       len(text.encode("utf-8")),
+                                       formatted - start,
+                                       perf_counter() - formatted)
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import sys
+from abc import ABC, abstractmethod
+from itertools import islice
+from random import Random
+from time import monotonic
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+_FINGERPRINT_TYPES = (bytearray, dict, list, set, tuple)
+
+_FINGERPRINT_BYTES = 256
+"""The maximal number of leading bytes of a bytearray in a fingerprint."""
+
+_FINGERPRINT_ITEMS = 64
+"""The maximal number of container items that a fingerprint covers."""
+
+
+def call_site() -> Tuple[Hashable, int]:
+    """
+    Gets a key that identifies the call site of the current log call, i.e.
+    the code object and line number of the innermost frame outside of the
+    'opyprint.logger' package.
+    """
+    frame = sys._getframe(1)
+    while frame.f_back is not None and \
+            frame.f_globals.get("__name__", "").startswith(_PACKAGE):
+        frame = frame.f_back
+    return frame.f_code, frame.f_lineno
+
+
+class LogPolicy(ABC):
+    """
+    Base class for policies that decide whether a log record is emitted.
+
+    Policies are checked after the log level, but before any formatting
+    happens. Each policy counts the records it suppresses.
+    """
+
+    __slots__ = ["suppressed"]
+
+    suppressed: int
+    """The number of records suppressed by this policy."""
+
+    def __init__(self):
+        self.suppressed = 0
+
+    @abstractmethod
+    def admit(self, msgs: tuple) -> bool:
+        """
+        Returns true when the log record with the given messages should be
+        emitted. Implementations increment the :attr:`suppressed` counter when
+        they return false.
+        """
+        raise NotImplementedError()
+
+    def summary(self) -> Optional[str]:
+        """
+        Returns an optional message to be emitted before the record that was
+        just admitted, such as the number of suppressed repeats.
+        """
+        return None
+
+    def reset(self) -> None:
+        """Resets the state and counters of this policy."""
+        self.suppressed = 0
+
+
+class EveryNth(LogPolicy):
+    """Emits the first and then every *n*-th record of each call site."""
+
+    __slots__ = ["_counts", "_n"]
+
+    _counts: Dict[Hashable, int]
+    _n: int
+
+    def __init__(self, n: int):
+        """
+        :param n: The sampling interval.
+        """
+        if not isinstance(n, int) or n < 1:
+            msg = "Expected a positive int as 'n', got '{}'."
+            raise ValueError(msg.format(n))
+        super().__init__()
+        self._counts = {}
+        self._n = n
+
+    def admit(self, msgs):
+        site = call_site()
+        count = self._counts.get(site, 0)
+        self._counts[site] = count + 1
+        if count % self._n == 0:
+            return True
+        self.suppressed += 1
+        return False
+
+    def reset(self):
+        super().reset()
+        self._counts = {}
+
+
+class Probabilistic(LogPolicy):
+    """Emits each record with the given probability."""
+
+    __slots__ = ["_probability", "_random"]
+
+    _probability: float
+    _random: Callable[[], float]
+
+    def __init__(self, probability: float, seed: int = None):
+        """
+        :param probability: The probability with which a record is emitted.
+        :param seed: Optional seed, for reproducible sampling.
+        """
+        if not 0.0 <= probability <= 1.0:
+            msg = "Expected a value in [0, 1] as 'probability', got '{}'."
+            raise ValueError(msg.format(probability))
+        super().__init__()
+        self._probability = probability
+        self._random = Random(seed).random
+
+    def admit(self, msgs):
+        if self._random() < self._probability:
+            return True
+        self.suppressed += 1
+        return False
+
+
+class TokenBucket(LogPolicy):
+    """
+    Emits no more than *rate* records per second for each call site, while
+    allowing bursts of up to *burst* records.
+    """
+
+    __slots__ = ["_buckets", "_burst", "_clock", "_rate"]
+
+    _buckets: Dict[Hashable, List[float]]
+    _burst: float
+    _clock: Callable[[], float]
+    _rate: float
+
+    def __init__(self,
+                 rate: float,
+                 burst: float = None,
+                 clock: Callable[[], float] = monotonic):
+        """
+        :param rate: The number of records per second.
+        :param burst: The maximal number of records that can be emitted in
+            a burst. Defaults to the rate, with a minimum of 1.
+        :param clock: The clock function, which returns seconds.
+        """
+        if rate <= 0:
+            msg = "Expected a positive number as 'rate', got '{}'."
+            raise ValueError(msg.format(rate))
+        super().__init__()
+        self._buckets = {}
+        self._burst = max(rate, 1.0) if burst is None else burst
+        self._clock = clock
+        self._rate = rate
+
+    def admit(self, msgs):
+        site = call_site()
+        now = self._clock()
+        bucket = self._buckets.get(site)
+        if bucket is None:
+            bucket = self._buckets[site] = [self._burst, now]
+        tokens = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return True
+        bucket[0] = tokens
+        self.suppressed += 1
+        return False
+
+    def reset(self):
+        super().reset()
+        self._buckets = {}
+
+
+class Deduplicate(LogPolicy):
+    """
+    Suppresses records whose messages are identical to those of the previous
+    record, and reports the number of suppressed repeats when a different
+    record is emitted, or when the logger is reset, closed or dumped.
+
+    The messages are compared against a fingerprint taken when the previous
+    record was logged, such that logging a container again after changing it
+    is not mistaken for a repeat. The fingerprint copies the lengths and
+    (nested) items of lists, tuples, dicts, sets and bytearrays, up to a fixed
+    total number of items, and refers to the containers that are not covered
+    in full, or that contain themselves, by identity. Changes beyond the
+    covered items of the same container thus go unnoticed, which bounds the
+    cost per log call. Other mutable objects are compared as they are.
+    """
+
+    __slots__ = ["_last", "_repeats"]
+
+    _last: Optional[tuple]
+    _repeats: int
+
+    def __init__(self):
+        super().__init__()
+        self._last = None
+        self._repeats = 0
+
+    def admit(self, msgs):
+        # noinspection PyBroadException
+        try:
+            fingerprint = _fingerprint(msgs, [_FINGERPRINT_ITEMS], set())
+        except Exception:
+            # Never let a misbehaving object fail the log call, but consider
+            # the record as not being a repeat:
+            self._last = None
+            return True
+        last = self._last
+        if last is not None and _equals(last, fingerprint):
+            self._repeats += 1
+            self.suppressed += 1
+            return False
+        self._last = fingerprint
+        return True
+
+    def summary(self):
+        repeats = self._repeats
+        if repeats:
+            self._repeats = 0
+            plural = "s" if repeats > 1 else ""
+            return f"[previous message repeated {repeats} time{plural}]"
+        return None
+
+    def reset(self):
+        super().reset()
+        self._last = None
+        self._repeats = 0
+
+
+def _equals(msgs_1: tuple, msgs_2: tuple) -> bool:
+    # noinspection PyBroadException
+    try:
+        return bool(msgs_1 == msgs_2)
+    except Exception:
+        return False
+
+
+class _Ref:
+    """Refers to an object, and equals another reference to the same object."""
+
+    __slots__ = ["obj"]
+
+    obj: object
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Ref) and self.obj is other.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
+def _fingerprint(obj, budget: List[int], visited: Set[int]):
+    """
+    Takes a fingerprint of the given object, i.e. a copy of the object in
+    which the builtin containers are copied as their type, length and items,
+    as long as the item budget lasts, and as a reference otherwise. The
+    containers that were already visited are also fingerprinted as a
+    reference.
+    """
+    obj_type = type(obj)
+    if obj_type not in _FINGERPRINT_TYPES:
+        return obj
+    size = len(obj)
+    if id(obj) in visited or budget[0] <= 0:
+        return obj_type, size, _Ref(obj)
+    visited.add(id(obj))
+
+    if obj_type is bytearray:
+        head = bytes(obj[:_FINGERPRINT_BYTES])
+        if size <= _FINGERPRINT_BYTES:
+            return obj_type, size, head
+        return obj_type, size, head, _Ref(obj)
+    if obj_type is set:
+        if size > budget[0]:
+            return obj_type, size, _Ref(obj)
+        budget[0] -= size
+        # The items of sets are hashable, and thus presumably immutable:
+        return obj_type, size, frozenset(obj)
+
+    count = min(size, budget[0])
+    budget[0] -= count
+    if obj_type is dict:
+        items = tuple((key, _fingerprint(value, budget, visited))
+                      for key, value in islice(obj.items(), count))
+    else:
+        items = tuple(_fingerprint(item, budget, visited)
+                      for item in islice(obj, count))
+    if count < size:
+        return obj_type, size, items, _Ref(obj)
+    return obj_type, size, items
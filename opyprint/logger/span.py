@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from functools import wraps
+from math import ceil
+from random import Random
+from time import perf_counter, process_time
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..pp_context import PPContext
+
+if TYPE_CHECKING:
+    from .logger import LoggerBase  # noqa: F401
+
+
+def format_duration(seconds: float) -> str:
+    """Formats the given duration with an appropriate unit."""
+    if seconds >= 1.0:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+class SpanEntry:
+    """The aggregated timings of the spans with a given path."""
+
+    max_samples: int = 1000
+    """
+    The maximal number of durations that are kept, using reservoir sampling,
+    to estimate the percentiles.
+    """
+
+    __slots__ = [
+        "count",
+        "cpu_total",
+        "max",
+        "samples",
+        "total",
+    ]
+
+    count: int
+    cpu_total: float
+    max: float
+    samples: List[float]
+    total: float
+
+    def __init__(self):
+        self.count = 0
+        self.cpu_total = 0.0
+        self.max = 0.0
+        self.samples = []
+        self.total = 0.0
+
+    def add(self, wall: float, cpu: float, random: Random) -> None:
+        """Adds the wall and CPU time of a span."""
+        self.count += 1
+        self.cpu_total += cpu
+        self.total += wall
+        if wall > self.max:
+            self.max = wall
+        if len(self.samples) < self.max_samples:
+            self.samples.append(wall)
+        else:
+            index = random.randrange(self.count)
+            if index < self.max_samples:
+                self.samples[index] = wall
+
+    def percentile(self, percent: float) -> float:
+        """Estimates the given percentile of the wall times."""
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        index = max(0, ceil(percent / 100 * len(samples)) - 1)
+        return samples[index]
+
+    def __str__(self) -> str:
+        return (f"{self.count} calls"
+                f", total {format_duration(self.total)}"
+                f", cpu {format_duration(self.cpu_total)}"
+                f", p50 {format_duration(self.percentile(50))}"
+                f", p95 {format_duration(self.percentile(95))}"
+                f", max {format_duration(self.max)}")
+
+
+class SpanStats:
+    """
+    Aggregates the timings of the spans of a logger, per span path. A span
+    path consists of the names of the enclosing spans and the name of the span
+    itself, separated by slashes.
+    """
+
+    __slots__ = ["_children", "_entries", "_random"]
+
+    _children: Dict[str, List[Tuple[str, str]]]
+    """Maps the path of each span on the (name, path) pairs of its children."""
+
+    _entries: Dict[str, SpanEntry]
+    _random: Random
+
+    def __init__(self):
+        self._children = {}
+        self._entries = {}
+        self._random = Random(0)
+
+    def __getitem__(self, path: str) -> SpanEntry:
+        return self._entries[path]
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self,
+            path: str,
+            wall: float,
+            cpu: float,
+            parent: Optional[str] = None) -> None:
+        """
+        Adds the wall and CPU time of a span with the given path.
+
+        :param path: The path of the span.
+        :param wall: The wall time in seconds.
+        :param cpu: The CPU time in seconds.
+        :param parent: The path of the enclosing span, or an empty string for
+            a top-level span. When not given, the parent is the path up to the
+            last slash, which is wrong when the span names contain slashes.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._entries[path] = SpanEntry()
+            if parent is None:
+                parent = path.rpartition("/")[0]
+            name = path[len(parent) + 1:] if parent else path
+            self._children.setdefault(parent, []).append((name, path))
+        entry.add(wall, cpu, self._random)
+
+    def clear(self) -> None:
+        """Discards the aggregated timings."""
+        self._children = {}
+        self._entries = {}
+
+    def items(self) -> Iterator[Tuple[str, SpanEntry]]:
+        """Iterates over the (path, entry) pairs, sorted by path."""
+        return iter(sorted(self._entries.items()))
+
+    def __str__(self, ppc: PPContext = None) -> str:
+        ppc = ppc or PPContext()
+        if not self._entries:
+            ppc("No spans recorded.")
+            return ppc.flush()
+        ppc("Span timings:")
+        with ppc.bullets():
+            self._format_children("", ppc)
+        return ppc.flush()
+
+    def _format_children(self, parent: str, ppc: PPContext) -> None:
+        for name, path in sorted(self._children.get(parent, ())):
+            ppc(name, str(self._entries[path]))
+            with ppc.bullets():
+                self._format_children(path, ppc)
+
+
+class Span:
+    """
+    A context manager and decorator that logs an indented section and
+    measures its wall and CPU time. See :meth:`LoggerBase.span
+    <opyprint.logger.logger.LoggerBase.span>`.
+    """
+
+    __slots__ = [
+        "_cpu_start",
+        "_level",
+        "_logger",
+        "_name",
+        "_path",
+        "_wall_start",
+    ]
+
+    _cpu_start: float
+    _level: int
+    _logger: LoggerBase
+    _name: str
+    _path: str
+    _wall_start: float
+
+    def __init__(self, logger: LoggerBase, name: str, level: int):
+        self._level = level
+        self._logger = logger
+        self._name = name
+        self._path = ""
+
+    def __enter__(self) -> Span:
+        logger = self._logger
+        if not 0 < logger._level <= self._level:
+            return self
+        stack = logger._span_stack
+        self._path = f"{stack[-1]}/{self._name}" if stack else self._name
+        stack.append(self._path)
+        logger.log(self._name, level=self._level)
+        logger.indent_once()
+        self._cpu_start = process_time()
+        self._wall_start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if not self._path:
+            return
+        wall = perf_counter() - self._wall_start
+        cpu = process_time() - self._cpu_start
+        logger = self._logger
+        logger.dedent()
+        stack = logger._span_stack
+        stack.pop()
+        logger._span_stats.add(self._path, wall, cpu,
+                               parent=stack[-1] if stack else "")
+        logger.log(f"{self._name}: {format_duration(wall)}"
+                   f" (cpu {format_duration(cpu)})",
+                   level=self._level)
+        self._path = ""
+
+    def __call__(self, func: Callable) -> Callable:
+        logger = self._logger
+        level = self._level
+        name = self._name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not 0 < logger._level <= level:
+                return func(*args, **kwargs)
+            with Span(logger, name, level):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+class NullSpan:
+    """A span that does nothing, as used by void loggers."""
+
+    __slots__: List[str] = []
+
+    def __enter__(self) -> NullSpan:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+    def __call__(self, func: Callable) -> Callable:
+        return func
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from functools import update_wrapper
+from time import perf_counter
+from types import MethodType
+from typing import Any, Callable, List, Tuple
+
+from .span import format_duration
+from ..pp_context import PPContext
+
+
+class TracedMethod:
+    """
+    A method descriptor that logs the entry, with the arguments, and the exit,
+    with the return value and the elapsed time, of the wrapped method at the
+    'trace' log level. See :func:`traced`.
+
+    The descriptor resolves to the plain bound method when the 'trace' log
+    level is not enabled for the logger of the instance, so the wrapped method
+    is then called without any tracing overhead.
+    """
+
+    __slots__ = [
+        "__dict__",
+        "_func",
+        "_param_names",
+        "_qualname",
+        "_truncate",
+    ]
+
+    _func: Callable
+    _param_names: Tuple[str, ...]
+    _qualname: str
+    _truncate: int
+
+    def __init__(self, func: Callable, truncate: int = 4):
+        code = func.__code__
+        self._func = func
+        self._param_names = code.co_varnames[1:code.co_argcount]
+        self._qualname = func.__qualname__
+        self._truncate = truncate
+        update_wrapper(self, func)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if not instance._logger.trace_enabled:
+            return self._func.__get__(instance, owner)
+        return MethodType(self._call, instance)
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._qualname = f"{owner.__name__}.{name}"
+
+    def _call(self, instance, *args, **kwargs):
+        logger = instance._logger
+        qualname = self._qualname
+        truncate = self._truncate
+
+        # The arguments are passed by reference to the logger, which only
+        # formats them when the record is actually emitted:
+        arguments = list(zip(self._param_names, args))
+        if len(args) > len(self._param_names):
+            arguments.append(("*args", args[len(self._param_names):]))
+        arguments.extend(kwargs.items())
+        if arguments:
+            logger.trace(f"call {qualname}", _Arguments(arguments),
+                         truncate=truncate)
+        else:
+            logger.trace(f"call {qualname}()")
+
+        start = perf_counter()
+        try:
+            with logger.trace_indent():
+                result = self._func(instance, *args, **kwargs)
+        except BaseException as error:
+            elapsed = format_duration(perf_counter() - start)
+            logger.trace(f"raise {qualname} ({elapsed})", repr(error))
+            raise
+        elapsed = format_duration(perf_counter() - start)
+        logger.trace(f"return {qualname} ({elapsed})", result,
+                     truncate=truncate)
+        return result
+
+
+class _Arguments:
+    """
+    The arguments of a traced call, pretty-printed as name-value pairs in
+    parameter order, unlike a dict, of which the keys are sorted.
+    """
+
+    __slots__ = ["_items"]
+
+    _items: List[Tuple[str, Any]]
+
+    def __init__(self, items: List[Tuple[str, Any]]):
+        self._items = items
+
+    def __str__(self, ppc: PPContext = None) -> str:
+        ppc = ppc or PPContext()
+        if len(self._items) == 1:
+            ppc(*self._items[0])
+        else:
+            for name, value in self._items:
+                ppc(name, value, bullet="-")
+        return ppc.flush()
+
+
+def traced(method: Callable = None, *, truncate: int = 4):
+    """
+    Decorates a method of a :class:`~opyprint.logger.LoggedMixin` subclass
+    such that its entry, with the arguments, and its exit, with the return
+    value and the elapsed time, are logged at the 'trace' log level, with
+    the log calls made by the method nested in an indented section.
+
+    When the 'trace' log level is not enabled for the logger of an instance,
+    the method resolves to the plain bound method.
+
+    Example::
+
+        class Solver(LoggedMixin):
+            @traced
+            def solve(self, problem):
+                ...
+
+            @traced(truncate=2)
+            def step(self, state):
+                ...
+
+    :param method: The method to decorate.
+    :param truncate: The truncation applied when formatting the arguments and
+        the return value.
+    """
+    if method is None:
+        return lambda func: TracedMethod(func, truncate=truncate)
+    return TracedMethod(method, truncate=truncate)
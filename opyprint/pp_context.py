@@ -1,23 +1,56 @@
 import textwrap
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 from inspect import isgenerator, signature
+from itertools import chain, count, islice
+from random import Random
 from re import compile
-from typing import ClassVar, Generator, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING, ClassVar, Generator, List, Optional, Tuple, Union)
 
 from colorama import init as init_colorama
 
 from .apply_style import apply_style
-from .typing import StyleOptions
+from .ref_tracker import RefTracker
+from .typing import StyleOptions, Truncation
 from .utils import (
+    SCALAR_TYPES,
+    RecordAccessor,
+    bound_text,
+    bounded_str,
+    compress_ints,
+    format_binary,
+    format_ndarray,
+    is_binary,
     is_bullettable,
     is_dict,
+    is_huge_text,
+    is_int_collection,
     is_multiliner,
+    is_namedtuple,
+    is_ndarray,
     is_oneliner,
+    is_scalar,
     is_set,
+    is_record,
     is_tuple,
+    pp_sorted,
+    record_accessor,
+    record_fields,
+    record_items,
+    record_labels,
+    record_values,
+    reservoir_sample,
+    same_schema,
+    shorten,
+    wrap,
 )
 
+if TYPE_CHECKING:
+    from .instrumentation import Instrumentation  # noqa: F401
+    from .profiler import Profiler  # noqa: F401
+
 # Support ANSI-based formatting on Windows:
 init_colorama()
 
@@ -69,7 +102,8 @@ class PPContext:
     The default truncation setting. When this value is 0, no truncation is
     applied. When any other positive integer value *n* is given, then no more
     than *n* list/tuple/set elements or dictionary items will be included and
-    no more than *n* lines of a wrapped string will be included.
+    no more than *n* lines of a wrapped string will be included. A tuple
+    *(head, tail)* can also be given, see :class:`PPContext`.
     """
 
     default_bullet: ClassVar[str] = "- "
@@ -84,16 +118,34 @@ class PPContext:
     print them as a name-value pair.
     """
 
+    instrumentation: ClassVar[Optional["Instrumentation"]] = None
+    """
+    The instrumentation that collects the number of formatted objects and the
+    time spent formatting them, per type, or None. See
+    :func:`~opyprint.instrumentation.enable_instrumentation`.
+    """
+
     # -- Instance Initialization --------------- --- --  -
 
     __slots__ = [
         "_bullet",
         "_content_width",
         "_default_bullet",
+        "_fold_runs",
         "_indent",
+        "_int_runs",
         "_lines",
+        "_max_depth",
         "_prefix_0",
         "_prefix_n",
+        "_profiler",
+        "_random",
+        "_refs",
+        "_sample",
+        "_shared_refs",
+        "_spare",
+        "_tables",
+        "_tail",
         "_truncate",
         "_width",
     ]
@@ -101,19 +153,37 @@ class PPContext:
     _bullet: Optional[str]
     _content_width: int
     _default_bullet: str
+    _fold_runs: bool
     _indent: str
+    _int_runs: bool
     _lines: list
+    _max_depth: int
     _prefix_0: str
     _prefix_n: str
+    _profiler: Optional["Profiler"]
+    _random: Random
+    _refs: Optional[RefTracker]
+    _sample: bool
+    _shared_refs: bool
+    _spare: Optional["PPContext"]
+    _tables: Optional[bool]
+    _tail: int
     _truncate: int
     _width: int
 
     def __init__(self,
                  width: int = default_width,
-                 truncate: int = default_truncate,
+                 truncate: Truncation = default_truncate,
                  bullet: str = "",
                  indent: str = "",
-                 default_bullet: str = default_bullet):
+                 default_bullet: str = default_bullet,
+                 fold_runs: bool = False,
+                 int_runs: bool = False,
+                 max_depth: int = 0,
+                 sample: bool = False,
+                 seed: Optional[int] = None,
+                 shared_refs: bool = False,
+                 tables: Optional[bool] = None):
         """
         :param width: Total width in characters, including bullets and
             indentation. Defaults to the value of the :attr:`~default_width`
@@ -122,18 +192,50 @@ class PPContext:
             truncation is applied. When any other positive integer value *n* is
             given, then no more than *n* list/tuple/set elements or dictionary
             items will be included and no more than *n* lines of a wrapped
-            string will be included. Defaults to the value of the
-            :attr:`~default_truncate` class attribute.
+            string will be included. When a tuple *(head, tail)* is given,
+            then the first *head* and the last *tail* list/tuple/set elements
+            or dictionary items will be included, with the number of elided
+            items in between, and their sum is used as the other limits.
+            Defaults to the value of the :attr:`~default_truncate` class
+            attribute.
         :param bullet: Optional bullet prefix string.
         :param indent: The indentation prefix string.
+        :param default_bullet: The default bullet prefix string.
+        :param fold_runs: When true, runs of consecutive equal list or tuple
+            items of the same type are formatted once, followed by their
+            count, such as ``[0 ×5000, 1]``, before truncation is applied.
+        :param int_runs: When true, the runs of consecutive integers in integer
+            lists, tuples, sets and ranges are compressed, such as
+            ``[1..500, 502, 510..900]``, before truncation is applied.
+        :param max_depth: When not 0, the containers that are nested deeper
+            than this number of enclosing containers (and objects with a
+            ``__str__(ppc)`` or ``describe`` method) are rendered as a
+            summary, such as ``{…12 keys}`` or ``[…3000 items]``, without
+            iterating over them.
+        :param sample: When true, sets and dictionaries with more elements or
+            items than the truncation setting show a uniform random sample of
+            as many elements or items, followed by the number of the other
+            ones, such as ``...and 986 more``, instead of the first ones in
+            sort order. The sample is drawn in one pass, without sorting.
+        :param seed: The seed of the random number generator used for
+            sampling, for reproducible output.
+        :param shared_refs: When true, an object that occurs more than once in
+            the formatted data is rendered in full only once, labeled with a
+            number such as ``#3``, and as a reference such as ``<see #3>``
+            elsewhere. Cycles are always rendered as back-references.
+        :param tables: Whether lists, tuples and sets of records, i.e. dicts
+            with the same keys, dataclass instances or named tuples of the
+            same type, whose values are all one-line strings, numbers,
+            booleans or None, are formatted as a table with a column per
+            field. By default, this table layout is used for two or more
+            records when it fits the width. When true, it is used regardless
+            of the width. When false, it is not used.
         """
         if not isinstance(width, int):
             msg = "Expected an int as 'width', got '{}'."
             raise TypeError(msg.format(width))
 
-        if not isinstance(truncate, int):
-            msg = "Expected an int as 'truncate', got '{}'."
-            raise TypeError(msg.format(truncate))
+        truncate, tail = self._split_truncation(truncate)
 
         if not isinstance(bullet, str):
             msg = "Expected a string as 'bullet', got '{}'."
@@ -143,10 +245,49 @@ class PPContext:
             msg = "Expected a string as 'indent', got '{}'."
             raise TypeError(msg.format(indent))
 
+        if not isinstance(fold_runs, bool):
+            msg = "Expected a bool as 'fold_runs', got '{}'."
+            raise TypeError(msg.format(fold_runs))
+
+        if not isinstance(int_runs, bool):
+            msg = "Expected a bool as 'int_runs', got '{}'."
+            raise TypeError(msg.format(int_runs))
+
+        if not isinstance(max_depth, int):
+            msg = "Expected an int as 'max_depth', got '{}'."
+            raise TypeError(msg.format(max_depth))
+
+        if not isinstance(sample, bool):
+            msg = "Expected a bool as 'sample', got '{}'."
+            raise TypeError(msg.format(sample))
+
+        if seed is not None and not isinstance(seed, int):
+            msg = "Expected an int or None as 'seed', got '{}'."
+            raise TypeError(msg.format(seed))
+
+        if not isinstance(shared_refs, bool):
+            msg = "Expected a bool as 'shared_refs', got '{}'."
+            raise TypeError(msg.format(shared_refs))
+
+        if tables is not None and not isinstance(tables, bool):
+            msg = "Expected a bool or None as 'tables', got '{}'."
+            raise TypeError(msg.format(tables))
+
         self._bullet = None
         self._bullet = self._normalize_bullet(bullet) if bullet else ""
+        self._fold_runs = fold_runs
         self._indent = indent
+        self._int_runs = int_runs
         self._lines = list()
+        self._max_depth = max_depth
+        self._profiler = None
+        self._random = Random(seed)
+        self._refs = None
+        self._sample = sample
+        self._shared_refs = shared_refs
+        self._spare = None
+        self._tables = tables
+        self._tail = tail
         self._truncate = truncate
         self._width = width
 
@@ -158,6 +299,14 @@ class PPContext:
 
     # -- Accessors --------------- --- --  -
 
+    @property
+    def content_width(self) -> int:
+        """
+        The width available for content, i.e. the total width minus the
+        current indentation and bullet.
+        """
+        return self._content_width
+
     @property
     def indentation(self) -> str:
         """The current indentation string."""
@@ -170,14 +319,69 @@ class PPContext:
         self._update()
 
     @property
-    def truncation(self) -> int:
-        """The current indentation string."""
+    def fold_runs(self) -> bool:
+        """True when runs of equal items are folded."""
+        return self._fold_runs
+
+    @fold_runs.setter
+    def fold_runs(self, fold_runs: bool) -> None:
+        """Set whether runs of equal items are folded."""
+        self._fold_runs = fold_runs
+
+    @property
+    def int_runs(self) -> bool:
+        """True when the runs of consecutive integers are compressed."""
+        return self._int_runs
+
+    @int_runs.setter
+    def int_runs(self, int_runs: bool) -> None:
+        """Set whether the runs of consecutive integers are compressed."""
+        self._int_runs = int_runs
+
+    @property
+    def max_depth(self) -> int:
+        """The current maximal depth, or 0 when unlimited."""
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, max_depth: int) -> None:
+        """Set the current maximal depth."""
+        self._max_depth = max_depth
+
+    @property
+    def sample(self) -> bool:
+        """True when large sets and dictionaries are sampled."""
+        return self._sample
+
+    @sample.setter
+    def sample(self, sample: bool) -> None:
+        """Set whether large sets and dictionaries are sampled."""
+        self._sample = sample
+
+    @property
+    def tables(self) -> Optional[bool]:
+        """
+        Whether record lists are formatted as tables, or None when they are
+        when the table fits the width.
+        """
+        return self._tables
+
+    @tables.setter
+    def tables(self, tables: Optional[bool]) -> None:
+        """Set whether record lists are formatted as tables."""
+        self._tables = tables
+
+    @property
+    def truncation(self) -> Truncation:
+        """The current truncation setting."""
+        if self._tail:
+            return self._truncate - self._tail, self._tail
         return self._truncate
 
     @truncation.setter
-    def truncation(self, truncate: int) -> None:
+    def truncation(self, truncate: Truncation) -> None:
         """Set the current truncation level."""
-        self._truncate = truncate
+        self._truncate, self._tail = self._split_truncation(truncate)
 
     # -- Format Method and Helpers --------------- --- --  -
 
@@ -204,43 +408,156 @@ class PPContext:
         if len(args) == 0:
             return ""
 
+        if self._refs is not None:
+            # Part of an ongoing format call, such as by a '__str__' method:
+            return self._run(self._format(args, bullet, style, key_style))
+
+        self._refs = refs = RefTracker(shared_refs=self._shared_refs)
+        try:
+            result = self._run(self._format(args, bullet, style, key_style))
+            while refs.restart():
+                result = self._run(self._format(args, bullet, style,
+                                                key_style))
+            return result
+        finally:
+            self._refs = None
+
+    # The formatting methods below are generators that yield a request of the
+    # form '(ppc, args, bullet, style, key_style, probe, slot)' whenever a
+    # nested value needs to be formatted, instead of calling 'format'
+    # recursively. The slot is the position of the value in the enclosing
+    # container, which identifies its occurrence for the reference tracking.
+    # The '_run' method handles these requests with an explicit stack, so
+    # arbitrarily deep data can be formatted without growing the call stack.
+    #
+    # A request with a 'probe' budget is made when the result is only used
+    # if it is a oneliner that is not longer than the budget, such as when
+    # trying to format a list as a bracketed oneliner. The formatter may then
+    # return None instead of a result that has two or more non-empty lines or
+    # whose first line is longer than the budget. This bounds the work spent
+    # on results that end up being discarded.
+
+    @staticmethod
+    def _run(gen: Generator) -> str:
+        """
+        Runs the given formatting generator and, using an explicit stack, the
+        generators for the formatting requests it yields.
+        """
+        stack: List[Generator] = []
+        value = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                if error is None:
+                    request = gen.send(value)
+                else:
+                    exc, error = error, None
+                    request = gen.throw(exc)
+            except StopIteration as stop:
+                if not stack:
+                    return stop.value
+                gen = stack.pop()
+                value = stop.value
+                continue
+            except BaseException as exc:
+                if not stack:
+                    raise
+                gen = stack.pop()
+                error = exc
+                continue
+            stack.append(gen)
+            ppc, args, bullet, style, key_style, probe, slot = request
+            gen = ppc._format(args, bullet, style, key_style, probe, slot)
+            value = None
+
+    def _format(self, args: tuple,
+                bullet: Union[str, bool] = None,
+                style: StyleOptions = None,
+                key_style: StyleOptions = None,
+                probe: int = None,
+                slot: Optional[int] = 0) -> Generator:
+        if probe is not None and probe < 0:
+            return None
+
         if len(args) == 1:
             obj = args[0]
-        elif len(args) == 2 and self.print_name_value_pairs:
-            obj = {args[0]: args[1]}
         else:
-            obj = args
+            # Don't track the temporary container:
+            slot = None
+            if len(args) == 2 and self.print_name_value_pairs:
+                obj = {args[0]: args[1]}
+            else:
+                obj = args
 
         if bullet:
             bullet = self._normalize_bullet(bullet)
             if is_bullettable(obj):
-                return self._format_aux(obj,
-                                        bullet=bullet,
-                                        style=style,
-                                        key_style=key_style)
+                return (yield from self._format_aux(obj,
+                                                    bullet=bullet,
+                                                    style=style,
+                                                    key_style=key_style,
+                                                    probe=probe,
+                                                    slot=slot))
             elif self._bullet != bullet:
                 ori_bullet = self._bullet
                 self._bullet = bullet
                 self._update()
-                result = self._format_aux(obj,
-                                          style=style,
-                                          key_style=key_style)
+                result = yield from self._format_aux(obj,
+                                                     style=style,
+                                                     key_style=key_style,
+                                                     probe=probe,
+                                                     slot=slot)
                 self._bullet = ori_bullet
                 self._update()
                 return result
             else:
-                return self._format_aux(obj, style=style, key_style=key_style)
+                return (yield from self._format_aux(obj,
+                                                    style=style,
+                                                    key_style=key_style,
+                                                    probe=probe,
+                                                    slot=slot))
         else:
-            return self._format_aux(obj, style=style, key_style=key_style)
+            return (yield from self._format_aux(obj,
+                                                style=style,
+                                                key_style=key_style,
+                                                probe=probe,
+                                                slot=slot))
 
     def _format_aux(self, obj,
                     bullet: str = None,
                     style: StyleOptions = None,
-                    key_style: StyleOptions = None) -> str:
-        result = self._format_dispatch(obj,
-                                       bullet=bullet,
-                                       style=style,
-                                       key_style=key_style)
+                    key_style: StyleOptions = None,
+                    probe: int = None,
+                    slot: Optional[int] = None) -> Generator:
+        if probe is not None and self._bullet:
+            probe -= len(self._prefix_0)
+
+        if self._profiler is not None:
+            result = yield from self._profiler.format_dispatch(
+                self, obj,
+                bullet=bullet,
+                style=style,
+                key_style=key_style,
+                probe=probe,
+                slot=slot)
+        elif self.instrumentation is None:
+            result = yield from self._format_dispatch(obj,
+                                                      bullet=bullet,
+                                                      style=style,
+                                                      key_style=key_style,
+                                                      probe=probe,
+                                                      slot=slot)
+        else:
+            result = yield from self.instrumentation.timed_dispatch(
+                self, obj,
+                bullet=bullet,
+                style=style,
+                key_style=key_style,
+                probe=probe,
+                slot=slot)
+
+        if result is None and probe is not None:
+            return None
 
         if not isinstance(result, str) and not isinstance(result, list):
             msg = ("Got an unexpected result of type '{}' from the formatter:"
@@ -265,8 +582,19 @@ class PPContext:
     def _format_dispatch(self, obj,
                          bullet: str = None,
                          style: StyleOptions = None,
-                         key_style: StyleOptions = None) \
-            -> Union[str, List[str]]:
+                         key_style: StyleOptions = None,
+                         probe: int = None,
+                         slot: Optional[int] = None) -> Generator:
+        if isinstance(obj, type):
+            return str(obj)
+        elif isinstance(obj, str):
+            if self._truncate and is_huge_text(obj):
+                # Only process the part of huge strings that can be shown:
+                obj = bound_text(obj, self._max_length())
+            return self._format_str(obj, style)
+        elif is_scalar(obj):
+            return self._format_str(bounded_str(obj), style)
+
         if self._indent or self._bullet:
             # Use a squashed context to cleanly format content that should
             # then be indented or bulleted:
@@ -274,15 +602,63 @@ class PPContext:
         else:
             ppc = self
 
-        if isinstance(obj, type):
-            return str(obj)
-        elif isinstance(obj, str):
-            return ppc._format_str(obj, style)
-        elif is_dict(obj):
-            return ppc._format_dict(dict(obj), bullet=bullet, style=style,
-                                    key_style=key_style)
-        elif is_bullettable(obj):
-            return ppc._format_bullettable(obj, bullet=bullet, style=style)
+        if is_dict(obj):
+            summary = ppc._elide(obj, slot)
+            if summary is not None:
+                return apply_style(summary, style)
+            gen = ppc._format_dict(dict(obj),
+                                   bullet=bullet,
+                                   style=style,
+                                   key_style=key_style,
+                                   probe=probe)
+            result = yield from ppc._format_tracked(obj, slot, gen)
+            self._release(ppc)
+            return result
+        elif is_bullettable(obj) and not is_namedtuple(obj):
+            summary = ppc._elide(obj, slot)
+            if summary is not None:
+                return apply_style(summary, style)
+            gen = ppc._format_bullettable(obj,
+                                          bullet=bullet,
+                                          style=style,
+                                          probe=probe)
+            result = yield from ppc._format_tracked(obj, slot, gen)
+            self._release(ppc)
+            return result
+        elif is_ndarray(obj):
+            return [apply_style(line, style)
+                    for line in format_ndarray(obj,
+                                               width=ppc._content_width,
+                                               truncate=ppc._truncate)]
+        elif is_binary(obj):
+            return [apply_style(line, style)
+                    for line in format_binary(obj,
+                                              width=ppc._content_width,
+                                              truncate=ppc._truncate)]
+
+        # format the fields of dataclass instances, named tuples, etc. like
+        # dicts, or as specified by their '__pp_fields__' spec:
+        accessor = record_accessor(type(obj))
+        if accessor is not None:
+            summary = ppc._elide(obj, slot)
+            if summary is not None:
+                return apply_style(summary, style)
+            if accessor.spec is None:
+                gen = ppc._format_dict(record_items(obj, accessor),
+                                       bullet=bullet,
+                                       style=style,
+                                       key_style=key_style,
+                                       probe=probe,
+                                       sort_keys=False)
+            else:
+                gen = ppc._format_spec(obj, accessor,
+                                       bullet=bullet,
+                                       style=style,
+                                       key_style=key_style,
+                                       probe=probe)
+            result = yield from ppc._format_tracked(obj, slot, gen)
+            self._release(ppc)
+            return result
 
         # pass the ppcontext to __str__ when possible:
         __str__ = getattr(obj, "__str__", None)
@@ -291,30 +667,91 @@ class PPContext:
             if ppc == self:
                 # Use a fresh pp-context to pass to the __str__ method:
                 ppc = self._squash()
+            if ppc._profiler is not None:
+                __str__ = ppc._profiler.wrap(__str__, obj, "__str__")
+            marker = ppc._enter(obj, slot)
+            if marker is not None:
+                return marker
             try:
                 # This might fail when 'obj' is a class object (-> TypeError).
-                return apply_style(obj.__str__(ppc=ppc), style)
+                result = apply_style(__str__(ppc=ppc), style)
             except TypeError:
-                return apply_style(str(obj), style)
+                result = apply_style(str(obj), style)
+            finally:
+                ppc._exit(obj, slot)
+            return ppc._label(obj, slot, result)
 
         # use the 'describe' method when it is provided (deprecated):
         describe = getattr(obj, "describe", None)
         if callable(describe):
             params = tuple(signature(describe).parameters.keys())
-            if "ppc" in params:
-                if ppc == self:
-                    # Use a fresh pp-context to pass to the describe method:
-                    ppc = self._squash()
-                result = obj.describe(ppc=ppc)
-            elif "width" in params:
-                result = obj.describe(width=ppc._content_width)
-            else:
-                result = obj.describe()
+            if ppc._profiler is not None:
+                describe = ppc._profiler.wrap(describe, obj, "describe")
+            if "ppc" in params and ppc == self:
+                # Use a fresh pp-context to pass to the describe method:
+                ppc = self._squash()
+            marker = ppc._enter(obj, slot)
+            if marker is not None:
+                return marker
+            try:
+                if "ppc" in params:
+                    result = describe(ppc=ppc)
+                elif "width" in params:
+                    result = describe(width=ppc._content_width)
+                else:
+                    result = describe()
+            finally:
+                ppc._exit(obj, slot)
             if isinstance(result, str):
-                return apply_style(result, style)
+                result = apply_style(result, style)
+            else:
+                result = ppc._format_str(str(obj), style)
+            return ppc._label(obj, slot, result)
 
         return ppc._format_str(str(obj), style)
 
+    def _format_tracked(self, obj, slot: Optional[int],
+                        gen: Generator) -> Generator:
+        """
+        Runs the given formatting generator for the given object, or renders
+        a marker or reference instead, when tracking the object shows it is
+        part of a cycle or has already been rendered.
+        """
+        marker = self._enter(obj, slot)
+        if marker is not None:
+            gen.close()
+            return marker
+        try:
+            result = yield from gen
+        finally:
+            self._exit(obj, slot)
+        return self._label(obj, slot, result)
+
+    def _elide(self, obj, slot: Optional[int]) -> Optional[str]:
+        """
+        Returns a summary of the given container when it is nested beyond the
+        maximal depth, or None.
+        """
+        if (self._max_depth and slot is not None and
+                self._refs is not None and
+                self._refs.depth >= self._max_depth):
+            return self._summarize(obj)
+        return None
+
+    def _enter(self, obj, slot: Optional[int]) -> Optional[str]:
+        if self._refs is None or slot is None:
+            return None
+        return self._refs.enter(obj, slot)
+
+    def _exit(self, obj, slot: Optional[int]) -> None:
+        if self._refs is not None and slot is not None:
+            self._refs.exit(obj)
+
+    def _label(self, obj, slot: Optional[int], result):
+        if self._refs is None or slot is None:
+            return result
+        return self._refs.label(obj, result)
+
     def _format_str(self, obj,
                     style: StyleOptions = None) -> Union[str, List[str]]:
         if obj == "":
@@ -322,56 +759,132 @@ class PPContext:
 
         if is_oneliner(obj) and len(obj) > self._content_width:
             if self._truncate:
-                max_len = self._content_width * self._truncate
+                max_len = self._max_length()
                 if len(obj) > max_len:
-                    obj = textwrap.shorten(obj, max_len)
+                    obj = shorten(obj, max_len)
             return [apply_style(line, style)
-                    for line in textwrap.wrap(obj, self._content_width)]
+                    for line in wrap(obj, self._content_width)]
 
         return apply_style(obj, style)
 
     def _format_dict(self, dct,
                      bullet: str = None,
                      style: StyleOptions = None,
-                     key_style: StyleOptions = None) -> Union[str, List[str]]:
+                     key_style: StyleOptions = None,
+                     probe: int = None,
+                     sort_keys: bool = True) -> Generator:
         if len(dct) == 0:
             return apply_style("{}", style)
         elif len(dct) == 1:
             key = tuple(dct.keys())[0]
-            return self._format_kv_pair(key, dct[key], bullet or "",
-                                        style=style, key_style=key_style)
+            return (yield from self._format_kv_pair(key, dct[key],
+                                                    bullet or "",
+                                                    style=style,
+                                                    key_style=key_style,
+                                                    probe=probe,
+                                                    slot=0))
+        elif probe is not None:
+            # Two or more key-value pairs result in as many bulleted lines:
+            return None
+
+        if self._sample and sort_keys and 0 < self._truncate < len(dct):
+            kvs = self._sample_items(dct.items())
+            elided = len(kvs) - 1
         else:
-            try:
-                kvs = [(key, dct[key]) for key in sorted(dct.keys())]
-            except TypeError:
-                kvs = dct.items()
+            kvs = ([(key, dct[key]) for key in pp_sorted(dct.keys())]
+                   if sort_keys else list(dct.items()))
 
-            truncated = False
+            elided = None
             if self._truncate and len(kvs) > self._truncate:
-                kvs = kvs[:self._truncate]
-                truncated = True
+                elided = self._truncate - self._tail
+                kvs = self._truncate_items(kvs)
+
+        bullet = bullet or self._default_bullet
+        lines: List[str] = []
+        for index, kv in enumerate(kvs):
+            if index == elided:
+                lines.append(bullet + kv)
+                continue
+            key, val = kv
+            lines.append((yield from self._format_kv_pair(
+                key, val, bullet,
+                style=style,
+                key_style=key_style,
+                slot=index)))
+        return "\n".join(lines)
 
+    def _format_spec(self, obj, accessor: RecordAccessor,
+                     bullet: str = None,
+                     style: StyleOptions = None,
+                     key_style: StyleOptions = None,
+                     probe: int = None) -> Generator:
+        """
+        Formats the given object as specified by the spec of the given
+        accessor, i.e. as the header followed by the (indented) key-value
+        pairs.
+        """
+        spec = accessor.spec
+        assert spec is not None
+        items = record_items(obj, accessor)
+        fields = [field for field in spec.fields if field.name in items]
+        header = spec.header or ""
+        if accessor.header_names:
+            header = header.format_map({name: getattr(obj, name)
+                                        for name in accessor.header_names})
+        if probe is not None and len(fields) + bool(header) > 1:
+            # Two or more lines:
+            return None
+
+        style = spec.style or style
+        key_style = spec.key_style or key_style
+        lines: List[str] = []
+        indent = ""
+        if header:
+            lines.append(apply_style(header, style))
+            indent = self.default_indent
+        if len(fields) > 1 or header:
             bullet = bullet or self._default_bullet
-            lines: List[str] = [
-                self._format_kv_pair(key, val, bullet, style=style,
-                                     key_style=key_style)
-                for key, val in kvs
-            ]
-            if truncated:
-                lines.append(bullet + "...")
-            return "\n".join(lines)
+        else:
+            bullet = bullet or ""
+
+        # Narrow the width for the indented key-value pairs:
+        ori_width = self._width
+        self._width -= len(indent)
+        self._update()
+        try:
+            for index, field in enumerate(fields):
+                truncate = (field.truncate if field.truncate is not None else
+                            spec.truncate if spec.truncate is not None else
+                            self._truncate)
+                with self.truncate(truncate):
+                    line = yield from self._format_kv_pair(
+                        field.label, items[field.name], bullet,
+                        style=field.style or style,
+                        key_style=key_style,
+                        probe=probe,
+                        slot=index)
+                if line is None:
+                    return None
+                lines.append(textwrap.indent(line, indent) if indent
+                             else line)
+        finally:
+            self._width = ori_width
+            self._update()
+        return "\n".join(lines)
 
     def _format_kv_pair(self, key, value,
                         bullet: str = "",
                         style: StyleOptions = None,
-                        key_style: StyleOptions = None) -> str:
+                        key_style: StyleOptions = None,
+                        probe: int = None,
+                        slot: int = 0) -> Generator:
         bullet = bullet or ""
         blt_len = len(bullet)
         if key_style is None:
             key_style = style
 
         # Format the key, truncating it when it is too long:
-        key = str(key)
+        key = bounded_str(key)
         max_key_length = max(int((self._content_width - blt_len) / 2), 10)
         if len(key) > max_key_length:
             key = key[:max_key_length - 3] + "..."
@@ -382,6 +895,15 @@ class PPContext:
         key_len = len(key)
         pre_len = blt_len + key_len + 1
 
+        mapping = is_dict(value) or is_record(value)
+        if mapping and self._refs is not None:
+            # Format a summary of, a cycle or a reference to a mapping like a
+            # string value:
+            value = (self._elide(value, slot) or
+                     self._refs.marker(value, slot) or
+                     value)
+            mapping = not isinstance(value, str)
+
         # Format a key-value pair with a string value, which is assumed to be
         # regular text, as a oneliner or a wrapped and indented multiliner:
         if isinstance(value, str):
@@ -393,10 +915,15 @@ class PPContext:
                                       apply_style(value, style))
 
             subsequent_indent = self.default_indent + " " * blt_len
-            lines = textwrap.wrap(f"{bullet}{key} {value}",
-                                  width=self._content_width - blt_len,
-                                  subsequent_indent=subsequent_indent,
-                                  max_lines=self._truncate)
+            # Leave room for the placeholder of the truncated lines, after
+            # the indentation of deeply nested content:
+            min_width = 5
+            if self._truncate > 1:
+                min_width += len(subsequent_indent)
+            lines = wrap(f"{bullet}{key} {value}",
+                         width=max(self._content_width - blt_len, min_width),
+                         subsequent_indent=subsequent_indent,
+                         max_lines=self._truncate)
             bkl = len(bullet) + len(key)
             lines = [(apply_style(lines[0][:bkl], key_style)
                       + apply_style(lines[0][bkl:], style)),
@@ -409,104 +936,234 @@ class PPContext:
         # Try to format as a oneliner when the formatted value is a
         # oneliner, except when the value is a key-value mapping or the
         # formatted value seems to be bulletted:
-        if not is_dict(value):
+        if mapping:
+            if probe is not None:
+                # Case KVP-5 results in two or more non-empty lines:
+                return None
+        else:
             if isgenerator(value):
                 # "render" as list to avoid that the generator is exhausted
                 # when the styled representation is formatted:
-                value = self._generate_items(value)
-            unstyled = self.format(value)
-            if is_oneliner(unstyled) and not self.bullet_regex.match(unstyled):
-                if pre_len + len(unstyled) <= self._content_width:
-                    # Case KVP-3:
-                    # print("--> Case KVP-3")
-                    return "{} {}".format(apply_style(bullet + key, key_style),
-                                          self.format(value, style=style))
+                value = (self._elide(value, slot) or
+                         self._generate_items(value))
+            result = yield from self._format_kvp_3(key, value, bullet,
+                                                   style=style,
+                                                   key_style=key_style,
+                                                   probe=probe,
+                                                   slot=slot)
+            if result is not None:
+                return result
+            if probe is not None:
+                # Cases KVP-4 and KVP-5 only result in a oneliner when the
+                # value is formatted as a oneliner, which didn't fit Case
+                # KVP-3. Probing the value again would format it twice per
+                # level of nesting, i.e. an exponential number of times:
+                return None
 
         # Format multiline value with indentation:
-        with self.indent(self.default_indent + " " * blt_len):
-            unstyled = self.format(value)
+        indent = self.default_indent + " " * blt_len
+        unstyled = None
+        with self.indent(indent):
+            if style is None or not mapping:
+                unstyled = yield (self, (value,), None, None, None, None,
+                                  slot)
 
         # Try to fit the first line on the same line as the key, except when
         # the value is a key-value mapping or the formatted value seems
-        # to be bulletted:
-        if not is_dict(value):
+        # to be bulletted or is a table:
+        result = None
+        if not mapping and not (is_bullettable(value) and
+                                is_multiliner(unstyled)):
             if unstyled == "":
-                return "{}".format(apply_style(bullet + key, key_style))
-            lines = unstyled.splitlines()
-            trimmed = lines[0].lstrip()
-            if (not self.bullet_regex.match(trimmed) and
-                    pre_len + len(trimmed) <= self._content_width):
-                # Case KVP-4:
-                # print(f"--> Case KVP-4")
-                lines = [apply_style(line, style) for line in lines[1:]]
-                return "{} {}\n{}".format(apply_style(bullet + key, key_style),
-                                          apply_style(trimmed, style),
-                                          "\n".join(lines))
-
-        # Case KVP-5:
-        # print(f"--> Case KVP-5")
-        # print(self.format(value, style=style))
-        with self.indent(self.default_indent + " " * blt_len):
-            return "{}\n{}".format(apply_style(bullet + key, key_style),
-                                   self.format(value, style=style))
+                result = "{}".format(apply_style(bullet + key, key_style))
+            else:
+                assert unstyled is not None
+                lines = unstyled.splitlines()
+                trimmed = lines[0].lstrip()
+                if (not self.bullet_regex.match(trimmed) and
+                        pre_len + len(trimmed) <= self._content_width):
+                    # Case KVP-4:
+                    # print(f"--> Case KVP-4")
+                    lines = [apply_style(line, style) for line in lines[1:]]
+                    result = "{} {}\n{}".format(
+                        apply_style(bullet + key, key_style),
+                        apply_style(trimmed, style),
+                        "\n".join(lines))
+
+        if result is None:
+            # Case KVP-5:
+            # print(f"--> Case KVP-5")
+            if style is None:
+                formatted = unstyled
+            else:
+                with self.indent(indent):
+                    formatted = yield (self, (value,), None, style, None,
+                                       None, slot)
+            result = "{}\n{}".format(apply_style(bullet + key, key_style),
+                                     formatted)
+        return result
+
+    def _format_kvp_3(self, key: str, value,
+                      bullet: str,
+                      style: StyleOptions = None,
+                      key_style: StyleOptions = None,
+                      probe: int = None,
+                      slot: int = 0) -> Generator:
+        """
+        Tries to format the given key-value pair as a oneliner, i.e. Case
+        KVP-3, and returns None when this is not possible.
+        """
+        pre_len = len(bullet) + len(key) + 1
+        budget = self._content_width - pre_len
+        if probe is not None:
+            budget = min(budget, probe - pre_len)
+        unstyled = yield (self, (value,), None, None, None, budget, slot)
+        if (unstyled is not None and is_oneliner(unstyled) and
+                not self.bullet_regex.match(unstyled) and
+                pre_len + len(unstyled) <= self._content_width):
+            # Case KVP-3:
+            # print("--> Case KVP-3")
+            if style is not None:
+                unstyled = yield (self, (value,), None, style, None, None,
+                                  slot)
+            return "{} {}".format(apply_style(bullet + key, key_style),
+                                  unstyled)
+        return None
 
     def _format_bullettable(self, items,
                             bullet: str = None,
-                            style: StyleOptions = None) \
-            -> Union[str, List[str]]:
+                            style: StyleOptions = None,
+                            probe: int = None) -> Generator:
         # print(">> format_bullettable()")
         brl, brr = self._brackets(items)
+        counts = None
+        sampled = False
+        # The last items are only known after processing all items:
+        limit = 0 if self._tail else self._truncate
+        if self._int_runs and is_int_collection(items):
+            items = compress_ints(items, limit)
+
         if isgenerator(items):
             items = self._generate_items(items)
+            if self._fold_runs:
+                items, counts = self._fold(items)
+        elif self._fold_runs and isinstance(items, (list, tuple)):
+            items, counts = self._fold(items, limit)
+            if self._truncate and len(items) > self._truncate:
+                counts = self._truncate_items(counts, 1)
+                items = self._truncate_items(items)
         elif self._truncate and len(items) > self._truncate:
-            if is_set(items):
-                items = list(items)
-                # noinspection PyBroadException
-                try:
-                    items = sorted(items)
-                except Exception:
-                    pass
-                items = items[:self._truncate]
-                items.append("...")
-            elif isinstance(items, tuple):
-                items = list(items)[:self._truncate]
-                items.append("...")
+            if is_set(items) and self._sample:
+                items = self._sample_items(items)
+                sampled = True
+            elif is_set(items):
+                items = self._truncate_items(pp_sorted(items))
             elif is_dict(items):
                 raise Exception("Unexpected")
             else:
-                items = items[:self._truncate]
-                items.append("...")
+                items = self._truncate_items(items)
         elif is_set(items):
-            items = list(items)
-            # noinspection PyBroadException
-            try:
-                items = sorted(items)
-            except Exception:
-                pass
+            items = pp_sorted(items)
 
         if len(items) == 0:
             return brl + brr
 
+        # The index of the ellipsis that replaces the elided items, if any:
+        elided = None
+        if sampled:
+            elided = len(items) - 1
+        elif self._truncate and len(items) > self._truncate:
+            elided = self._truncate - self._tail
+        elif type(items[-1]) is str and items[-1] == "...":
+            elided = len(items) - 1
+
         # Try to format as a bracketed oneliner:
-        result = self._format_oneliner(items, brl, brr, bullet=bullet)
+        max_width = self._width - 2  # minus the _brackets
+        if bullet:
+            max_width -= len(bullet)  # minus the bullet
+        if probe is not None and len(items) > 1:
+            # Two or more bulleted items don't fit in a oneliner either:
+            max_width = min(max_width, probe - (self._width - 2 - max_width))
+
+        if counts is None:
+            if self._profiler is not None:
+                scalars = self._profiler.format_scalars(self, items, elided)
+            elif self.instrumentation is not None:
+                scalars = self.instrumentation.timed_scalars(items, elided)
+            else:
+                scalars = self._format_scalars(items, elided)
+            if scalars is not None:
+                result = ", ".join(scalars)
+                if len(result) <= max_width:
+                    return apply_style((bullet or "") + brl + result + brr,
+                                       style)
+                if probe is None:
+                    with self.bullets(bullet=bullet):
+                        if max(map(len, scalars)) <= self._content_width:
+                            return "\n".join(self._prefix_0 +
+                                             apply_style(scalar, style)
+                                             for scalar in scalars)
+                elif len(items) > 1:
+                    return None
+
+        if self._profiler is None:
+            result = yield from self._format_oneliner(items, brl, brr,
+                                                      bullet=bullet,
+                                                      counts=counts,
+                                                      max_width=max_width)
+        else:
+            result = yield from self._profiler.format_oneliner(
+                self, items, brl, brr,
+                bullet=bullet,
+                counts=counts,
+                max_width=max_width)
         if result:
             return apply_style(result, style)
 
+        # Format as a table of records:
+        if probe is None and self._tables is not False:
+            table = self._format_table(items, bullet=bullet, elided=elided)
+            if table is not None:
+                return apply_style(table, style)
+
         # Format as bulletted items:
+        if probe is not None:
+            # A single bulleted item is a oneliner only if the bracketed
+            # oneliner is, as the bullet takes as much room as the brackets
+            # and narrows the content width. Retrying it would format the
+            # item twice per level of single-item nesting, i.e. an
+            # exponential number of times:
+            return None
+
         with self.bullets(bullet=bullet):
-            return "\n".join(self.format(el, style=style) for el in items)
+            lines: List[str] = []
+            for index, el in enumerate(items):
+                line = yield (self, (el,), None, style, None, None, index)
+                if counts is not None:
+                    line = self._append_count(line, counts[index])
+                lines.append(line)
+            return "\n".join(lines)
 
-    def _format_oneliner(self, items, brl, brr, bullet: str = None) -> \
-            Optional[str]:
-        max_width = self._width - 2  # minus the _brackets
-        if bullet:
-            max_width -= len(bullet)  # minus the bullet
+    def _format_oneliner(self, items, brl, brr,
+                         bullet: str = None,
+                         counts: List[int] = None,
+                         max_width: int = None) -> Generator:
+        if max_width is None:
+            max_width = self._width - 2  # minus the _brackets
+            if bullet:
+                max_width -= len(bullet)  # minus the bullet
 
         result = ""
-        for item in items:
-            frm_item = self.format(item)
-            if is_multiliner(frm_item):
+        for index, item in enumerate(items):
+            budget = max_width - len(result) - 2 if result else max_width
+            count = counts[index] if counts is not None else 1
+            if count > 1:
+                budget -= len(str(count)) + 2
+            frm_item = yield (self, (item,), None, None, None, budget, index)
+            if frm_item is None or is_multiliner(frm_item):
                 return None
+            if count > 1:
+                frm_item = f"{frm_item} ×{count}"
             if not result:
                 result = frm_item
             else:
@@ -520,6 +1177,130 @@ class PPContext:
         else:
             return brl + result + brr
 
+    def _format_table(self, items,
+                      bullet: str = None,
+                      elided: int = None) -> Optional[str]:
+        """
+        Formats the given items as a table when they are records with the
+        same fields, whose values are one-line strings, numbers, booleans or
+        None, except for the ellipsis at the given index. Returns None
+        otherwise, when two fields have the same label, or when the table does
+        not fit the width and the tables are not forced. The fields are only
+        looked up once.
+        """
+        records = (items if elided is None else
+                   items[:elided] + items[elided + 1:])
+        if len(records) < (1 if self._tables else 2):
+            return None
+        first = records[0]
+        names = record_fields(first)
+        if not names:
+            return None
+
+        labels = record_labels(first, names)
+        if len(set(labels)) < len(labels):
+            # Keys such as 1 and "1" would head two columns with the same
+            # label:
+            return None
+        columns: List[List[str]] = [[label] for label in labels]
+        numeric = [True] * len(names)
+        for record in records:
+            if record is not first and not same_schema(record, first):
+                return None
+            values = record_values(record, names)
+            for index, value in enumerate(values):
+                kind = type(value)
+                if kind is str:
+                    if "\n" in value:
+                        return None
+                    numeric[index] = False
+                elif kind in SCALAR_TYPES or value is None:
+                    if kind is bool:
+                        numeric[index] = False
+                    value = bounded_str(value)
+                else:
+                    return None
+                columns[index].append(value)
+
+        widths = [max(map(len, column)) for column in columns]
+        prefix = bullet or ""
+        if (not self._tables and
+                sum(widths) + 2 * (len(widths) - 1) + len(prefix) >
+                self._content_width):
+            return None
+
+        lines = ["  ".join(cell.rjust(width) if is_numeric
+                           else cell.ljust(width)
+                           for cell, width, is_numeric
+                           in zip(row, widths, numeric)).rstrip()
+                 for row in zip(*columns)]
+        if elided is not None:
+            # The ellipsis follows the header and the first records:
+            lines.insert(elided + 1, items[elided])
+        indent = " " * len(prefix)
+        return "\n".join(prefix + line if index == 0 else indent + line
+                         for index, line in enumerate(lines))
+
+    @staticmethod
+    def _format_scalars(items, elided: int = None) -> Optional[List[str]]:
+        """
+        Converts the given items to strings in bulk when they are all
+        scalars, except for the ellipsis at the given index, as their
+        formatting then amounts to their string conversion. Returns None
+        otherwise.
+        """
+        values = items
+        if elided is not None:
+            if len(items) == 1:
+                return None
+            values = chain(islice(items, elided),
+                           islice(items, elided + 1, None))
+        if not items or not SCALAR_TYPES.issuperset(map(type, values)):
+            return None
+        try:
+            return list(map(str, items))
+        except ValueError:
+            # There are integers beyond the interpreter's digit limit:
+            return list(map(bounded_str, items))
+
+    @staticmethod
+    def _fold(items, limit: int = 0) -> Tuple[list, List[int]]:
+        """
+        Folds the runs of consecutive equal items of the same type into
+        single items and their counts. When a limit is given, no more than
+        that number of runs plus one are collected.
+        """
+        folded: list = []
+        counts: List[int] = []
+        for item in items:
+            if folded:
+                prev = folded[-1]
+                if prev is item:
+                    counts[-1] += 1
+                    continue
+                if type(prev) is type(item):
+                    # noinspection PyBroadException
+                    try:
+                        same = bool(prev == item)
+                    except Exception:
+                        same = False
+                    if same:
+                        counts[-1] += 1
+                        continue
+                if limit and len(folded) > limit:
+                    break
+            folded.append(item)
+            counts.append(1)
+        return folded, counts
+
+    def _append_count(self, result: str, count: int) -> str:
+        """Appends the count of a run to its formatted (bulleted) item."""
+        if count == 1:
+            return result
+        if is_multiliner(result):
+            return f"{result}\n{self._prefix_n}×{count}"
+        return f"{result} ×{count}"
+
     # -- Context Managers --------------- --- --  -
 
     @contextmanager
@@ -562,16 +1343,40 @@ class PPContext:
             self._update()
 
     @contextmanager
-    def truncate(self, truncation: int = default_truncate):
+    def profile(self):
+        """
+        Profiles the formatting done by the wrapped pp-context commands, per
+        formatted type. The yielded :class:`~opyprint.profiler.Profiler`
+        object can be pretty-printed as a table.
+
+        Use this context-manager in a ``with`` statement as shown in the
+        following example::
+
+            ppc = PPContext()
+            with ppc.profile() as prof:
+                ppc(problem)
+            print(prof)
+        """
+        from .profiler import Profiler
+
+        ori_profiler = self._profiler
+        self._profiler = Profiler()
+        try:
+            yield self._profiler
+        finally:
+            self._profiler = ori_profiler
+
+    @contextmanager
+    def truncate(self, truncation: Truncation = default_truncate):
         """
         Use the given truncation for the wrapped pp-context commands.
         """
-        ori_truncate = self._truncate
-        self._truncate = truncation
+        ori_truncate, ori_tail = self._truncate, self._tail
+        self._truncate, self._tail = self._split_truncation(truncation)
         try:
             yield self
         finally:
-            self._truncate = ori_truncate
+            self._truncate, self._tail = ori_truncate, ori_tail
 
     @contextmanager
     def bullets(self, bullet: str = None):
@@ -623,7 +1428,7 @@ class PPContext:
                  indent: str = "",
                  key_style: StyleOptions = None,
                  style: StyleOptions = None,
-                 truncate: int = None) -> None:
+                 truncate: Truncation = None) -> None:
         """
         Formats the given arguments and collects the resulting pretty-printed
         content. Call :meth:`~flush` to get (and clear) the collected content
@@ -749,7 +1554,75 @@ class PPContext:
         else:
             self._prefix_0 = self._indent
             self._prefix_n = self._indent
-        self._content_width = self._width - len(self._prefix_0)
+        # Deeply nested content is wrapped at a single character, instead of
+        # failing:
+        self._content_width = max(self._width - len(self._prefix_0), 1)
+
+    def _max_length(self) -> int:
+        """
+        Gets the maximal length of strings when truncating, i.e. the number of
+        characters of the lines that can be shown, leaving room for the
+        placeholder of shortened strings.
+        """
+        return max(self._content_width * self._truncate, 5)
+
+    @staticmethod
+    def _split_truncation(truncate: Truncation) -> Tuple[int, int]:
+        """
+        Validates the given truncation setting and gets the total number of
+        items that are shown and the number of last items among them.
+        """
+        if isinstance(truncate, tuple):
+            if (len(truncate) != 2 or
+                    not all(isinstance(part, int) and part >= 0
+                            for part in truncate)):
+                msg = ("Expected a tuple of two non-negative ints as "
+                       "'truncate', got '{}'.")
+                raise TypeError(msg.format(truncate))
+            head, tail = truncate
+            return head + tail, tail
+        if not isinstance(truncate, int):
+            msg = "Expected an int as 'truncate', got '{}'."
+            raise TypeError(msg.format(truncate))
+        return truncate, 0
+
+    def _truncate_items(self, items, ellipsis=None) -> list:
+        """
+        Gets the first items and, when also showing the last items, the last
+        items of the given sequence, with an ellipsis in between, using index
+        access only.
+
+        :param items: The sequence to truncate, which is longer than the
+            truncation setting.
+        :param ellipsis: The item to use as ellipsis. Defaults to
+            :meth:`_ellipsis`.
+        """
+        length = len(items)
+        head = self._truncate - self._tail
+        result = list(items[:head])
+        result.append(self._ellipsis(length - self._truncate)
+                      if ellipsis is None else ellipsis)
+        if self._tail:
+            result.extend(items[length - self._tail:])
+        return result
+
+    def _sample_items(self, items) -> list:
+        """
+        Gets a sorted random sample of as many of the given items as the
+        truncation setting, followed by the number of the other items, in one
+        pass over the items.
+        """
+        sample = pp_sorted(reservoir_sample(items, self._truncate,
+                                            self._random))
+        sample.append(f"...and {len(items) - self._truncate} more")
+        return sample
+
+    def _ellipsis(self, count: int) -> str:
+        """
+        Gets the ellipsis for the given number of elided items, i.e. ``...``,
+        or ``... (12 more)`` when also showing the last items.
+        """
+        return f"... ({count} more)" if self._tail else "..."
 
     @staticmethod
     def _brackets(obj) -> Tuple[str, str]:
@@ -761,6 +1634,26 @@ class PPContext:
         else:
             return "[", "]"
 
+    @staticmethod
+    def _summarize(obj) -> str:
+        """
+        Summarizes the given container, using only its length, such as
+        ``{…12 keys}`` or ``[…3000 items]``.
+        """
+        if isgenerator(obj):
+            return "[…]"
+        accessor = record_accessor(type(obj))
+        if accessor is not None:
+            count = len(accessor.names)
+            return f"{{…{count} field{'' if count == 1 else 's'}}}"
+        if is_dict(obj):
+            brl, brr, noun = "{", "}", "key"
+        else:
+            brl, brr = PPContext._brackets(obj)
+            noun = "item"
+        count = len(obj)
+        return f"{brl}…{count} {noun}{'' if count == 1 else 's'}{brr}"
+
     def _normalize_bullet(self, bullet: Union[str, bool] = None) -> str:
         """
         Normalizes the given bullet string.
@@ -788,15 +1681,72 @@ class PPContext:
 
     def _squash(self):
         """
-        Get a new pp-context that has no bullet nor indent and whose width is
-        the content-width of the current pp-context.
+        Get a pp-context that has no bullet nor indent and whose width is the
+        content-width of the current pp-context, and that shares its other
+        settings. The spare context that was released by :meth:`_release` is
+        reused when available, otherwise a new one is created without
+        (re-)validating the settings.
+        """
+        ppc = self._spare
+        if ppc is None:
+            ppc = PPContext.__new__(PPContext)
+            ppc._lines = list()
+            ppc._spare = None
+        else:
+            self._spare = None
+        ppc._bullet = ""
+        ppc._content_width = self._content_width
+        ppc._default_bullet = self._default_bullet
+        ppc._fold_runs = self._fold_runs
+        ppc._indent = ""
+        ppc._int_runs = self._int_runs
+        ppc._max_depth = self._max_depth
+        ppc._prefix_0 = ""
+        ppc._prefix_n = ""
+        ppc._profiler = self._profiler
+        ppc._random = self._random
+        ppc._refs = self._refs
+        ppc._sample = self._sample
+        ppc._shared_refs = self._shared_refs
+        ppc._tables = self._tables
+        ppc._tail = self._tail
+        ppc._truncate = self._truncate
+        ppc._width = self._content_width
+        return ppc
+
+    def _release(self, ppc) -> None:
         """
-        return PPContext(width=self._content_width,
-                         truncate=self._truncate,
-                         default_bullet=self._default_bullet)
+        Keeps the given squashed pp-context, which is no longer used, for
+        reuse by :meth:`_squash`. This must only be done for contexts that
+        were not passed on to any ``__str__(ppc)`` or ``describe`` method.
+        """
+        if ppc is not self:
+            # Don't keep the formatted objects alive:
+            ppc._profiler = None
+            ppc._refs = None
+            self._spare = ppc
 
     def _generate_items(self, generator: Generator) -> List:
-        # Warning: The generator will be (partially) exhausted.
+        # Warning: The generator will be (partially) exhausted, so the items
+        # are kept for formatting the same generator again:
+        refs = self._refs
+        if refs is not None:
+            generated = refs.generated.get(id(generator))
+            if generated is None:
+                generated = refs.generated[id(generator)] = (
+                    generator, self._generate_items_aux(generator))
+            return generated[1]
+        return self._generate_items_aux(generator)
+
+    def _generate_items_aux(self, generator: Generator) -> List:
+        if self._tail:
+            items = list(islice(generator, self._truncate - self._tail))
+            # Keep the last items, numbered to count the elided ones:
+            tail = deque(zip(count(1), generator), maxlen=self._tail)
+            if tail and tail[0][0] > 1:
+                items.append(self._ellipsis(tail[0][0] - 1))
+            items.extend(item for _, item in tail)
+            return items
         if self._truncate:
             items = list()
             try:
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, Tuple, Union
+
+from .typing import StyleOptions, Truncation
+
+
+class PPField:
+    """A field in a :class:`PPSpec`, with its formatting options."""
+
+    __slots__ = [
+        "label",
+        "name",
+        "style",
+        "truncate",
+    ]
+
+    label: str
+    name: str
+    style: Optional[StyleOptions]
+    truncate: Optional[Truncation]
+
+    def __init__(self,
+                 name: str,
+                 label: str = None,
+                 style: StyleOptions = None,
+                 truncate: Truncation = None):
+        """
+        :param name: The name of the attribute.
+        :param label: The label that is shown as key. Defaults to the name.
+        :param style: The style of the value. Defaults to the style of the
+            spec.
+        :param truncate: The truncation setting for the value. Defaults to the
+            truncation setting of the spec.
+        """
+        if not isinstance(name, str):
+            msg = "Expected a string as 'name', got '{}'."
+            raise TypeError(msg.format(name))
+
+        self.label = name if label is None else label
+        self.name = name
+        self.style = style
+        self.truncate = truncate
+
+
+class PPSpec:
+    """
+    A declarative specification of how the instances of a class are
+    pretty-printed, given as its ``__pp_fields__`` class attribute, e.g.::
+
+        class Order:
+            __pp_fields__ = PPSpec(
+                "customer",
+                PPField("items", truncate=3),
+                PPField("total", style="green"),
+                header="Order {id}:")
+
+    or using the :func:`pp_fields` class decorator. A sequence of attribute
+    names can also be given as ``__pp_fields__``.
+
+    The instances are formatted as the header, when given, followed by the
+    fields as key-value pairs, which are indented when there is a header.
+    The spec is compiled once per class by
+    :func:`~opyprint.utils.record_accessor`, so no pp-context is allocated per
+    instance. It takes precedence over the ``__str__(ppc)`` and ``describe``
+    methods.
+    """
+
+    __slots__ = [
+        "fields",
+        "header",
+        "key_style",
+        "style",
+        "truncate",
+    ]
+
+    fields: Tuple[PPField, ...]
+    header: Optional[str]
+    key_style: Optional[StyleOptions]
+    style: Optional[StyleOptions]
+    truncate: Optional[Truncation]
+
+    def __init__(self,
+                 *fields: Union[str, PPField],
+                 header: str = None,
+                 key_style: StyleOptions = None,
+                 style: StyleOptions = None,
+                 truncate: Truncation = None):
+        """
+        :param fields: The attribute names or :class:`PPField` objects.
+        :param header: An optional header line, which can contain replacement
+            fields for the attributes of the instances, such as
+            ``"Order {id}:"``.
+        :param key_style: The style of the keys.
+        :param style: The style of the header and the values.
+        :param truncate: The truncation setting for the values. Defaults to
+            the truncation setting of the pp-context.
+        """
+        if header is not None and not isinstance(header, str):
+            msg = "Expected a string as 'header', got '{}'."
+            raise TypeError(msg.format(header))
+
+        self.fields = tuple(field if isinstance(field, PPField)
+                            else PPField(field)
+                            for field in fields)
+        self.header = header
+        self.key_style = key_style
+        self.style = style
+        self.truncate = truncate
+
+    @classmethod
+    def of(cls, spec) -> PPSpec:
+        """
+        Gets the given ``__pp_fields__`` value as a spec, i.e. the given spec
+        or a spec with the given attribute names.
+        """
+        if isinstance(spec, PPSpec):
+            return spec
+        if isinstance(spec, str):
+            return cls(spec)
+        return cls(*spec)
+
+
+def pp_fields(*fields: Union[str, PPField],
+              header: str = None,
+              key_style: StyleOptions = None,
+              style: StyleOptions = None,
+              truncate: Truncation = None) -> Callable[[type], type]:
+    """
+    A class decorator that sets the ``__pp_fields__`` spec of the decorated
+    class. See :class:`PPSpec` for the parameters.
+    """
+    spec = PPSpec(*fields,
+                  header=header,
+                  key_style=key_style,
+                  style=style,
+                  truncate=truncate)
+
+    def decorator(cls: type) -> type:
+        setattr(cls, "__pp_fields__", spec)
+        return cls
+
+    return decorator
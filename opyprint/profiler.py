@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .logger.span import format_duration
+from .pp_context import PPContext
+from .utils import align_columns
+
+
+class ProfileEntry:
+    """The aggregated timings of the profiled calls with a given label."""
+
+    __slots__ = [
+        "calls",
+        "exclusive",
+        "inclusive",
+    ]
+
+    calls: int
+    exclusive: float
+    inclusive: float
+
+    def __init__(self):
+        self.calls = 0
+        self.exclusive = 0.0
+        self.inclusive = 0.0
+
+
+class Profiler:
+    """
+    Records the inclusive and exclusive time and the number of calls spent on
+    formatting objects, per formatted type, as well as on the ``__str__(ppc)``
+    and ``describe`` fallbacks and on the one-liner attempts and bulk scalar
+    conversions of :class:`~opyprint.PPContext`. See :meth:`PPContext.profile
+    <opyprint.PPContext.profile>`.
+
+    The labels of the entries are:
+
+    - the qualified name of a formatted type, such as ``dict`` or ``Alpha``,
+    - ``Alpha.__str__`` or ``Alpha.describe`` for the fallbacks,
+    - ``list [one-liner]`` for one-liner attempts that succeeded and
+      ``list [one-liner, discarded]`` for attempts whose result was discarded
+      in favor of a bulleted representation,
+    - ``list [scalars]`` for the bulk conversions of lists of scalars, which
+      are not formatted item by item, and ``list [scalars, discarded]`` for
+      the checks of lists that turned out to hold other items.
+
+    The inclusive time of recursive calls with the same label is only counted
+    once.
+    """
+
+    __slots__ = [
+        "_active",
+        "_entries",
+        "_stack",
+    ]
+
+    _active: Dict[str, int]
+    _entries: Dict[str, ProfileEntry]
+    _stack: List[float]
+
+    def __init__(self):
+        self._active = {}
+        self._entries = {}
+        self._stack = []
+
+    def __getitem__(self, label: str) -> ProfileEntry:
+        return self._entries[label]
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total(self) -> float:
+        """The total profiled time."""
+        return sum(entry.exclusive for entry in self._entries.values())
+
+    def items(self) -> Iterator[Tuple[str, ProfileEntry]]:
+        """
+        Iterates over the (label, entry) pairs, sorted by decreasing exclusive
+        time.
+        """
+        return iter(sorted(self._entries.items(),
+                           key=lambda item: (-item[1].exclusive, item[0])))
+
+    # -- Recording --------------- --- --  -
+
+    def call(self, label: str, func: Callable, *args, **kwargs):
+        """Calls the given function and records its timings."""
+        start = self._push(label)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._pop(label, label, start)
+
+    def wrap(self, method: Callable, obj, name: str) -> Callable:
+        """
+        Wraps the given method of the given object such that the timings of
+        its calls are recorded, labeled with the type and method name.
+        """
+        label = f"{type(obj).__qualname__}.{name}"
+
+        def wrapper(*args, **kwargs):
+            return self.call(label, method, *args, **kwargs)
+
+        return wrapper
+
+    def format_dispatch(self, ppc: PPContext, obj, **kwargs):
+        """
+        Delegates to the format-dispatch generator of the given pp-context, or
+        the instrumented version of it when an instrumentation is enabled, and
+        records the timings for the type of the given object.
+        """
+        label = type(obj).__qualname__
+        start = self._push(label)
+        try:
+            if ppc.instrumentation is None:
+                return (yield from ppc._format_dispatch(obj, **kwargs))
+            return (yield from ppc.instrumentation.timed_dispatch(ppc, obj,
+                                                                  **kwargs))
+        finally:
+            self._pop(label, label, start)
+
+    def format_oneliner(self, ppc: PPContext, items, brl: str, brr: str,
+                        bullet: str = None,
+                        counts: List[int] = None,
+                        max_width: int = None):
+        """
+        Delegates to the one-liner generator of the given pp-context and
+        records the timings of the attempt, depending on whether the result is
+        discarded.
+        """
+        label = f"{type(items).__qualname__} [one-liner]"
+        result = None
+        start = self._push(label)
+        try:
+            result = yield from ppc._format_oneliner(items, brl, brr,
+                                                     bullet=bullet,
+                                                     counts=counts,
+                                                     max_width=max_width)
+            return result
+        finally:
+            self._pop(label,
+                      label if result else label[:-1] + ", discarded]",
+                      start)
+
+    def format_scalars(self, ppc: PPContext, items,
+                       elided: int = None) -> Optional[List[str]]:
+        """
+        Delegates to the bulk scalar conversion of the given pp-context, or
+        the instrumented version of it when an instrumentation is enabled, and
+        records the timings as a single entry for all items.
+        """
+        label = f"{type(items).__qualname__} [scalars]"
+        result = None
+        start = self._push(label)
+        try:
+            if ppc.instrumentation is None:
+                result = ppc._format_scalars(items, elided)
+            else:
+                result = ppc.instrumentation.timed_scalars(items, elided)
+            return result
+        finally:
+            self._pop(label,
+                      label if result is not None
+                      else label[:-1] + ", discarded]",
+                      start)
+
+    def _push(self, label: str) -> float:
+        self._active[label] = self._active.get(label, 0) + 1
+        self._stack.append(0.0)
+        return perf_counter()
+
+    def _pop(self, label: str, entry_label: str, start: float) -> None:
+        elapsed = perf_counter() - start
+        nested = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+        self._active[label] -= 1
+
+        entry = self._entries.get(entry_label)
+        if entry is None:
+            entry = self._entries[entry_label] = ProfileEntry()
+        entry.calls += 1
+        entry.exclusive += elapsed - nested
+        if not self._active[label]:
+            entry.inclusive += elapsed
+
+    # -- Reporting --------------- --- --  -
+
+    def __str__(self, ppc: PPContext = None) -> str:
+        ppc = ppc or PPContext()
+        if not self._entries:
+            ppc("No formatting calls profiled.")
+            return ppc.flush()
+
+        total = self.total
+        rows = [(label,
+                 str(entry.calls),
+                 format_duration(entry.inclusive),
+                 format_duration(entry.exclusive),
+                 f"{100 * entry.exclusive / total:.1f}" if total else "-")
+                for label, entry in self.items()]
+        header = ("type", "calls", "inclusive", "exclusive", "%")
+        right = [False] + [True] * (len(header) - 1)
+        ppc(f"Formatting profile ({format_duration(total)}):")
+        with ppc.indent():
+            for line in align_columns([header, *rows], right):
+                ppc(line)
+        return ppc.flush()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple
+
+
+class RefTracker:
+    """
+    Tracks the identity of the containers and the objects with a
+    ``__str__(ppc)`` or ``describe`` method that are formatted during a
+    :meth:`PPContext.format <opyprint.PPContext.format>` call.
+
+    - An object that is formatted as part of its own representation, i.e. a
+      cycle, is rendered as a back-reference marker, such as
+      ``<cycle: list>``.
+    - When shared references are enabled, an object that occurs more than once
+      is rendered in full only once, labeled with a number such as ``#3``, and
+      as a reference such as ``<see #3>`` elsewhere.
+
+    An occurrence of an object is identified by the occurrence of its closest
+    tracked ancestor and its position therein, such that the repeated attempts
+    to format the same occurrence, e.g. as a one-liner and as a bulleted list,
+    agree on whether the object is rendered in full. The objects that occur
+    more than once are only known after a first pass, so the formatting is
+    repeated when new shared objects were found.
+    """
+
+    __slots__ = [
+        "found",
+        "generated",
+        "numbers",
+        "shared",
+        "shared_refs",
+        "_active",
+        "_keys",
+        "_objects",
+        "_owners",
+        "_path",
+    ]
+
+    found: Set[int]
+    generated: Dict[int, Tuple[Generator, List]]
+    numbers: Dict[int, int]
+    shared: Set[int]
+    shared_refs: bool
+    _active: Set[int]
+    _keys: Dict[Tuple[int, int, int], int]
+    _objects: List[Any]
+    _owners: Dict[int, int]
+    _path: List[int]
+
+    def __init__(self, shared_refs: bool = False):
+        """
+        :param shared_refs: Whether objects that occur more than once are
+            rendered as references after their first full rendering.
+        """
+        self.found = set()
+        self.generated = {}
+        self.numbers = {}
+        self.shared = set()
+        self.shared_refs = shared_refs
+        self._active = set()
+        self._keys = {}
+        self._objects = []
+        self._owners = {}
+        self._path = []
+
+    @property
+    def depth(self) -> int:
+        """The number of enclosing objects that are being formatted."""
+        return len(self._active)
+
+    def marker(self, obj, slot: int) -> Optional[str]:
+        """
+        Returns the marker or reference to render instead of the given object
+        at the given position of the enclosing object, or None when the object
+        should be formatted.
+        """
+        ident = id(obj)
+        if ident in self._active:
+            if self.shared_refs:
+                return self._reference(ident, obj)
+            return f"<cycle: {type(obj).__qualname__}>"
+
+        if self.shared_refs:
+            key = self._key(ident, slot)
+            if self._owners.setdefault(ident, key) != key:
+                return self._reference(ident, obj)
+        return None
+
+    def enter(self, obj, slot: int) -> Optional[str]:
+        """
+        Starts formatting the given object at the given position of the
+        enclosing object. Returns the marker or reference to render instead,
+        or None when the object should be formatted, in which case
+        :meth:`exit` has to be called afterwards.
+        """
+        marker = self.marker(obj, slot)
+        if marker is not None:
+            return marker
+
+        ident = id(obj)
+        if self.shared_refs:
+            if ident in self.shared and ident not in self.numbers:
+                self.numbers[ident] = len(self.numbers) + 1
+            # Keep the object alive, such that its id is not reused:
+            self._objects.append(obj)
+            self._path.append(self._key(ident, slot))
+
+        self._active.add(ident)
+        return None
+
+    def exit(self, obj) -> None:
+        """Finishes formatting the given object."""
+        self._active.discard(id(obj))
+        if self.shared_refs:
+            self._path.pop()
+
+    def label(self, obj, result):
+        """Labels the full rendering of the given object, when shared."""
+        number = self.numbers.get(id(obj)) if self.shared_refs else None
+        if number is None or result is None:
+            return result
+        if isinstance(result, list):
+            return [f"#{number}", *result]
+        if not result:
+            return f"#{number}"
+        if "\n" in result:
+            return f"#{number}\n{result}"
+        return f"#{number} {result}"
+
+    def restart(self) -> bool:
+        """
+        Prepares another pass when new shared objects were found and returns
+        whether this is the case.
+        """
+        if not self.found:
+            return False
+        self.shared |= self.found
+        self.found = set()
+        self.numbers = {}
+        self._owners = {}
+        return True
+
+    def _key(self, ident: int, slot: int) -> int:
+        parent = self._path[-1] if self._path else -1
+        return self._keys.setdefault((parent, ident, slot), len(self._keys))
+
+    def _reference(self, ident: int, obj) -> str:
+        number = self.numbers.get(ident)
+        if number is None:
+            # Known after this pass:
+            self.found.add(ident)
+            return f"<see {type(obj).__qualname__}>"
+        return f"<see #{number}>"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Collection, Union
+from typing import Any, Collection, Tuple, Union
 
 from .pp_styles import PPStyles
 
@@ -17,3 +17,10 @@ can be one of the following:
 - An integer in the [0-255] range that identifies one of the colors in the
   extended color set shown in: http://www.lihaoyi.com/post/Ansi/Rainbow256.png
 """
+
+Truncation = Union[int, Tuple[int, int]]
+"""
+Either the number of items that are shown, or a tuple with the number of
+first and last items that are shown, such as ``(8, 4)``, with the number of
+elided items in between. See :class:`~opyprint.pp_context.PPContext`.
+"""
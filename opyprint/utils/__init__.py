@@ -1,15 +1,61 @@
-from .lt import dict_lt, lt
+from .binary import BINARY_TYPES, format_binary, is_binary
+from .bounded import (
+    bound_text, bounded_str, is_huge_int, is_huge_text, max_int_digits,
+    summarize_int,
+)
+from .columns import align_columns
+from .int_runs import compress_ints, is_int_collection
+from .lt import dict_lt, lt, pp_sort_key, pp_sorted
+from .ndarrays import format_ndarray, is_ndarray
 from .predicates import (
-    is_bullettable, is_dict, is_multiliner, is_oneliner, is_set, is_tuple,
+    SCALAR_TYPES, is_bullettable, is_dict, is_multiliner, is_oneliner,
+    is_scalar, is_set, is_tuple,
+)
+from .records import (
+    RecordAccessor, is_namedtuple, is_record, record_accessor, record_fields,
+    record_items, record_labels, record_values, same_schema,
 )
+from .sampling import reservoir_sample
+from .wrap import shorten, text_wrapper, wrap
 
 __all__ = [
+    "BINARY_TYPES",
+    "RecordAccessor",
+    "SCALAR_TYPES",
+    "align_columns",
+    "bound_text",
+    "bounded_str",
+    "compress_ints",
     "dict_lt",
+    "format_binary",
+    "format_ndarray",
+    "is_binary",
     "is_bullettable",
     "is_dict",
+    "is_huge_int",
+    "is_huge_text",
+    "is_int_collection",
     "is_multiliner",
+    "is_namedtuple",
+    "is_ndarray",
     "is_oneliner",
+    "is_record",
+    "is_scalar",
     "is_set",
     "is_tuple",
     "lt",
+    "max_int_digits",
+    "pp_sort_key",
+    "pp_sorted",
+    "record_accessor",
+    "record_fields",
+    "record_items",
+    "record_labels",
+    "record_values",
+    "reservoir_sample",
+    "same_schema",
+    "shorten",
+    "summarize_int",
+    "text_wrapper",
+    "wrap",
 ]
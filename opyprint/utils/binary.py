@@ -0,0 +1,92 @@
+from mmap import mmap
+from typing import List
+
+BINARY_TYPES = (
+    bytearray,
+    bytes,
+    memoryview,
+    mmap,
+)
+
+# Maps the bytes to themselves when they are printable ASCII characters and
+# to dots otherwise:
+_printable = bytes(byte if 0x20 <= byte < 0x7f else 0x2e
+                   for byte in range(256))
+
+
+def is_binary(obj) -> bool:
+    """
+    Checks if the given object is a bytes, bytearray, memoryview or mmap
+    object.
+    """
+    return isinstance(obj, BINARY_TYPES)
+
+
+def format_binary(obj, width: int, truncate: int = 0) -> List[str]:
+    """
+    Formats the given binary object as its escaped representation, when it is
+    a bytes or bytearray object that fits in a line, or as a hexdump, i.e.
+    its type and size, followed by rows with an offset, the hexadecimal
+    values and the printable characters of as many bytes as fit the width,
+    such as::
+
+        bytes(nbytes=20)
+        00000000  00 61 62 63 64 65 66 67  68 69 6a 6b  |.abcdefghijk|
+        00000010  6c 6d 6e 6f 70 71 72 73               |lmnopqrs|
+
+    Only the rows that are shown are read, using memoryview slices, so the
+    buffer is not copied, unless it is not contiguous.
+
+    :param obj: The binary object to format.
+    :param width: The maximal line width.
+    :param truncate: When non-zero, the number of rows that are shown.
+    """
+    if isinstance(obj, (bytes, bytearray)) and len(obj) <= width:
+        text = str(obj)
+        if len(text) <= width:
+            return [text]
+
+    with memoryview(obj) as view:
+        if view.c_contiguous:
+            data = view.cast("B") if view.ndim != 1 or view.itemsize != 1 \
+                else view
+        else:
+            data = memoryview(view.tobytes())
+        try:
+            return _hexdump(data, type(obj).__name__, width, truncate)
+        finally:
+            if data is not view:
+                data.release()
+
+
+def _hexdump(data: memoryview,
+             name: str,
+             width: int,
+             truncate: int) -> List[str]:
+    total = len(data)
+    offset_width = max(len(f"{total - 1:x}"), 8)
+
+    # The widest row of 1, 2, 4 or a multiple of 8 bytes that fits, with an
+    # extra space between the groups of 8 bytes:
+    count = 1
+    while True:
+        wider = count * 2 if count < 8 else count + 8
+        if offset_width + 5 + 4 * wider + (wider - 1) // 8 > width:
+            break
+        count = wider
+    hex_width = 3 * count - 1 + (count - 1) // 8
+
+    rows = -(-total // count)
+    shown = min(rows, truncate) if truncate else rows
+    lines = [f"{name}(nbytes={total})"]
+    for row in range(shown):
+        offset = row * count
+        chunk = data[offset:offset + count]
+        values = "  ".join(chunk[start:start + 8].hex(" ")
+                           for start in range(0, len(chunk), 8))
+        chars = chunk.tobytes().translate(_printable).decode("ascii")
+        lines.append(f"{offset:0{offset_width}x}  "
+                     f"{values:<{hex_width}}  |{chars}|")
+    if shown < rows:
+        lines.append("...")
+    return lines
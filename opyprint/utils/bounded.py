@@ -0,0 +1,131 @@
+import sys
+from decimal import MAX_EMAX, ROUND_DOWN, ROUND_UP, Decimal, localcontext
+from math import log10
+from typing import Tuple
+
+huge_length = 10000
+"""
+The length from which on strings are sliced to the part that can be
+displayed before they are formatted, and the number of digits from which on
+integers are summarized, when the interpreter's limit on the digits of
+integer-to-string conversions isn't lower.
+"""
+
+edge_digits = 10
+"""The number of leading and trailing digits of summarized integers."""
+
+# The minimal digit limit that the interpreter accepts is 640 digits, i.e.
+# more than 2100 bits:
+_min_bits = 2100
+
+
+def bound_text(text: str,
+               length: int,
+               total: int = None,
+               unit: str = "chars") -> str:
+    """
+    Slices the given text such that it fits the given length including an
+    ellipsis and an annotation with the total length, such as
+    ``"abc... (12000 chars)"``.
+
+    :param text: The text to slice.
+    :param length: The maximal length of the result.
+    :param total: The total length to annotate. Defaults to the length of the
+        text.
+    :param unit: The unit of the total length.
+    """
+    if total is None:
+        total = len(text)
+    suffix = f"... ({total} {unit})"
+    return text[:max(length - len(suffix), 0)] + suffix
+
+
+def is_huge_text(text) -> bool:
+    """
+    Checks if the given string or bytes-like object is longer than
+    :data:`huge_length`.
+    """
+    return len(text) > huge_length
+
+
+def max_int_digits() -> int:
+    """
+    Gets the number of digits from which on integers are summarized, i.e.
+    :data:`huge_length` or the interpreter's limit on the digits of
+    integer-to-string conversions, when it is lower.
+    """
+    get_limit = getattr(sys, "get_int_max_str_digits", None)
+    limit = get_limit() if get_limit is not None else 0
+    return min(limit, huge_length) if limit else huge_length
+
+
+def is_huge_int(value: int) -> bool:
+    """
+    Checks if the given integer has more than :func:`max_int_digits` digits,
+    without converting it to a string.
+    """
+    bits = value.bit_length()
+    if bits <= _min_bits:
+        return False
+    limit = max_int_digits()
+    # 'value' has at least 'floor((bits - 1) * log10(2)) + 1' digits and at
+    # most one digit more:
+    fewest = int((bits - 1) * log10(2)) + 1
+    if fewest > limit:
+        return True
+    if fewest < limit:
+        return False
+    return abs(value) >= 10 ** limit
+
+
+def bounded_str(obj) -> str:
+    """
+    Converts the given object to a string like :class:`str`, except that
+    integers with more than :func:`max_int_digits` digits are summarized, see
+    :func:`summarize_int`, as their conversion fails beyond the interpreter's
+    digits limit.
+    """
+    if isinstance(obj, int) and is_huge_int(obj):
+        return summarize_int(obj)
+    return str(obj)
+
+
+def summarize_int(value: int) -> str:
+    """
+    Summarizes the given integer as its leading and trailing digits and its
+    number of digits, such as ``"1234567890...0987654321 (20000 digits)"``,
+    without converting it to a string, which is quadratic in the number of
+    digits.
+    """
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+
+    # Enclose the value between two approximations from its leading bits:
+    shift = max(value.bit_length() - 128, 0)
+    with localcontext() as ctx:
+        ctx.Emax = MAX_EMAX
+        ctx.prec = edge_digits + 20
+        ctx.rounding = ROUND_DOWN
+        lower = _leading_digits(
+            Decimal(value >> shift) * Decimal(2) ** shift)
+        ctx.rounding = ROUND_UP
+        upper = _leading_digits(
+            Decimal((value >> shift) + bool(shift)) * Decimal(2) ** shift)
+    if lower != upper:
+        # The approximations differ, such as '99...' and '10...', so check
+        # whether the value reaches the upper one:
+        leading, digits = upper
+        if value < int(leading) * 10 ** (digits - edge_digits):
+            upper = lower
+    leading, digits = upper
+    if digits <= 2 * edge_digits:
+        return sign + str(value)
+
+    trailing = str(value % 10 ** edge_digits).zfill(edge_digits)
+    return f"{sign}{leading}...{trailing} ({digits} digits)"
+
+
+def _leading_digits(approx: Decimal) -> Tuple[str, int]:
+    """Gets the leading digits and the number of digits of the given value."""
+    leading = "".join(map(str, approx.as_tuple().digits[:edge_digits]))
+    return leading, approx.adjusted() + 1
@@ -0,0 +1,18 @@
+from typing import List, Sequence
+
+
+def align_columns(rows: Sequence[Sequence[str]],
+                  right: Sequence[bool]) -> List[str]:
+    """
+    Aligns the cells of the given rows in columns, separated by two spaces,
+    as used for plain-text tables.
+
+    :param rows: The rows of cells, including the header row, if any.
+    :param right: Whether each column is right-aligned, as for numbers,
+        rather than left-aligned.
+    :return: The lines of the table.
+    """
+    widths = [max(map(len, column)) for column in zip(*rows)]
+    return ["  ".join(cell.rjust(width) if is_right else cell.ljust(width)
+                      for cell, width, is_right in zip(row, widths, right))
+            for row in rows]
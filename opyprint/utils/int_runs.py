@@ -0,0 +1,87 @@
+from typing import List, Union
+
+from .bounded import bounded_str
+from .predicates import is_set
+
+min_run_length = 3
+"""The minimal length of a run of consecutive integers to be compressed."""
+
+vectorize_threshold = 1000
+"""The number of integers from which on the runs are detected with NumPy."""
+
+
+def is_int_collection(obj) -> bool:
+    """
+    Checks if the given object is a non-empty list, tuple or set of which all
+    items are integers (and not booleans), or a range.
+    """
+    if isinstance(obj, range):
+        return True
+    if not isinstance(obj, (list, tuple, set, frozenset)) or not obj:
+        return False
+    return set(map(type, obj)) == {int}
+
+
+def compress_ints(values, limit: int = 0) -> List[Union[int, str]]:
+    """
+    Compresses the runs of consecutive, increasing integers in the given
+    integer collection, such that ``[1, 2, 3, 5, 7, 8, 9, 10]`` becomes
+    ``[1..3, 5, 7..10]``, with the compressed runs as strings. Sets are sorted
+    first. Ranges with a step of 1 are compressed without iterating over them.
+
+    :param values: An integer collection, see :func:`is_int_collection`.
+    :param limit: When non-zero, no more than this number of parts plus one
+        are returned.
+    """
+    if isinstance(values, range):
+        if values.step == 1 and len(values) >= min_run_length:
+            return [f"{bounded_str(values.start)}.."
+                    f"{bounded_str(values.stop - 1)}"]
+        return list(values[:limit + 1] if limit else values)
+
+    if is_set(values):
+        values = sorted(values)
+
+    if len(values) >= vectorize_threshold:
+        try:
+            return _compress_vectorized(values, limit)
+        except OverflowError:
+            # The integers don't fit in 64 bits.
+            pass
+
+    parts: List[Union[int, str]] = []
+    start = 0
+    for index in range(1, len(values) + 1):
+        if index < len(values) and values[index] == values[index - 1] + 1:
+            continue
+        _append_run(parts, values, start, index)
+        if limit and len(parts) > limit:
+            break
+        start = index
+    return parts
+
+
+def _compress_vectorized(values, limit: int) -> List[Union[int, str]]:
+    import numpy as np
+
+    array = np.asarray(values, dtype=np.int64)
+    breaks = np.flatnonzero(np.diff(array) != 1) + 1
+    # Each run yields at least one part:
+    cuts = (breaks[:limit + 1] if limit else breaks).tolist()
+    starts = [0, *cuts]
+    ends = [*cuts, len(array)]
+
+    parts: List[Union[int, str]] = []
+    for start, end in zip(starts, ends):
+        _append_run(parts, values, start, end)
+        if limit and len(parts) > limit:
+            break
+    return parts
+
+
+def _append_run(parts: list, values, start: int, end: int) -> None:
+    if end - start >= min_run_length:
+        parts.append(f"{bounded_str(values[start])}.."
+                     f"{bounded_str(values[end - 1])}")
+    else:
+        parts.extend(values[start:end])
@@ -1,6 +1,12 @@
-from typing import Mapping
+from decimal import Decimal
+from numbers import Real
+from operator import itemgetter
+from typing import Any, Iterable, Mapping
+from weakref import WeakKeyDictionary
 
-from .predicates import is_dict
+from frozendict import FrozenDict
+
+from .predicates import is_dict, is_set
 
 
 def lt(obj_1, obj_2) -> bool:
@@ -40,3 +46,115 @@ def dict_lt(dct_1: Mapping, dct_2: Mapping) -> bool:
         return lt(values_1, values_2)
 
     return False
+
+
+# The ranks of the kinds of objects in the sort order of 'pp_sort_key':
+_NONE = 0
+_NUMBER = 1
+_STRING = 2
+_BYTES = 3
+_SEQUENCE = 4
+_SET = 5
+_DICT = 6
+_OTHER = 7
+
+_RANKS = {
+    type(None): _NONE,
+    bool: _NUMBER,
+    float: _NUMBER,
+    int: _NUMBER,
+    str: _STRING,
+    bytes: _BYTES,
+}
+
+# The sort keys of the frozendicts, which can't change:
+_frozendict_keys: "WeakKeyDictionary[FrozenDict, tuple]"
+_frozendict_keys = WeakKeyDictionary()
+
+
+def pp_sort_key(obj) -> tuple:
+    """
+    Gets a key for sorting heterogeneous collections, which orders the
+    objects by their kind first, i.e. None, numbers, strings, bytes, lists
+    and tuples, sets, dictionaries, and other objects by their type name,
+    and then by their values. Lists, tuples and sets are ordered by the keys
+    of their (sorted) elements. Dictionaries are ordered like by
+    :func:`dict_lt`, i.e. by their sorted keys and then by their values. The
+    other objects are compared normally, and are considered equal when they
+    can't be compared.
+
+    The key is computed once per object when sorting, instead of comparing
+    the objects pairwise like :func:`lt`, and it is cached for frozendicts.
+    """
+    kind = type(obj)
+    rank = _RANKS.get(kind)
+    if rank is not None:
+        return (rank, obj)
+    if isinstance(obj, (Real, Decimal)):
+        return (_NUMBER, obj)
+    if isinstance(obj, str):
+        return (_STRING, obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return (_BYTES, bytes(obj))
+    if isinstance(obj, (list, tuple)):
+        return (_SEQUENCE, tuple(map(pp_sort_key, obj)))
+    if is_set(obj):
+        return (_SET, tuple(sorted(map(pp_sort_key, obj))))
+    if isinstance(obj, FrozenDict):
+        try:
+            return _frozendict_keys[obj]
+        except KeyError:
+            key = _frozendict_keys[obj] = _dict_sort_key(obj)
+            return key
+        except TypeError:
+            # The frozendict has unhashable values.
+            return _dict_sort_key(obj)
+    if is_dict(obj):
+        return _dict_sort_key(obj)
+    return (_OTHER, kind.__qualname__, _Comparable(obj))
+
+
+def pp_sorted(items: Iterable) -> list:
+    """
+    Sorts the given items normally, or using :func:`pp_sort_key` when they
+    can't be compared with each other.
+    """
+    items = list(items)
+    # noinspection PyBroadException
+    try:
+        return sorted(items)
+    except Exception:
+        return sorted(items, key=pp_sort_key)
+
+
+def _dict_sort_key(dct: Mapping) -> tuple:
+    items = sorted(((pp_sort_key(key), value) for key, value in dct.items()),
+                   key=itemgetter(0))
+    return (_DICT,
+            tuple(key for key, _ in items),
+            tuple(pp_sort_key(value) for _, value in items))
+
+
+class _Comparable:
+    """
+    Wraps an object such that it can be compared with any other wrapped
+    object, which is considered equal when the objects can't be compared.
+    """
+
+    __slots__ = [
+        "obj",
+    ]
+
+    obj: Any
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, _Comparable):
+            return NotImplemented
+        # noinspection PyBroadException
+        try:
+            return bool(self.obj < other.obj)
+        except Exception:
+            return False
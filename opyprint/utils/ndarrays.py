@@ -0,0 +1,76 @@
+import sys
+from typing import List
+
+summary_threshold = 1000
+"""
+The number of elements from which on arrays are summarized, i.e. by their
+edge items and, for numeric arrays, their statistics, when not truncating.
+"""
+
+summary_edge_items = 3
+"""
+The number of items shown at the start and the end of each dimension of the
+summarized arrays, when not truncating.
+"""
+
+
+def is_ndarray(obj) -> bool:
+    """
+    Checks if the given object is a NumPy array, without importing NumPy when
+    it was not imported yet.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def format_ndarray(array, width: int, truncate: int = 0) -> List[str]:
+    """
+    Formats the given NumPy array as its shape and dtype, followed by the
+    min, max, mean and NaN count of large numeric arrays, and its (edge)
+    items, packed in lines of the given width. Only the edge items are
+    converted to strings and the statistics are computed by NumPy.
+
+    :param array: The array to format.
+    :param width: The maximal line width.
+    :param truncate: When non-zero, the number of elements from which on the
+        array is summarized, showing half this number of items at the start
+        and the end of each dimension. Defaults to :data:`summary_threshold`
+        and :data:`summary_edge_items`.
+    """
+    import numpy as np
+
+    threshold = truncate or summary_threshold
+    edge_items = max(truncate // 2, 1) if truncate else summary_edge_items
+    header = f"ndarray(shape={array.shape}, dtype={array.dtype})"
+    items = np.array2string(array,
+                            max_line_width=max(width, 10),
+                            threshold=threshold,
+                            edgeitems=edge_items,
+                            separator=", ")
+    lines = items.splitlines()
+
+    if array.size > threshold and array.dtype.kind in "biuf":
+        lines.insert(0, _statistics(np, array))
+    elif len(lines) == 1 and len(header) + 1 + len(lines[0]) <= width:
+        return [f"{header} {lines[0]}"]
+    return [header, *lines]
+
+
+def _statistics(np, array) -> str:
+    if array.dtype.kind == "b":
+        return f"true: {np.count_nonzero(array)}"
+
+    nans = 0
+    if array.dtype.kind == "f":
+        nans = int(np.count_nonzero(np.isnan(array)))
+    if nans == array.size:
+        return f"nan: {nans}"
+
+    spec = "g" if array.dtype.kind == "f" else ""
+    with np.errstate(all="ignore"):
+        stats = [f"min: {np.nanmin(array):{spec}}",
+                 f"max: {np.nanmax(array):{spec}}",
+                 f"mean: {np.nanmean(array, dtype=np.float64):g}"]
+    if array.dtype.kind == "f":
+        stats.append(f"nan: {nans}")
+    return ", ".join(stats)
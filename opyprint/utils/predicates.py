@@ -1,7 +1,11 @@
+from re import compile
 from typing import Generator
 
 from frozendict import FrozenDict
 
+# The line boundaries recognized by 'str.splitlines':
+_line_break = compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
 
 def is_dict(obj) -> bool:
     """Checks if the given object is either a dict or a frozendict."""
@@ -21,13 +25,16 @@ def is_tuple(obj) -> bool:
 def is_multiliner(txt) -> bool:
     """Checks if the given string contains newlines."""
     assert isinstance(txt, str)
-    return len(txt.splitlines()) > 1
+    # Only search up to the first line break, instead of splitting all lines:
+    match = _line_break.search(txt)
+    return match is not None and match.end() < len(txt)
 
 
 def is_oneliner(txt) -> bool:
     """Checks if the given string contains no newlines."""
     assert isinstance(txt, str)
-    return len(txt.splitlines()) == 1
+    match = _line_break.search(txt)
+    return match.end() == len(txt) if match else txt != ""
 
 
 BULLETTABLE_TYPES = (
@@ -42,6 +49,21 @@ BULLETTABLE_TYPES = (
 )
 
 
+SCALAR_TYPES = frozenset((
+    bool,
+    float,
+    int,
+))
+
+
+def is_scalar(obj) -> bool:
+    """
+    Checks if the given object is a boolean, float or integer, excluding
+    subclasses, which might customize their string representation.
+    """
+    return type(obj) in SCALAR_TYPES
+
+
 def is_bullettable(obj) -> bool:
     """
     Checks if the given object can be pretty-printed as a "bulletted" list
@@ -0,0 +1,231 @@
+from dataclasses import dataclass, fields, is_dataclass
+from operator import attrgetter
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from ..pp_spec import PPSpec
+from .bounded import bounded_str
+from .lt import pp_sorted
+from .predicates import is_dict
+
+
+class RecordAccessor:
+    """
+    The field names of a record class, i.e. a dataclass, a named tuple, an
+    attrs class, a class with ``__slots__`` or a class with a
+    :class:`~opyprint.pp_spec.PPSpec`, and a function that gets the values of
+    these fields from an instance, in one go.
+    """
+
+    __slots__ = [
+        "header_names",
+        "labels",
+        "names",
+        "spec",
+        "values",
+    ]
+
+    header_names: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    names: Tuple[str, ...]
+    spec: Optional[PPSpec]
+    values: Callable[[Any], Tuple]
+
+    def __init__(self,
+                 names: Tuple[str, ...],
+                 values: Callable = None,
+                 spec: PPSpec = None):
+        """
+        :param names: The names of the fields.
+        :param values: The function that gets the values of the fields from an
+            instance as a tuple. Defaults to an attribute getter.
+        :param spec: The formatting spec of the class, if any.
+        """
+        self.header_names = ()
+        self.labels = names
+        if spec is not None:
+            if spec.header:
+                # The attributes used in the replacement fields of the header:
+                self.header_names = tuple({
+                    field.split(".")[0].split("[")[0]: None
+                    for _, field, _, _ in Formatter().parse(spec.header)
+                    if field})
+            self.labels = tuple(field.label for field in spec.fields)
+        self.names = names
+        self.spec = spec
+        self.values = values or _attribute_getter(names)
+
+
+# The accessors per class, or None for classes that aren't record classes:
+_accessors: "WeakKeyDictionary[type, Optional[RecordAccessor]]"
+_accessors = WeakKeyDictionary()
+
+# A unique marker for the fields that are not set, such as unset slots:
+_unset = object()
+
+
+@dataclass
+class _Probe:
+    pass
+
+
+# The code of the repr methods generated by the dataclass decorator, which
+# wraps them all in the same recursion guard:
+_dataclass_repr_code = getattr(_Probe.__repr__, "__code__", None)
+
+
+def record_accessor(cls: type) -> Optional[RecordAccessor]:
+    """
+    Gets the cached accessor for the given class when it is a record class
+    without a custom string representation, or None.
+    """
+    try:
+        return _accessors[cls]
+    except KeyError:
+        accessor = _accessors[cls] = _make_accessor(cls)
+        return accessor
+    except TypeError:
+        # The class can't be weakly referenced.
+        return None
+
+
+def is_record(obj) -> bool:
+    """
+    Checks if the given object is an instance of a record class without a
+    custom string representation, see :func:`record_accessor`.
+    """
+    return record_accessor(type(obj)) is not None
+
+
+def is_namedtuple(obj) -> bool:
+    """Checks if the given object is a named tuple."""
+    return isinstance(obj, tuple) and hasattr(type(obj), "_fields")
+
+
+def record_items(obj, accessor: RecordAccessor) -> Dict[str, Any]:
+    """
+    Gets the field names and values of the given record, except for the
+    fields that are not set.
+    """
+    return {name: value
+            for name, value in zip(accessor.names, _values(obj, accessor))
+            if value is not _unset}
+
+
+def record_fields(obj) -> Optional[Tuple[Any, ...]]:
+    """
+    Gets the field names of the given record, i.e. the sorted keys of a dict,
+    see :func:`~opyprint.utils.pp_sorted`, or the fields of a record class, see
+    :func:`record_accessor`. Returns None when the object is not a record.
+    """
+    if is_dict(obj):
+        return tuple(pp_sorted(obj.keys()))
+    accessor = record_accessor(type(obj))
+    return accessor.names if accessor is not None else None
+
+
+def same_schema(obj, record) -> bool:
+    """
+    Checks if the given object is a record with the same fields as the given
+    record.
+    """
+    if type(obj) is not type(record):
+        return False
+    if is_dict(obj):
+        return obj.keys() == record.keys()
+    return True
+
+
+def record_labels(obj, names: Tuple[Any, ...]) -> Tuple[str, ...]:
+    """Gets the labels of the given fields of the given record."""
+    if is_dict(obj):
+        return tuple(map(bounded_str, names))
+    accessor = record_accessor(type(obj))
+    assert accessor is not None
+    return accessor.labels
+
+
+def record_values(obj, names: Tuple[Any, ...]) -> List[Any]:
+    """
+    Gets the values of the given fields of the given record. The values of
+    the fields that are not set are a unique marker object.
+    """
+    if is_dict(obj):
+        return [obj[name] for name in names]
+    accessor = record_accessor(type(obj))
+    assert accessor is not None
+    return list(_values(obj, accessor))
+
+
+def _values(obj, accessor: RecordAccessor) -> Tuple:
+    try:
+        return accessor.values(obj)
+    except AttributeError:
+        return tuple(getattr(obj, name, _unset) for name in accessor.names)
+
+
+def _attribute_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    """Compiles a function that gets the given attributes as a tuple."""
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return lambda obj: ()
+
+
+def _make_accessor(cls: type) -> Optional[RecordAccessor]:
+    spec = getattr(cls, "__pp_fields__", None)
+    if spec is not None:
+        spec = PPSpec.of(spec)
+        return RecordAccessor(tuple(field.name for field in spec.fields),
+                              spec=spec)
+
+    if (cls.__str__ is not object.__str__ or
+            callable(getattr(cls, "describe", None))):
+        return None
+
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        if not cls._fields:
+            return None
+        return RecordAccessor(tuple(cls._fields), tuple)
+
+    if is_dataclass(cls):
+        if (cls.__repr__ is not object.__repr__ and
+                getattr(cls.__repr__, "__code__", None) is not
+                _dataclass_repr_code):
+            # The class has a custom repr, or inherits one:
+            return None
+        names = tuple(field.name for field in fields(cls) if field.repr)
+    elif hasattr(cls, "__attrs_attrs__"):
+        names = tuple(attribute.name for attribute in cls.__attrs_attrs__
+                      if attribute.repr)
+    elif cls.__repr__ is object.__repr__:
+        names = _slot_names(cls)
+    else:
+        return None
+    return RecordAccessor(names) if names else None
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Gets the names of the slots of the given class and its bases, or an empty
+    tuple when any of them, except for 'object', has no ``__slots__``.
+    """
+    names: List[str] = []
+    for base in reversed(cls.__mro__[:-1]):
+        slots = vars(base).get("__slots__")
+        if slots is None:
+            return ()
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                # Private names are mangled:
+                name = f"_{base.__name__.lstrip('_')}{name}"
+            if name not in names:
+                names.append(name)
+    return tuple(names)
@@ -0,0 +1,48 @@
+from itertools import islice
+from math import exp, floor, log, log1p
+from random import Random
+from sys import maxsize
+from typing import Iterable, List
+
+# A unique marker for the end of the iteration:
+_end = object()
+
+
+def reservoir_sample(items: Iterable,
+                     count: int,
+                     rng: Random = None) -> List:
+    """
+    Gets a uniform random sample of the given number of items, in one pass
+    over the given items and keeping only the sampled items, using Vitter's
+    Algorithm L, which skips the items that are not sampled in bulk. All the
+    items are returned, in their order, when there are no more items than
+    the requested number.
+
+    :param items: The items to sample from.
+    :param count: The number of items to sample.
+    :param rng: The random number generator, for reproducible samples.
+    """
+    if rng is None:
+        rng = Random()
+    iterator = iter(items)
+    reservoir = list(islice(iterator, count))
+    if len(reservoir) < count or count <= 0:
+        return reservoir
+
+    weight = exp(log(_uniform(rng)) / count)
+    while weight < 1.0:
+        skip = floor(log(_uniform(rng)) / log1p(-weight))
+        item = next(islice(iterator, min(skip, maxsize), None), _end)
+        if item is _end:
+            break
+        reservoir[rng.randrange(count)] = item
+        weight *= exp(log(_uniform(rng)) / count)
+    return reservoir
+
+
+def _uniform(rng: Random) -> float:
+    """Gets a random number in the open interval (0, 1)."""
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
@@ -0,0 +1,57 @@
+from functools import lru_cache
+from textwrap import TextWrapper
+from typing import List
+
+
+@lru_cache(maxsize=256)
+def text_wrapper(width: int,
+                 subsequent_indent: str = "",
+                 max_lines: int = None) -> TextWrapper:
+    """
+    Gets a cached text wrapper with the given settings. The returned wrapper
+    is shared and should not be modified.
+    """
+    return TextWrapper(width=width,
+                       subsequent_indent=subsequent_indent,
+                       max_lines=max_lines)
+
+
+def wrap(text: str,
+         width: int,
+         subsequent_indent: str = "",
+         max_lines: int = None) -> List[str]:
+    """
+    Wraps the given text like :func:`textwrap.wrap`, using a cached wrapper.
+    When the number of lines is limited, only the part of the text that can
+    be displayed is processed.
+    """
+    if max_lines is not None:
+        text = _window(text, (max(max_lines, 1) + 2) * width)
+    return text_wrapper(width, subsequent_indent, max_lines).wrap(text)
+
+
+def shorten(text: str, width: int) -> str:
+    """
+    Shortens the given text like :func:`textwrap.shorten`, using a cached
+    wrapper and only processing the part of the text that can be displayed.
+    """
+    text = _window(text, 3 * width)
+    return text_wrapper(width, "", 1).fill(" ".join(text.strip().split()))
+
+
+def _window(text: str, visible: int) -> str:
+    """
+    Slices the given text such that it contains at least the given number of
+    non-whitespace characters plus two, when possible. Wrapping the sliced
+    text results in the same first lines as wrapping the whole text, as long
+    as these lines contain fewer non-whitespace characters, because words
+    that are cut by the slicing either start beyond these lines or are still
+    long enough to be broken in the same way.
+    """
+    size = visible + 2
+    while size < len(text):
+        window = text[:size]
+        if len(window) - sum(map(window.count, " \t\n\r\x0b\x0c")) > visible:
+            return window
+        size *= 2
+    return text
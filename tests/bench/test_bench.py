@@ -0,0 +1,13 @@
+# test_bench
+
+from pytest import importorskip, mark
+
+from opyprint.bench import default_cases
+
+importorskip("pytest_benchmark")
+
+
+@mark.parametrize("case", default_cases(), ids=lambda case: case.name)
+def test_case(benchmark, case):
+    benchmark.group = "opyprint"
+    benchmark(case.func)
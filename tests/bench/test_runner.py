@@ -0,0 +1,60 @@
+# test_runner
+
+from pytest import raises
+
+from opyprint.bench import (
+    BenchCase, compare, default_cases, format_comparison, load_results, run,
+    save_results,
+)
+from opyprint.bench.__main__ import main
+
+
+def results(**timings):
+    return {"meta": {},
+            "cases": {name: {"min": value, "median": value, "number": 1}
+                      for name, value in timings.items()}}
+
+
+def test_default_cases():
+    cases = default_cases()
+    assert len({case.name for case in cases}) == len(cases)
+    for case in cases:
+        case.func()
+
+
+def test_run_and_save(tmp_path):
+    case = BenchCase("noop", lambda: None)
+    res = run([case], min_time=0.001, repeat=2)
+    timings = res["cases"]["noop"]
+    assert timings["repeat"] == 2
+    assert 0.0 <= timings["min"] <= timings["median"]
+    assert "python" in res["meta"]
+
+    path = str(tmp_path / "results.json")
+    save_results(res, path)
+    assert load_results(path) == res
+
+
+def test_compare():
+    comparisons = compare(results(a=1.0, b=1.0, c=1.0, d=1.0),
+                          results(a=1.05, b=1.5, c=0.5, e=1.0),
+                          threshold=0.1)
+    assert [(c.name, c.status) for c in comparisons] == [
+        ("a", "ok"), ("b", "REGRESSION"), ("c", "improved"),
+        ("d", "missing"), ("e", "new")]
+    table = format_comparison(comparisons).splitlines()
+    assert table[0].split() == ["case", "baseline", "current", "ratio",
+                                "status"]
+    assert table[2].split()[-2:] == ["1.50x", "REGRESSION"]
+
+    with raises(ValueError):
+        compare(results(), results(), threshold=-1)
+
+
+def test_main_compare(tmp_path):
+    baseline = str(tmp_path / "baseline.json")
+    current = str(tmp_path / "current.json")
+    save_results(results(a=1.0), baseline)
+    save_results(results(a=1.2), current)
+    assert main(["compare", baseline, current, "-t", "0.5"]) == 0
+    assert main(["compare", baseline, current, "-t", "0.1"]) == 1
@@ -0,0 +1,103 @@
+# test_flight_recorder_logger
+
+import json
+import sys
+from io import StringIO
+
+from pytest import raises
+
+from opyprint.logger import FlightRecorderLogger, LoggedMixin, Logger
+
+
+def test_records_without_output():
+    sys.stdout = StringIO()
+    logger = FlightRecorderLogger(Logger.TRACE, capacity=3)
+    logger.trace("msg-1")
+    logger.info("key", [1, 2])
+    output = sys.stdout.getvalue()
+    sys.stdout = sys.__stdout__
+    assert output == ""
+    assert len(logger) == 2
+    assert logger.dump(styled=False) == "msg-1\nkey: [1, 2]"
+
+
+def test_ring_buffer():
+    logger = FlightRecorderLogger(Logger.DEBUG, capacity=3)
+    for i in range(5):
+        logger.debug(f"msg-{i}")
+    assert len(logger) == 3
+    assert logger.dump(styled=False, clear=True) == "msg-2\nmsg-3\nmsg-4"
+    assert len(logger) == 0
+    assert logger.dump() == ""
+
+    with raises(ValueError):
+        FlightRecorderLogger(capacity=0)
+
+
+def test_max_bytes():
+    logger = FlightRecorderLogger(Logger.INFO, max_bytes=sys.getsizeof("a"))
+    logger.info("a")
+    logger.info("b")
+    assert len(logger) == 1
+    assert logger.dump() == "b"
+
+
+def test_level_and_indentation():
+    logger = FlightRecorderLogger(Logger.TRACE)
+    logger.debug("skipped")
+    logger.info("L1")
+    with logger.indent():
+        logger.info("L2")
+    assert logger.dump() == "L1\n  L2"
+
+
+def test_snapshot():
+    values = [1, 2]
+    logger = FlightRecorderLogger(Logger.INFO, snapshot=True)
+    logger.info("values", values)
+    values.append(3)
+    assert logger.dump() == "values: [1, 2]"
+
+
+def test_logged_mixin():
+    class Target(LoggedMixin):
+        __slots__ = ["_logger"]
+
+        def run(self):
+            self.info("running")
+
+    logger = FlightRecorderLogger(Logger.INFO)
+    Target(logger).run()
+    string_io = StringIO()
+    logger.dump(file=string_io)
+    assert string_io.getvalue() == "running\n"
+
+
+def test_dump_on_exception():
+    calls = []
+    ori_excepthook = sys.excepthook
+    sys.excepthook = lambda *args: calls.append(args)
+    string_io = StringIO()
+    logger = FlightRecorderLogger(Logger.INFO)
+    logger.dump_on_exception(file=string_io)
+    logger.info("before the crash")
+    try:
+        sys.excepthook(ValueError, ValueError("boom"), None)
+    finally:
+        logger.uninstall()
+        sys.excepthook = ori_excepthook
+    assert string_io.getvalue() == "before the crash\n"
+    assert len(calls) == 1
+    assert len(logger) == 0
+
+
+def test_json_lines():
+    logger = FlightRecorderLogger(Logger.INFO, json_lines=True, name="rec")
+    logger.info("L1")
+    with logger.indent():
+        logger.info("key", {"a": 1})
+    records = [json.loads(line) for line in logger.dump().splitlines()]
+    assert [record["depth"] for record in records] == [0, 1]
+    assert [record["args"] for record in records] == [["L1"],
+                                                      ["key", {"a": 1}]]
+    assert records[0]["logger"] == "rec"
@@ -1,5 +1,9 @@
 # test_logger
 
+import json
+import sys
+from io import StringIO
+
 from opyprint import print  # noqa: F401
 from opyprint.logger import Logger, LoggerBase, PrintLogger
 
@@ -25,3 +29,31 @@ def test_print_logger():
     assert logger.level == PrintLogger.INFO
 
     # logger.debug("test-msg")
+
+
+def test_print_logger_json_lines():
+    sys.stdout = StringIO()
+    logger = PrintLogger(PrintLogger.TRACE, json_lines=True, name="main")
+    logger.trace("msg", [1, 2])
+    with logger.indent():
+        logger.info("indented")
+    logger.debug("skipped")
+    result = sys.stdout.getvalue()
+    sys.stdout = sys.__stdout__
+    records = [json.loads(line) for line in result.splitlines()]
+    assert [record["level"] for record in records] == ["trace", "info"]
+    assert [record["depth"] for record in records] == [0, 1]
+    assert [record["logger"] for record in records] == ["main", "main"]
+    assert [record["args"] for record in records] == [["msg", [1, 2]],
+                                                      ["indented"]]
+
+
+def test_print_logger_max_depth():
+    sys.stdout = StringIO()
+    logger = PrintLogger(PrintLogger.TRACE, max_depth=1)
+    logger.info("msg", {"a": [1, 2], "b": 1})
+    result = sys.stdout.getvalue()
+    sys.stdout = sys.__stdout__
+    assert result == ("msg:\n"
+                      "  - a: […2 items]\n"
+                      "  - b: 1\n")
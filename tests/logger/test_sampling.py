@@ -0,0 +1,149 @@
+# test_sampling
+
+from pytest import raises
+
+from opyprint.logger import (
+    Deduplicate, EveryNth, FlightRecorderLogger, LoggedMixin, Logger,
+    Probabilistic, TokenBucket,
+)
+
+
+def test_every_nth():
+    logger = FlightRecorderLogger(Logger.TRACE, sampling=EveryNth(3))
+    for i in range(7):
+        logger.trace(f"a-{i}")
+        logger.trace(f"b-{i}")
+    assert logger.dump(styled=False) == "a-0\nb-0\na-3\nb-3\na-6\nb-6"
+    assert logger.suppressed == {"dedupe": 0, "sampling": 8}
+
+    with raises(ValueError):
+        EveryNth(0)
+
+
+def test_sampling_after_level_check():
+    logger = FlightRecorderLogger(Logger.INFO, sampling=EveryNth(2))
+    for i in range(4):
+        logger.trace("skipped")
+        logger.info(f"msg-{i}")
+    assert logger.dump(styled=False) == "msg-0\nmsg-2"
+    assert logger.sampling.suppressed == 2
+
+
+def test_probabilistic():
+    logger_1 = FlightRecorderLogger(sampling=Probabilistic(0.5, seed=1))
+    logger_2 = FlightRecorderLogger(sampling=Probabilistic(0.5, seed=1))
+    for logger in (logger_1, logger_2):
+        for i in range(100):
+            logger.trace(i)
+    assert 20 < len(logger_1) < 80
+    assert logger_1.dump(styled=False) == logger_2.dump(styled=False)
+    assert logger_1.suppressed["sampling"] == 100 - len(logger_1)
+
+    with raises(ValueError):
+        Probabilistic(1.5)
+
+
+def test_token_bucket():
+    now = [0.0]
+    logger = FlightRecorderLogger(
+        sampling=TokenBucket(2, clock=lambda: now[0]))
+    for i in range(10):
+        now[0] = i * 0.1
+        logger.trace(i)
+    assert logger.dump(styled=False) == "0\n1\n5"
+
+
+def test_dedupe():
+    logger = FlightRecorderLogger(Logger.TRACE, dedupe=True)
+    for i in range(3):
+        logger.trace("same", [1])
+    logger.trace("other")
+    logger.trace("other")
+    logger.trace("last")
+    assert logger.dump(styled=False) == """same: [1]
+[previous message repeated 2 times]
+other
+[previous message repeated 1 time]
+last"""
+    assert logger.suppressed == {"dedupe": 3, "sampling": 0}
+
+    logger.dedupe = False
+    assert not logger.dedupe
+    assert logger.suppressed == {"dedupe": 0, "sampling": 0}
+
+
+def test_dedupe_changed_container():
+    logger = FlightRecorderLogger(Logger.TRACE, dedupe=True)
+    items = [1]
+    logger.trace("items", items)
+    items.append(2)
+    logger.trace("items", items)
+    items[1] = {"a": [3]}
+    logger.trace("items", items)
+    items[1]["a"].append(4)
+    logger.trace("items", items)
+    logger.trace("items", items)
+    assert len(logger) == 4
+    assert logger.suppressed["dedupe"] == 1
+
+
+def test_dedupe_cyclic_and_deep_container():
+    logger = FlightRecorderLogger(Logger.TRACE, dedupe=True)
+    items: list = [1]
+    items.append(items)
+    logger.trace("items", items)
+    logger.trace("items", items)
+    items.append(2)
+    logger.trace("items", items)
+    nested: list = []
+    for _ in range(3000):
+        nested = [nested]
+    logger.trace("nested", nested)
+    logger.trace("nested", nested)
+    # Including the summary of the suppressed repeat:
+    assert len(logger) == 4
+    assert logger.suppressed["dedupe"] == 2
+
+
+def test_dedupe_failing_comparison():
+    class Alpha:
+        def __eq__(self, other):
+            raise RuntimeError("boom")
+
+    logger = FlightRecorderLogger(Logger.TRACE, dedupe=True)
+    logger.trace("alpha", Alpha())
+    logger.trace("alpha", Alpha())
+    assert len(logger) == 2
+
+
+def test_dedupe_pending_repeats():
+    logger = FlightRecorderLogger(Logger.TRACE, dedupe=True)
+    for i in range(3):
+        logger.trace("same")
+    assert logger.dump(styled=False) == """same
+[previous message repeated 2 times]"""
+    logger.trace("same")
+    logger.reset()
+    logger.close()
+    assert logger.dump(styled=False, clear=True).endswith("""
+[previous message repeated 1 time]""")
+
+
+def test_logged_mixin():
+    class Target(LoggedMixin):
+        __slots__ = ["_logger"]
+
+        log_sampling = Deduplicate()
+
+        def run(self):
+            for i in range(5):
+                self.info("running")
+            self.debug("filtered")
+            self.info("done")
+
+    logger = FlightRecorderLogger(Logger.TRACE)
+    Target(logger).run()
+    assert logger.dump(styled=False) == """running
+[previous message repeated 4 times]
+done"""
+    assert Target.log_sampling.suppressed == 4
@@ -0,0 +1,108 @@
+# test_span
+
+import re
+
+from opyprint import PPContext
+from opyprint.logger import FlightRecorderLogger, Logger, VoidLogger
+from opyprint.logger.span import SpanEntry, SpanStats, format_duration
+
+
+def test_span_context_manager():
+    logger = FlightRecorderLogger(Logger.TRACE)
+    with logger.span("outer"):
+        logger.trace("working")
+        with logger.span("inner"):
+            pass
+    result = logger.dump(styled=False)
+    pattern = r"""outer
+  working
+  inner
+  inner: \S+ \S+ \(cpu \S+ \S+\)
+outer: \S+ \S+ \(cpu \S+ \S+\)"""
+    assert re.fullmatch(pattern, result), result
+    assert logger.indent_depth == 0
+    assert "outer" in logger.span_stats
+    assert "outer/inner" in logger.span_stats
+    assert logger.span_stats["outer/inner"].count == 1
+
+
+def test_span_decorator():
+    logger = FlightRecorderLogger(Logger.INFO)
+
+    @logger.span("step", level=Logger.INFO)
+    def step(value):
+        return value * 2
+
+    assert [step(i) for i in range(3)] == [0, 2, 4]
+    assert logger.span_stats["step"].count == 3
+    assert len(logger) == 6
+
+
+def test_disabled_span():
+    logger = FlightRecorderLogger(Logger.INFO)
+
+    @logger.span("step")
+    def step():
+        logger.info("in step")
+
+    step()
+    with logger.span("block"):
+        pass
+    assert logger.dump() == "in step"
+    assert len(logger.span_stats) == 0
+
+    void_logger = VoidLogger()
+    with void_logger.span("block"):
+        pass
+    assert void_logger.span("step")(step) is step
+
+
+def test_span_stats():
+    stats = SpanStats()
+    for i in range(1, 101):
+        stats.add("a", i / 1000, 0.0)
+    stats.add("a/b", 0.5, 0.25)
+    entry = stats["a"]
+    assert entry.count == 100
+    assert entry.max == 0.1
+    assert entry.percentile(50) == 0.05
+    assert entry.percentile(95) == 0.095
+    result = PPContext(width=120).format(stats)
+    assert result == (
+        "Span timings:\n"
+        "- a: 100 calls, total 5.050 s, cpu 0.0 µs, p50 50.000 ms, "
+        "p95 95.000 ms, max 100.000 ms\n"
+        "  - b: 1 calls, total 500.000 ms, cpu 250.000 ms, p50 500.000 ms, "
+        "p95 500.000 ms, max 500.000 ms")
+
+
+def test_span_stats_slashed_names():
+    logger = FlightRecorderLogger(Logger.TRACE)
+    with logger.span("a"):
+        with logger.span("b/c"):
+            pass
+    with logger.span("a/b"):
+        pass
+    result = PPContext(width=120).format(logger.span_stats)
+    assert re.fullmatch(r"Span timings:\n"
+                        r"- a: 1 calls.*\n"
+                        r"  - b/c: 1 calls.*\n"
+                        r"- a/b: 1 calls.*", result), result
+
+
+def test_span_entry_reservoir():
+    SpanEntry.max_samples = 10
+    try:
+        stats = SpanStats()
+        for i in range(100):
+            stats.add("a", i, 0.0)
+        assert len(stats["a"].samples) == 10
+        assert stats["a"].count == 100
+    finally:
+        SpanEntry.max_samples = 1000
+
+
+def test_format_duration():
+    assert format_duration(1.5) == "1.500 s"
+    assert format_duration(0.0125) == "12.500 ms"
+    assert format_duration(0.0000125) == "12.5 µs"
@@ -0,0 +1,79 @@
+# test_traced
+
+import re
+
+from pytest import raises
+
+from opyprint.logger import FlightRecorderLogger, LoggedMixin, Logger, traced
+
+
+class Calculator(LoggedMixin):
+    __slots__ = ["_logger"]
+
+    @traced
+    def add(self, b, a):
+        self.trace("adding")
+        return a + b
+
+    @traced(truncate=2)
+    def items(self, *values, scale=1):
+        return [value * scale for value in values]
+
+    @traced
+    def fail(self):
+        raise ValueError("boom")
+
+
+def test_traced():
+    logger = FlightRecorderLogger(Logger.TRACE)
+    calculator = Calculator(logger)
+    assert calculator.add(1, 2) == 3
+    result = logger.dump(styled=False, clear=True)
+    pattern = r"""call Calculator.add:
+  - b: 1
+  - a: 2
+  adding
+return Calculator.add \(\S+ \S+\): 3"""
+    assert re.fullmatch(pattern, result), result
+
+    assert calculator.items(1, 2, 3, scale=2) == [2, 4, 6]
+    result = logger.dump(styled=False, clear=True)
+    pattern = r"""call Calculator.items:
+  - \*args: \(1, 2, \.\.\.\)
+  - scale: 2
+return Calculator.items \(\S+ \S+\): \[2, 4, \.\.\.\]"""
+    assert re.fullmatch(pattern, result), result
+
+    with raises(ValueError):
+        calculator.fail()
+    result = logger.dump(styled=False, clear=True)
+    pattern = r"""call Calculator.fail\(\)
+raise Calculator.fail \(\S+ \S+\): ValueError\('boom'\)"""
+    assert re.fullmatch(pattern, result), result
+
+
+def test_traced_disabled():
+    logger = FlightRecorderLogger(Logger.INFO)
+    calculator = Calculator(logger)
+    assert calculator.add.__func__ is Calculator.__dict__["add"]._func
+    assert calculator.add(1, 2) == 3
+    assert len(logger) == 0
+    assert Calculator.add.__name__ == "add"
+
+
+def test_trace_methods_option():
+    class Target(LoggedMixin, trace_methods=True):
+        __slots__ = ["_logger"]
+
+        def run(self):
+            return self._helper()
+
+        def _helper(self):
+            return "done"
+
+    logger = FlightRecorderLogger(Logger.TRACE)
+    assert Target(logger).run() == "done"
+    result = logger.dump(styled=False)
+    pattern = r"""call Target.run\(\)
+return Target.run \(\S+ \S+\): done"""
+    assert re.fullmatch(pattern, result), result
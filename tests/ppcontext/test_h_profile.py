@@ -0,0 +1,53 @@
+# test_h_profile
+
+from opyprint import PPContext
+from opyprint.profiler import Profiler
+
+
+class Alpha:
+    def __str__(self, ppc: PPContext = None):
+        ppc = ppc or PPContext()
+        ppc("An Alpha object", [1, [2]])
+        return ppc.flush()
+
+
+class Beta:
+    def describe(self):
+        return "A Beta object"
+
+
+def test_profile():
+    ppc = PPContext(width=40)
+    with ppc.profile() as prof:
+        assert isinstance(prof, Profiler)
+        ppc({"alpha": Alpha(),
+             "beta": Beta(),
+             "values": [(i, i) for i in range(20)]})
+        ppc.flush()
+    assert ppc._profiler is None
+
+    assert prof["dict"].calls >= 1
+    assert prof["Alpha.__str__"].calls >= 1
+    assert prof["Beta.describe"].calls >= 1
+    assert "list [one-liner]" in prof
+    assert "list [one-liner, discarded]" in prof
+    assert "tuple [scalars]" in prof
+    for label, entry in prof.items():
+        assert 0.0 <= entry.exclusive <= entry.inclusive + 1e-9
+
+    # The inclusive time of the outer dict covers the nested calls:
+    assert prof["dict"].inclusive >= prof["Alpha.__str__"].inclusive
+    assert abs(prof.total - prof["dict"].inclusive) < 1e-3
+
+
+def test_profile_table():
+    ppc = PPContext()
+    with ppc.profile() as prof:
+        ppc.format([1, 2])
+    lines = str(prof).splitlines()
+    assert lines[0].startswith("Formatting profile (")
+    assert lines[1].split() == ["type", "calls", "inclusive", "exclusive",
+                                "%"]
+    assert [line.split()[:2] for line in lines[2:]] == [["list", "1"],
+                                                        ["list", "[scalars]"]]
+    assert str(Profiler()) == "No formatting calls profiled."
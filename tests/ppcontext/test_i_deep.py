@@ -0,0 +1,90 @@
+# test_i_deep
+
+import sys
+from time import perf_counter
+
+from opyprint import PPContext
+
+
+def nested_lists(depth: int):
+    obj: object = 1
+    for _ in range(depth):
+        obj = [obj, "x"]
+    return obj
+
+
+def nested_dicts(depth: int):
+    obj: object = 1
+    for _ in range(depth):
+        obj = {"a": obj, "b": 2}
+    return obj
+
+
+def single_item_chain(depth: int, leaf):
+    obj: object = leaf
+    for index in range(depth):
+        obj = [obj] if index % 2 else {"key": obj}
+    return obj
+
+
+def test_nested():
+    ppc = PPContext(width=30)
+    result = ppc.format({"a": {"b": {"c": [1, [2, [3, "x"]]]}}})
+    # print("\n" + result)
+    assert result == ("a:\n"
+                      "  b:\n"
+                      "    c: [1, [2, [3, x]]]")
+
+
+def test_deeper_than_recursion_limit():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        result = PPContext().format(nested_lists(300))
+        lines = result.splitlines()
+        assert len(lines) == 301
+        assert lines[0].startswith("- - - - ")
+        assert lines[0].endswith(" - 1")
+        assert lines[-1] == "- x"
+
+        result = PPContext().format(nested_dicts(300))
+        lines = result.splitlines()
+        assert lines[:2] == ["- a:", "    - a:"]
+        assert lines[-1] == "- b: 2"
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_deep_single_items():
+    # The bracketed oneliners of nested single items don't fit the width, but
+    # are tried once per level only, instead of once per layout per level:
+    start = perf_counter()
+    result = PPContext().format([single_item_chain(60, 1)])
+    assert result.startswith("- - key:\n      - key:\n          - key:\n")
+    nested: object = 1
+    for _ in range(60):
+        nested = [nested]
+    assert PPContext().format(nested) == "- " * 60 + "1"
+    PPContext().format(single_item_chain(60, "x" * 150))
+    assert perf_counter() - start < 2.0
+
+
+def test_deep_wrapped_text():
+    ppc = PPContext(width=12)
+    result = ppc.format({"key": {"key": {"key": "some text here"}}})
+    # print("\n" + result)
+    assert result == ("key:\n"
+                      "  key:\n"
+                      "    key:\n"
+                      "      some\n"
+                      "      text\n"
+                      "      here")
+
+    # Text that is indented beyond the width is wrapped at single characters:
+    result = PPContext(width=4).format([[["abc", "de"]]])
+    # print("\n" + result)
+    assert result == ("- - - a\n"
+                      "      b\n"
+                      "      c\n"
+                      "    - d\n"
+                      "      e")
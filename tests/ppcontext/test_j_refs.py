@@ -0,0 +1,124 @@
+# test_j_refs
+
+from typing import List
+
+import pytest
+
+from opyprint import PPContext
+
+
+class Node:
+    def __init__(self, name: str, parent: "Node" = None):
+        self.name = name
+        self.parent = parent
+        self.children: List[Node] = []
+        if parent:
+            parent.children.append(self)
+
+    def __str__(self, ppc: PPContext = None):
+        ppc = ppc or PPContext()
+        ppc(f"Node {self.name}")
+        with ppc.indent():
+            ppc("parent", self.parent)
+            ppc("children", self.children)
+        return ppc.flush()
+
+
+def test_cycles():
+    lst = [1, 2]
+    lst.append(lst)
+    result = PPContext().format(lst)
+    # print("\n" + result)
+    assert result == "[1, 2, <cycle: list>]"
+
+    dct = {"x": 1}
+    dct["self"] = dct
+    result = PPContext().format(dct)
+    # print("\n" + result)
+    assert result == ("- self: <cycle: dict>\n"
+                      "- x: 1")
+
+
+def test_cycles_str():
+    root = Node("root")
+    Node("child", root)
+    result = PPContext().format(root)
+    # print("\n" + result)
+    assert result == ("Node root\n"
+                      "  parent: None\n"
+                      "  children:\n"
+                      "    - Node child\n"
+                      "        parent: <cycle: Node>\n"
+                      "        children: []")
+
+
+def test_repeated_without_shared_refs():
+    shared = [1, 2]
+    result = PPContext().format({"a": shared, "b": shared})
+    # print("\n" + result)
+    assert result == ("- a: [1, 2]\n"
+                      "- b: [1, 2]")
+
+
+def test_shared_refs():
+    shared = {"name": "shared", "values": [1, 2, 3]}
+    ppc = PPContext(shared_refs=True)
+    result = ppc.format({"a": shared, "b": shared, "c": [shared, shared]})
+    # print("\n" + result)
+    assert result == ("- a:\n"
+                      "    #1\n"
+                      "    - name: shared\n"
+                      "    - values: [1, 2, 3]\n"
+                      "- b: <see #1>\n"
+                      "- c: [<see #1>, <see #1>]")
+
+    # Repeated immutable values are not tracked:
+    result = ppc.format([1, 1, "x", "x"])
+    assert result == "[1, 1, x, x]"
+
+
+def test_shared_refs_cycles():
+    lst = [1, 2]
+    lst.append(lst)
+    result = PPContext(shared_refs=True).format(lst)
+    # print("\n" + result)
+    assert result == "#1 [1, 2, <see #1>]"
+
+    root = Node("root")
+    Node("child", root)
+    result = PPContext(shared_refs=True).format(root)
+    # print("\n" + result)
+    assert result == ("#1\n"
+                      "Node root\n"
+                      "  parent: None\n"
+                      "  children:\n"
+                      "    - Node child\n"
+                      "        parent: <see #1>\n"
+                      "        children: []")
+
+
+def test_shared_refs_dag():
+    # Each layer refers twice to each node of the next layer:
+    layer = [[0], [1]]
+    for _ in range(30):
+        layer = [[layer[0], layer[1]], [layer[1], layer[0]]]
+
+    result = PPContext(shared_refs=True).format(layer)
+    assert result.count("<see #") == 2 * 30
+    assert len(result) < 100 * 30
+
+
+def test_repeated_generator():
+    # The items of a generator are kept for formatting it again:
+    for shared_refs in [False, True]:
+        gen = (i for i in range(3))
+        ppc = PPContext(shared_refs=shared_refs)
+        result = ppc.format({"a": gen, "b": [gen]})
+        # print("\n" + result)
+        assert result == ("- a: [0, 1, 2]\n"
+                          "- b: [[0, 1, 2]]")
+
+
+def test_shared_refs_type():
+    with pytest.raises(TypeError):
+        PPContext(shared_refs=1)
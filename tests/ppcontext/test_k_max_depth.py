@@ -0,0 +1,63 @@
+# test_k_max_depth
+
+import pytest
+
+from opyprint import PPContext, format
+
+
+class Counted(list):
+    """A list that counts how often it is iterated over."""
+
+    iterations = 0
+
+    def __iter__(self):
+        Counted.iterations += 1
+        return super().__iter__()
+
+
+def test_max_depth():
+    data = {"a": {"b": {"c": 1}},
+            "l": [1, [2, [3]]],
+            "s": {1, 2},
+            "t": (1, (2,))}
+    result = PPContext(max_depth=1).format(data)
+    # print("\n" + result)
+    assert result == ("- a: {…1 key}\n"
+                      "- l: […2 items]\n"
+                      "- s: {…2 items}\n"
+                      "- t: (…2 items)")
+
+    result = PPContext(max_depth=2).format(data)
+    # print("\n" + result)
+    assert result == ("- a:\n"
+                      "    b: {…1 key}\n"
+                      "- l: [1, […2 items]]\n"
+                      "- s: {1, 2}\n"
+                      "- t: (1, (…1 item))")
+
+    # The top-level containers are always formatted:
+    assert PPContext(max_depth=1).format([1, 2]) == "[1, 2]"
+    assert PPContext(max_depth=1).format("key", [1, 2]) == "key: [1, 2]"
+
+
+def test_max_depth_not_iterated():
+    Counted.iterations = 0
+    big = Counted(range(3000))
+    gen = (i for i in range(3))
+    result = PPContext(max_depth=1).format({"big": big, "gen": gen})
+    # print("\n" + result)
+    assert result == ("- big: […3000 items]\n"
+                      "- gen: […]")
+    assert Counted.iterations == 0
+    assert next(gen) == 0
+
+
+def test_max_depth_format():
+    result = format([[1, 2], [3]], max_depth=1)
+    assert result == "[[…2 items], […1 item]]"
+    assert format() == ""
+
+
+def test_max_depth_type():
+    with pytest.raises(TypeError):
+        PPContext(max_depth="1")
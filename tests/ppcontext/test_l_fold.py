@@ -0,0 +1,52 @@
+# test_l_fold
+
+import pytest
+
+from opyprint import PPContext
+
+
+def test_fold_runs():
+    ppc = PPContext(fold_runs=True)
+    assert ppc.format([0] * 5000 + [1]) == "[0 ×5000, 1]"
+    assert ppc.format((1, 1, 2)) == "(1 ×2, 2)"
+    assert ppc.format([1, 2, 3]) == "[1, 2, 3]"
+    # Equal items of a different type are not folded:
+    assert ppc.format([1, 1.0, True]) == "[1, 1.0, True]"
+    # Sets and dicts are not folded:
+    assert ppc.format({1: 1, 2: 1}) == "- 1: 1\n- 2: 1"
+
+    assert PPContext().format([0] * 3) == "[0, 0, 0]"
+
+
+def test_fold_runs_bulleted():
+    item = {"a": "x" * 30, "b": "y" * 30}
+    result = PPContext(fold_runs=True).format([item] * 3 + [[1, 2]] * 2)
+    # print("\n" + result)
+    assert result == ("- - a: xxxxxxxxxxxxxxxxxxxxxxxxxxxxxx\n"
+                      "  - b: yyyyyyyyyyyyyyyyyyyyyyyyyyyyyy\n"
+                      "  ×3\n"
+                      "- [1, 2] ×2")
+
+
+def test_fold_runs_truncate():
+    ppc = PPContext(fold_runs=True, truncate=3)
+    assert ppc.format([1, 1, 2, 3, 3, 3, 4, 5]) == "[1 ×2, 2, 3 ×3, ...]"
+    assert ppc.format([7] * 1000) == "[7 ×1000]"
+
+
+def test_fold_runs_incomparable():
+    class Incomparable:
+        def __eq__(self, other):
+            raise ValueError("Incomparable")
+
+        def __repr__(self):
+            return "I"
+
+    items = [Incomparable(), Incomparable()]
+    assert PPContext(fold_runs=True).format(items) == "[I, I]"
+    assert PPContext(fold_runs=True).format(items[:1] * 2) == "[I ×2]"
+
+
+def test_fold_runs_type_error():
+    with pytest.raises(TypeError):
+        PPContext(fold_runs=1)
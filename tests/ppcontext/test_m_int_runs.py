@@ -0,0 +1,32 @@
+# test_m_int_runs
+
+import pytest
+
+from opyprint import PPContext
+
+
+def test_int_runs():
+    ppc = PPContext(int_runs=True)
+    values = [*range(1, 501), 502, *range(510, 901)]
+    assert ppc.format(values) == "[1..500, 502, 510..900]"
+    assert ppc.format(set(values)) == "{1..500, 502, 510..900}"
+    assert ppc.format(tuple(values)) == "(1..500, 502, 510..900)"
+    assert ppc.format(range(10 ** 15)) == f"[0..{10 ** 15 - 1}]"
+    assert ppc.format([1, 2, 3, True]) == "[1, 2, 3, True]"
+
+    assert PPContext().format([1, 2, 3]) == "[1, 2, 3]"
+
+
+def test_int_runs_truncate():
+    ppc = PPContext(int_runs=True, truncate=2)
+    assert ppc.format([1, 2, 3, 5, 7, 8, 9, 11]) == "[1..3, 5, ...]"
+    assert ppc.format(range(0, 10 ** 15, 5)) == "[0, 5, ...]"
+
+
+def test_truncate_range():
+    assert PPContext(truncate=3).format(range(10)) == "[0, 1, 2, ...]"
+
+
+def test_int_runs_type_error():
+    with pytest.raises(TypeError):
+        PPContext(int_runs=1)
@@ -0,0 +1,51 @@
+# test_n_ndarray
+
+import sys
+
+import numpy as np
+
+from opyprint import PPContext
+from opyprint.utils import is_ndarray
+
+
+def test_is_ndarray():
+    assert "numpy" in sys.modules
+    assert is_ndarray(np.arange(3))
+    assert not is_ndarray([0, 1, 2])
+
+
+def test_small_ndarray():
+    ppc = PPContext()
+    assert ppc.format(np.arange(5)) == \
+        "ndarray(shape=(5,), dtype=int64) [0, 1, 2, 3, 4]"
+    assert ppc.format({"a": np.array([], dtype=float)}) == \
+        "a: ndarray(shape=(0,), dtype=float64) []"
+
+    result = PPContext(width=30).format(np.arange(6).reshape(2, 3))
+    # print("\n" + result)
+    assert result == ("ndarray(shape=(2, 3), dtype=int64)\n"
+                      "[[0, 1, 2],\n"
+                      " [3, 4, 5]]")
+
+
+def test_large_ndarray():
+    array = np.arange(10 ** 7, dtype=float)
+    array[1] = np.nan
+    result = PPContext(width=60, truncate=6).format({"x": array})
+    # print("\n" + result)
+    assert result == (
+        "x: ndarray(shape=(10000000,), dtype=float64)\n"
+        "  min: 0, max: 1e+07, mean: 5e+06, nan: 1\n"
+        "  [0.000000e+00,          nan, 2.000000e+00, ...,\n"
+        "   9.999997e+06, 9.999998e+06, 9.999999e+06]")
+
+    result = PPContext(truncate=4).format(np.ones(100, dtype=bool))
+    assert result == ("ndarray(shape=(100,), dtype=bool)\n"
+                      "true: 100\n"
+                      "[ True,  True, ...,  True,  True]")
+
+
+def test_ndarray_without_truncation():
+    result = PPContext(truncate=0).format(np.full(2000, np.nan))
+    assert result.splitlines()[1] == "nan: 2000"
+    assert result.splitlines()[2] == "[nan, nan, nan, ..., nan, nan, nan]"
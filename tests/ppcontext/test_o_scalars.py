@@ -0,0 +1,46 @@
+# test_o_scalars
+
+from unittest.mock import patch
+
+from opyprint import PPContext
+
+
+def format_both(data, **kwargs):
+    """Formats the data with and without the scalar fast path."""
+    ppc = PPContext(**kwargs)
+    result = ppc.format(data)
+    with ppc.profile():
+        assert ppc.format(data) == result
+    with patch.object(PPContext, "_format_scalars", return_value=None):
+        assert ppc.format(data) == result
+    return result
+
+
+def test_scalars():
+    assert format_both([1, 2.5, True]) == "[1, 2.5, True]"
+    assert format_both((1, 2), width=10) == "(1, 2)"
+    assert format_both([1, 2, 3], width=6) == "- 1\n- 2\n- 3"
+    assert format_both(list(range(20)), truncate=3) == "[0, 1, 2, ...]"
+    assert format_both({"a": [0.5] * 30}, width=40, truncate=0) == "\n".join(
+        ["a:"] + ["  - 0.5"] * 30)
+
+
+def test_long_scalars():
+    big = 10 ** 30
+    assert format_both([big, big], width=20) == (
+        "- 100000000000000000\n"
+        "  0000000000000\n"
+        "- 100000000000000000\n"
+        "  0000000000000")
+
+
+def test_mixed():
+    assert format_both([1, "a", None]) == "[1, a, None]"
+
+
+def test_profile():
+    ppc = PPContext()
+    with ppc.profile() as prof:
+        ppc.format({"a": [1, 2, 3], "b": [1, "x", {"c": 2}]})
+    assert prof["list [scalars]"].calls == 1
+    assert prof["list [scalars, discarded]"].calls == 1
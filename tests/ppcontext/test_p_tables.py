@@ -0,0 +1,90 @@
+# test_p_tables
+
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from opyprint import PPContext
+
+Point = namedtuple("Point", "x y")
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    stock: Optional[int] = None
+
+
+def test_dict_records():
+    records = [{"id": i, "name": f"n{i}", "ok": i % 2 == 0}
+               for i in range(20)]
+    result = PPContext(truncate=3).format(records)
+    # print("\n" + result)
+    assert result == ("id  name  ok\n"
+                      " 0  n0    True\n"
+                      " 1  n1    False\n"
+                      " 2  n2    True\n"
+                      "...")
+
+    result = PPContext(truncate=2).format({"rows": records, "count": 20})
+    # print("\n" + result)
+    assert result == ("- count: 20\n"
+                      "- rows:\n"
+                      "    id  name  ok\n"
+                      "     0  n0    True\n"
+                      "     1  n1    False\n"
+                      "    ...")
+
+
+def test_dataclass_records():
+    items = [Item("apple", 0.5, 100), Item("banana split", 12.25)]
+    result = PPContext(width=40).format(items, bullet=True)
+    # print("\n" + result)
+    assert result == ("- name          price  stock\n"
+                      "  apple           0.5    100\n"
+                      "  banana split  12.25   None")
+
+
+def test_namedtuple_records():
+    points = [Point(1, 2), Point(30, 40)]
+    assert PPContext().format(points) == (" x   y\n"
+                                          " 1   2\n"
+                                          "30  40")
+    assert PPContext(tables=False).format(points[:1] * 3) == (
+        "- - x: 1\n"
+        "  - y: 2\n"
+        "- - x: 1\n"
+        "  - y: 2\n"
+        "- - x: 1\n"
+        "  - y: 2")
+
+
+def test_tables_option():
+    records = [{"a": 1, "b": "x" * 20}, {"a": 2, "b": "y"}]
+    table = ("a  b\n"
+             "1  xxxxxxxxxxxxxxxxxxxx\n"
+             "2  y")
+    assert PPContext(width=30).format(records) == table
+    assert PPContext(width=20).format(records) != table
+    assert PPContext(width=20, tables=True).format(records) == table
+    assert PPContext(width=30, tables=False).format(records) != table
+    assert PPContext(tables=True).format(records[:1]) == ("a  b\n"
+                                                          "1  " + "x" * 20)
+
+    with pytest.raises(TypeError):
+        PPContext(tables=1)
+
+
+def test_no_table():
+    # Different fields:
+    assert PPContext(width=20).format([{"a": 1, "b": 2}, {"a": 1, "c": 2}]) \
+        == "- - a: 1\n  - b: 2\n- - a: 1\n  - c: 2"
+    # Nested containers:
+    assert PPContext(width=20).format([{"a": 1, "b": [2]}] * 2) \
+        == "- - a: 1\n  - b: [2]\n- - a: 1\n  - b: [2]"
+    # Colliding labels:
+    assert PPContext(width=20).format([{1: "a", "1": "b"}] * 2) \
+        == "- - 1: a\n  - 1: b\n- - 1: a\n  - 1: b"
@@ -0,0 +1,98 @@
+# test_q_records
+
+from collections import namedtuple
+from dataclasses import dataclass, field
+from typing import List
+
+from opyprint import PPContext
+from opyprint.utils import is_record, record_accessor
+
+Point = namedtuple("Point", "x y")
+
+
+@dataclass
+class Item:
+    name: str
+    tags: List[str] = field(default_factory=list)
+    secret: str = field(default="", repr=False)
+
+
+@dataclass
+class Described:
+    name: str
+
+    def __str__(self):
+        return f"Described {self.name}"
+
+
+@dataclass
+class P:
+    x: int
+    y: int
+
+    def __repr__(self):
+        return f"P<{self.x},{self.y}>"
+
+
+@dataclass
+class SubItem(Item):
+    pass
+
+
+class Slotted:
+    __slots__ = ("alpha", "__beta")
+
+    def __init__(self, alpha, beta=None):
+        self.alpha = alpha
+        if beta is not None:
+            self.__beta = beta
+
+
+class SubSlotted(Slotted):
+    __slots__ = ["gamma"]
+
+
+class Plain:
+    def __init__(self):
+        self.alpha = 1
+
+
+def test_record_accessor():
+    accessor = record_accessor(Item)
+    assert accessor.names == ("name", "tags")
+    assert record_accessor(Item) is accessor
+    assert accessor.values(Item("a", ["b"])) == ("a", ["b"])
+
+    assert record_accessor(Point).names == ("x", "y")
+    assert record_accessor(SubSlotted).names == ("alpha", "_Slotted__beta",
+                                                 "gamma")
+
+    assert record_accessor(SubItem).names == ("name", "tags")
+
+    for cls in (Described, P, Plain, dict, list, tuple, int, str):
+        assert record_accessor(cls) is None
+    assert is_record(Slotted(1))
+    assert not is_record(Plain())
+
+
+def test_records():
+    item = Item("apple", ["fruit", "red"], secret="s")
+    assert PPContext().format(item) == ("- name: apple\n"
+                                        "- tags: [fruit, red]")
+    assert PPContext().format({"point": Point(1, 2)}) == ("point:\n"
+                                                          "  - x: 1\n"
+                                                          "  - y: 2")
+    assert PPContext().format(Slotted(1)) == "alpha: 1"
+    assert PPContext().format(SubSlotted(1, 2)) == ("- alpha: 1\n"
+                                                    "- _Slotted__beta: 2")
+    assert PPContext().format(Described("x")) == "Described x"
+    assert PPContext().format(P(1, 2)) == "P<1,2>"
+    assert PPContext().format([P(1, 2), P(3, 4)]) == "[P<1,2>, P<3,4>]"
+
+
+def test_record_cycle():
+    item = Item("loop")
+    item.tags.append(item)
+    assert PPContext().format(item) == ("- name: loop\n"
+                                        "- tags: [<cycle: Item>]")
+    assert PPContext(max_depth=1).format([item]) == "[{…2 fields}]"
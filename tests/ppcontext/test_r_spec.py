@@ -0,0 +1,81 @@
+# test_r_spec
+
+import pytest
+
+from opyprint import PPContext, PPField, PPSpec, pp_fields
+from opyprint.utils import record_accessor
+
+
+class Order:
+    __pp_fields__ = PPSpec("customer",
+                           PPField("items", truncate=3),
+                           PPField("total", label="sum"),
+                           header="Order {id}:")
+
+    def __init__(self, id, customer, items, total):
+        self.id = id
+        self.customer = customer
+        self.items = items
+        self.total = total
+
+    def __str__(self, ppc: PPContext = None):
+        return "Overridden by the spec"
+
+
+@pp_fields("x", "y")
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Named:
+    __pp_fields__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+def test_spec():
+    order = Order(7, "Bob", list(range(10)), 12.5)
+    result = PPContext().format(order)
+    # print("\n" + result)
+    assert result == ("Order 7:\n"
+                      "  - customer: Bob\n"
+                      "  - items: [0, 1, 2, ...]\n"
+                      "  - sum: 12.5")
+
+    result = PPContext().format({"order": order, "point": Point(1, [2])})
+    # print("\n" + result)
+    assert result == ("- order:\n"
+                      "    Order 7:\n"
+                      "      - customer: Bob\n"
+                      "      - items: [0, 1, 2, ...]\n"
+                      "      - sum: 12.5\n"
+                      "- point:\n"
+                      "    - x: 1\n"
+                      "    - y: [2]")
+
+    assert PPContext().format([Named("a"), Named("b")]) == "[name: a, name: b]"
+
+
+def test_spec_accessor():
+    accessor = record_accessor(Order)
+    assert accessor.names == ("customer", "items", "total")
+    assert accessor.labels == ("customer", "items", "sum")
+    assert accessor.header_names == ("id",)
+    assert record_accessor(Order) is accessor
+
+
+def test_spec_table():
+    result = PPContext(width=20).format([Point(1, 2), Point(3, 4)])
+    assert result == ("x  y\n"
+                      "1  2\n"
+                      "3  4")
+
+
+def test_spec_type_error():
+    with pytest.raises(TypeError):
+        PPSpec(1)
+    with pytest.raises(TypeError):
+        PPSpec("a", header=1)
@@ -0,0 +1,52 @@
+# test_s_squash
+
+from typing import List
+
+from opyprint import PPContext
+
+
+class Keeper:
+    """Keeps the pp-contexts passed to its __str__ method."""
+
+    contexts: List[PPContext] = []
+
+    def __str__(self, ppc: PPContext = None):
+        assert ppc is not None
+        Keeper.contexts.append(ppc)
+        ppc("kept")
+        return ppc.flush()
+
+
+def test_squash():
+    ppc = PPContext(width=40, truncate=3, indent="  ", fold_runs=True,
+                    int_runs=True, max_depth=2, tables=False)
+    squashed = ppc._squash()
+    assert squashed is not ppc
+    assert squashed.content_width == ppc.content_width == 38
+    assert squashed.indentation == ""
+    assert squashed.truncation == 3
+    assert squashed.fold_runs and squashed.int_runs
+    assert squashed.max_depth == 2
+    assert squashed.tables is False
+
+    ppc._release(squashed)
+    assert ppc._squash() is squashed
+    assert ppc._squash() is not squashed
+
+
+def test_squash_reuse():
+    ppc = PPContext(indent="  ")
+    data = [{"a": [1, {"b": 2}], "c": 3}] * 3
+    first = ppc.format(data)
+    # The spare squashed contexts are reused:
+    assert ppc._spare is not None
+    assert ppc.format(data) == first
+    assert ppc._spare._refs is None
+
+
+def test_squash_str_ppc():
+    # The contexts passed to __str__ methods are not reused:
+    Keeper.contexts = []
+    ppc = PPContext(indent="  ")
+    assert ppc.format([Keeper(), [Keeper()]]) == "  [kept, [kept]]"
+    assert len(set(map(id, Keeper.contexts))) == len(Keeper.contexts)
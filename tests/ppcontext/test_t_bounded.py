@@ -0,0 +1,54 @@
+# test_t_bounded
+
+import time
+
+from opyprint import PPContext
+from opyprint.utils import bounded
+
+
+def test_huge_str():
+    text = "word " * 1000000
+    ppc = PPContext(width=40, truncate=2)
+    start = time.perf_counter()
+    result = ppc.format(text)
+    assert time.perf_counter() - start < 0.1
+    # print("\n" + result)
+    assert result == ("word word word word word word word word\n"
+                      "word word word word w... (5000000 chars)")
+
+    # Strings up to the threshold are shortened as usual:
+    text = "word " * (bounded.huge_length // 5)
+    assert ppc.format(text) == ("word word word word word word word word\n"
+                                "word word word word word word word [...]")
+
+    # No truncation:
+    assert PPContext(truncate=0).format(text) == \
+        "\n".join(["word " * 19 + "word"] * 100)
+
+
+def test_huge_int():
+    ppc = PPContext(width=60)
+    values = [1, 7 ** 100000, -(10 ** 10 ** 5)]
+    start = time.perf_counter()
+    result = ppc.format(values)
+    assert time.perf_counter() - start < 0.1
+    # print("\n" + result)
+    assert result == ("- 1\n"
+                      "- 6367976113...8060000001 (84510 digits)\n"
+                      "- -1000000000...0000000000 (100001 digits)")
+    assert ppc.format({"n": 10 ** 40}) == f"n: {10 ** 40}"
+
+
+def test_huge_int_cells_runs_and_keys():
+    huge = 10 ** 5000
+    summary = "1000000000...0000000000 (5001 digits)"
+    result = PPContext().format([{"a": huge, "b": "x"}, {"a": 1, "b": "y"}])
+    # print("\n" + result)
+    assert result == (f"{'a':>37}  b\n"
+                      f"{summary}  x\n"
+                      f"{1:>37}  y")
+    result = PPContext(int_runs=True).format([huge, huge + 1, huge + 2])
+    assert result == (f"[{summary}.."
+                      "1000000000...0000000002 (5001 digits)]")
+    assert PPContext().format({huge: 1}) == f"{summary}: 1"
+    assert PPContext().format([huge, 1]) == f"[{summary}, 1]"
@@ -0,0 +1,78 @@
+# test_u_binary
+
+import mmap
+import time
+
+import numpy as np
+
+from opyprint import PPContext
+from opyprint.utils import is_binary
+
+
+def test_is_binary():
+    assert is_binary(b"")
+    assert is_binary(bytearray())
+    assert is_binary(memoryview(b""))
+    assert not is_binary("")
+    assert not is_binary([0])
+
+
+def test_short_binary():
+    ppc = PPContext()
+    assert ppc.format(b"abc") == "b'abc'"
+    assert ppc.format({"a": bytearray(b"\x00")}) == "a: bytearray(b'\\x00')"
+
+
+def test_hexdump():
+    data = bytes(range(0x5d, 0x83))
+    result = PPContext(width=80).format(data * 2)
+    # print("\n" + result)
+    assert result == (
+        "bytes(nbytes=76)\n"
+        "00000000  5d 5e 5f 60 61 62 63 64  65 66 67 68 69 6a 6b 6c  "
+        "|]^_`abcdefghijkl|\n"
+        "00000010  6d 6e 6f 70 71 72 73 74  75 76 77 78 79 7a 7b 7c  "
+        "|mnopqrstuvwxyz{||\n"
+        "00000020  7d 7e 7f 80 81 82 5d 5e  5f 60 61 62 63 64 65 66  "
+        "|}~....]^_`abcdef|\n"
+        "00000030  67 68 69 6a 6b 6c 6d 6e  6f 70 71 72 73 74 75 76  "
+        "|ghijklmnopqrstuv|\n"
+        "00000040  77 78 79 7a 7b 7c 7d 7e  7f 80 81 82              "
+        "|wxyz{|}~....|")
+
+    result = PPContext(width=40, truncate=2).format({"data": data})
+    # print("\n" + result)
+    assert result == ("data: bytes(nbytes=38)\n"
+                      "  00000000  5d 5e 5f 60  |]^_`|\n"
+                      "  00000004  61 62 63 64  |abcd|\n"
+                      "  ...")
+
+
+def test_huge_binary():
+    data = bytearray(300 * 1024 * 1024)
+    ppc = PPContext(width=50, truncate=1)
+    start = time.perf_counter()
+    result = ppc.format(data)
+    assert time.perf_counter() - start < 0.1
+    assert result == ("bytearray(nbytes=314572800)\n"
+                      "00000000  00 00 00 00 00 00 00 00  |........|\n"
+                      "...")
+
+
+def test_buffers():
+    ppc = PPContext(width=60)
+    array = np.arange(3, dtype=np.int16)
+    assert ppc.format(memoryview(array)) == (
+        "memoryview(nbytes=6)\n"
+        "00000000  00 00 01 00 02 00        |......|")
+    assert ppc.format(memoryview(array)[::2]) == (
+        "memoryview(nbytes=4)\n"
+        "00000000  00 00 02 00              |....|")
+
+    with mmap.mmap(-1, 5) as buffer:
+        buffer[:] = b"hello"
+        assert ppc.format(buffer) == (
+            "mmap(nbytes=5)\n"
+            "00000000  68 65 6c 6c 6f           |hello|")
+        # The buffer is released:
+        buffer.resize(6)
@@ -0,0 +1,90 @@
+# test_v_head_tail
+
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from opyprint import PPContext
+
+
+@dataclass
+class Point:
+    x: int
+    y: str
+
+
+def test_truncation_setting():
+    ppc = PPContext(truncate=(8, 4))
+    assert ppc.truncation == (8, 4)
+    with ppc.truncate(3):
+        assert ppc.truncation == 3
+    assert ppc.truncation == (8, 4)
+    ppc.truncation = 5
+    assert ppc.truncation == 5
+
+    for truncate in ((1,), (1, 2, 3), (1, -1), (1, "2"), "3"):
+        with pytest.raises(TypeError):
+            PPContext(truncate=truncate)
+
+
+def test_sequences():
+    ppc = PPContext(width=60, truncate=(3, 2))
+    assert ppc.format(list(range(100))) == "[0, 1, 2, ... (95 more), 98, 99]"
+    assert ppc.format(tuple(range(100))) == \
+        "(0, 1, 2, ... (95 more), 98, 99)"
+    assert ppc.format(set(range(100))) == "{0, 1, 2, ... (95 more), 98, 99}"
+    assert ppc.format(list(range(5))) == "[0, 1, 2, 3, 4]"
+    assert ppc.format(["a"] * 6) == "[a, a, a, ... (1 more), a, a]"
+
+    # Only the first and last items are accessed:
+    start = time.perf_counter()
+    result = ppc.format(range(10 ** 15))
+    assert time.perf_counter() - start < 0.1
+    # print("\n" + result)
+    assert result == ("- 0\n"
+                      "- 1\n"
+                      "- 2\n"
+                      "- ... (999999999999995 more)\n"
+                      "- 999999999999998\n"
+                      "- 999999999999999")
+
+    assert PPContext(truncate=(0, 2)).format(list(range(10))) == \
+        "[... (8 more), 8, 9]"
+
+
+def test_generators():
+    ppc = PPContext(width=60, truncate=(3, 2))
+    assert ppc.format(i for i in range(100)) == \
+        "[0, 1, 2, ... (95 more), 98, 99]"
+    assert ppc.format(i for i in range(6)) == "[0, 1, 2, ... (1 more), 4, 5]"
+    assert ppc.format(i for i in range(5)) == "[0, 1, 2, 3, 4]"
+    assert ppc.format(i for i in range(2)) == "[0, 1]"
+
+
+def test_dicts_and_tables():
+    ppc = PPContext(width=60, truncate=(2, 1))
+    result = ppc.format({key: key.upper() for key in "abcdef"})
+    # print("\n" + result)
+    assert result == ("- a: A\n"
+                      "- b: B\n"
+                      "- ... (3 more)\n"
+                      "- f: F")
+
+    result = ppc.format([Point(index, "p" * index) for index in range(6)])
+    # print("\n" + result)
+    assert result == ("x  y\n"
+                      "0\n"
+                      "1  p\n"
+                      "... (3 more)\n"
+                      "5  ppppp")
+
+
+def test_runs():
+    ppc = PPContext(width=60, truncate=(3, 2), fold_runs=True)
+    assert ppc.format([0] * 50 + [1] * 3 + list(range(10))) == \
+        "[0 ×50, 1 ×3, 0, ... (7 more), 8, 9]"
+
+    ppc = PPContext(width=60, truncate=(2, 1), int_runs=True)
+    assert ppc.format([1, 2, 3, 5, 7, 8, 9, 11, 13, 15, 16, 17]) == \
+        "[1..3, 5, ... (3 more), 15..17]"
@@ -0,0 +1,51 @@
+# test_w_sample
+
+import pytest
+
+from opyprint import PPContext
+
+
+def test_sample_setting():
+    ppc = PPContext(sample=True)
+    assert ppc.sample
+    ppc.sample = False
+    assert not ppc.sample
+
+    with pytest.raises(TypeError):
+        PPContext(sample=1)
+    with pytest.raises(TypeError):
+        PPContext(seed="1")
+
+
+def test_sampled_sets():
+    ppc = PPContext(width=60, truncate=5, sample=True, seed=0)
+    result = ppc.format(set(range(1000)))
+    assert result == PPContext(width=60, truncate=5, sample=True,
+                               seed=0).format(set(range(1000)))
+    assert result.startswith("{")
+    assert result.endswith(", ...and 995 more}")
+    items = [int(item) for item in result[1:].split(", ")[:5]]
+    assert items == sorted(set(items))
+    assert all(0 <= item < 1000 for item in items)
+
+    # Small sets are shown in full:
+    assert ppc.format({3, 1, 2}) == "{1, 2, 3}"
+
+
+def test_sampled_dicts():
+    ppc = PPContext(width=60, truncate=3, sample=True, seed=0)
+    result = ppc.format({index: str(index) for index in range(100)})
+    # print("\n" + result)
+    lines = result.split("\n")
+    assert len(lines) == 4
+    assert lines[-1] == "- ...and 97 more"
+    keys = [int(line[2:].split(":")[0]) for line in lines[:-1]]
+    assert keys == sorted(set(keys))
+    assert all(line == f"- {key}: {key}"
+               for line, key in zip(lines, keys))
+
+
+def test_ordered_collections():
+    # Lists and records are not sampled:
+    ppc = PPContext(width=60, truncate=3, sample=True, seed=0)
+    assert ppc.format(list(range(10))) == "[0, 1, 2, ...]"
@@ -0,0 +1,32 @@
+# test_x_sort
+
+from frozendict import NoCopyFrozenDict as FrozenDict
+
+from opyprint import PPContext
+
+
+def test_mixed_sets():
+    ppc = PPContext(width=60)
+    assert ppc.format({3, "a", None, 1.5}) == "{None, 1.5, 3, a}"
+    assert PPContext(truncate=2).format({3, "a", None, 1.5}) == \
+        "{None, 1.5, ...}"
+
+
+def test_mixed_keys():
+    result = PPContext().format({1: "x", "b": "y", None: "z"})
+    # print("\n" + result)
+    assert result == ("- None: z\n"
+                      "- 1: x\n"
+                      "- b: y")
+
+
+def test_frozendict_sets():
+    records = {FrozenDict({"a": index % 2, "b": index})
+               for index in range(4)}
+    result = PPContext().format(records)
+    # print("\n" + result)
+    assert result == ("a  b\n"
+                      "0  0\n"
+                      "0  2\n"
+                      "1  1\n"
+                      "1  3")
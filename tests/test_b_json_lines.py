@@ -0,0 +1,124 @@
+# test_b_json_lines
+
+import json
+from io import StringIO
+
+from pytest import raises
+
+from opyprint import PPContext
+from opyprint.json_lines import iter_json, iter_json_record, write_json_record
+
+
+class Alpha:
+    def __str__(self, ppc: PPContext = None):
+        ppc = ppc or PPContext()
+        ppc("An Alpha object")
+        return ppc.flush()
+
+
+def encode(obj, **kwargs) -> str:
+    return "".join(iter_json(obj, ppc=PPContext(**kwargs)))
+
+
+def test_scalars():
+    assert encode(None) == "null"
+    assert encode(True) == "true"
+    assert encode(False) == "false"
+    assert encode(12) == "12"
+    assert encode(1.5) == "1.5"
+    assert encode(float("nan")) == '"nan"'
+    assert encode("foo \"bar\"\n") == '"foo \\"bar\\"\\n"'
+    assert encode(Alpha()) == '"An Alpha object"'
+    assert encode("café") == '"café"'
+
+
+def test_huge_ints():
+    huge = 10 ** 5000
+    encoded = encode(huge)
+    assert encoded.startswith('"1000') and encoded.endswith('(5001 digits)"')
+    assert json.loads(encode({huge: -huge}))
+
+
+def test_collections():
+    assert encode([1, "a", None]) == '[1,"a",null]'
+    assert encode((1, 2)) == "[1,2]"
+    assert encode({3, 1, 2}) == "[1,2,3]"
+    assert encode({"b": [1], "a": {2: 3}}) == '{"a":{"2":3},"b":[1]}'
+    assert encode(i for i in range(3)) == "[0,1,2]"
+    value = {"a": [{"b": (1, 2.5, "c")}], "d": None}
+    assert json.loads(encode(value)) == {"a": [{"b": [1, 2.5, "c"]}],
+                                         "d": None}
+
+
+def test_truncation():
+    assert encode([1, 2, 3], truncate=2) == '[1,2,"..."]'
+    assert encode({"c": 3, "b": 2, "a": 1}, truncate=2) == \
+        '{"a":1,"b":2,"...":"..."}'
+    assert encode("w1 w2 w3 w4", width=4, truncate=2) == '"w1 w2 w3 [...]"'
+    assert encode("w1 w2 w3 w4", width=4, truncate=0) == '"w1 w2 w3 w4"'
+
+
+def test_head_and_tail_truncation():
+    assert encode(list(range(10)), truncate=(2, 1)) == \
+        '[0,1,"... (7 more)",9]'
+    assert encode((i for i in range(10)), truncate=(2, 1)) == \
+        '[0,1,"... (7 more)",9]'
+    assert encode([1, 2, 3], truncate=(2, 1)) == "[1,2,3]"
+    assert encode({"d": 4, "c": 3, "b": 2, "a": 1}, truncate=(1, 1)) == \
+        '{"a":1,"... (2 more)":"...","d":4}'
+
+
+def test_record():
+    record = "".join(iter_json_record(["key", [1, 2]],
+                                      depth=2,
+                                      level=3,
+                                      name="main",
+                                      timestamp=1.5))
+    assert record == ('{"time":1.5,"level":"info","depth":2,"logger":"main",'
+                      '"args":["key",[1,2]]}\n')
+
+    string_io = StringIO()
+    write_json_record(string_io, ["msg"], level=1)
+    assert json.loads(string_io.getvalue()) == {
+        "time": 0.0,
+        "level": "debug",
+        "depth": 0,
+        "logger": None,
+        "args": ["msg"],
+    }
+
+
+def test_max_depth():
+    assert encode({"a": [1, 2], "b": 1}, max_depth=1) == \
+        '{"a":"[…2 items]","b":1}'
+    record = "".join(iter_json_record(["key", {"a": [1, 2]}],
+                                      ppc=PPContext(max_depth=1),
+                                      timestamp=1.5))
+    assert record.endswith('"args":["key",{"a":"[…2 items]"}]}\n')
+
+
+def test_cycles():
+    items: list = [1]
+    items.append(items)
+    assert encode([items, items]) == \
+        '[[1,"<cycle: list>"],[1,"<cycle: list>"]]'
+    dct: dict = {"a": 1}
+    dct["self"] = dct
+    assert encode(dct) == '{"a":1,"self":"<cycle: dict>"}'
+
+
+def test_colliding_keys():
+    assert encode({1: "int", "1": "str", 2: "two"}) == \
+        '{"int(1)":"int","2":"two","1":"str"}'
+
+
+class Failing:
+    def __str__(self):
+        raise RuntimeError("boom")
+
+
+def test_write_failure():
+    string_io = StringIO()
+    with raises(RuntimeError):
+        write_json_record(string_io, ["msg", Failing()])
+    assert string_io.getvalue() == ""
@@ -0,0 +1,72 @@
+# test_c_instrumentation
+
+import sys
+from io import StringIO
+
+from opyprint import PPContext, PrintLogger
+from opyprint.instrumentation import (
+    Instrumentation, disable_instrumentation, enable_instrumentation, stats,
+)
+from opyprint.logger import EveryNth, Logger
+
+
+def test_disabled():
+    disable_instrumentation()
+    assert PPContext.instrumentation is None
+    assert stats() == {}
+
+
+def test_format_types():
+    instrumentation = enable_instrumentation()
+    try:
+        PPContext().format({"a": [1, 2], "b": "text"})
+    finally:
+        disable_instrumentation()
+    types = instrumentation.stats()["types"]
+    assert types["dict"]["calls"] >= 1
+    assert types["list"]["calls"] >= 1
+    # The scalar items of the list are converted in bulk:
+    assert types["list [scalars]"]["calls"] == 1
+    assert "int" not in types
+    assert all(entry["seconds"] >= 0.0 for entry in types.values())
+
+
+def test_logger_metrics():
+    instrumentation = enable_instrumentation(Instrumentation())
+    sys.stdout = StringIO()
+    try:
+        logger = PrintLogger(Logger.TRACE, sampling=EveryNth(2))
+        logger.debug("skipped")
+        for i in range(2):
+            logger.info(f"L{i}")
+        output = sys.stdout.getvalue()
+    finally:
+        sys.stdout = sys.__stdout__
+        disable_instrumentation()
+    snapshot = instrumentation.stats()
+    assert snapshot["records"] == {"info": 1}
+    assert snapshot["suppressed"] == {"level": {"debug": 1},
+                                      "policy": {"info": 1}}
+    assert snapshot["bytes_emitted"] == len(output.encode("utf-8"))
+    assert snapshot["format_seconds"] > 0.0
+
+    text = instrumentation.to_prometheus()
+    assert "# TYPE opyprint_log_records_total counter" in text
+    assert 'opyprint_log_records_total{level="info"} 1' in text
+    assert ('opyprint_log_records_suppressed_total'
+            '{level="info",reason="policy"} 1') in text
+
+
+def test_export_prometheus(tmp_path):
+    instrumentation = Instrumentation()
+    instrumentation.record_emitted(Logger.INFO, 10, 0.5, 0.25)
+    path = tmp_path / "opyprint.prom"
+    instrumentation.export_prometheus(str(path))
+    content = path.read_text()
+    assert content == instrumentation.to_prometheus()
+    assert "opyprint_log_bytes_total 10" in content
+    assert 'opyprint_log_format_seconds_bucket{le="0.1"} 0' in content
+    assert 'opyprint_log_format_seconds_bucket{le="+Inf"} 1' in content
+    assert "opyprint_log_format_seconds_count 1" in content
+    instrumentation.reset()
+    assert instrumentation.stats()["records"] == {}
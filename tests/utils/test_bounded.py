@@ -0,0 +1,73 @@
+# test_bounded
+
+import random
+import sys
+
+from opyprint.utils import (
+    bound_text, bounded_str, is_huge_int, is_huge_text, max_int_digits,
+    summarize_int,
+)
+from opyprint.utils import bounded
+
+
+def test_bound_text():
+    assert bound_text("x" * 100, 20) == "xxxxx... (100 chars)"
+    assert bound_text("abc", 30, total=12000, unit="bytes") == \
+        "abc... (12000 bytes)"
+    assert bound_text("abc", 5) == "... (3 chars)"
+
+
+def test_is_huge_text():
+    assert not is_huge_text("x" * bounded.huge_length)
+    assert is_huge_text("x" * (bounded.huge_length + 1))
+    assert is_huge_text(b"x" * (bounded.huge_length + 1))
+
+
+def test_is_huge_int():
+    limit = max_int_digits()
+    assert not is_huge_int(0)
+    assert not is_huge_int(10 ** limit - 1)
+    assert not is_huge_int(-10 ** limit + 1)
+    assert is_huge_int(10 ** limit)
+    assert is_huge_int(-10 ** limit)
+    assert not is_huge_int(True)
+
+
+def test_summarize_int():
+    assert summarize_int(0) == "0"
+    assert summarize_int(-12345) == "-12345"
+    assert summarize_int(10 ** 20 - 1) == "9" * 20
+    assert summarize_int(10 ** 5000 + 7) == \
+        "1000000000...0000000007 (5001 digits)"
+    assert summarize_int(-10 ** 5000 + 1) == \
+        "-9999999999...9999999999 (5000 digits)"
+
+
+def test_bounded_str():
+    assert bounded_str(12) == "12"
+    assert bounded_str("abc") == "abc"
+    assert bounded_str(None) == "None"
+    assert bounded_str(10 ** 5000) == "1000000000...0000000000 (5001 digits)"
+
+
+def test_summarize_int_randomized():
+    get_limit = getattr(sys, "get_int_max_str_digits", None)
+    set_limit = getattr(sys, "set_int_max_str_digits", None)
+    limit = get_limit() if get_limit is not None else 0
+    if set_limit is not None:
+        set_limit(0)
+    try:
+        rng = random.Random(0)
+        for _ in range(300):
+            digits = rng.randint(1, 3000)
+            value = rng.choice([
+                10 ** digits + rng.randint(-5, 5),
+                rng.randint(1, 10 ** digits),
+            ])
+            text = str(value)
+            if len(text) > 20:
+                text = f"{text[:10]}...{text[-10:]} ({len(text)} digits)"
+            assert summarize_int(value) == text
+    finally:
+        if set_limit is not None:
+            set_limit(limit)
@@ -0,0 +1,13 @@
+# test_columns
+
+from opyprint.utils import align_columns
+
+
+def test_align_columns():
+    rows = [("name", "count"), ("alpha", "1"), ("b", "100")]
+    assert align_columns(rows, (False, True)) == [
+        "name   count",
+        "alpha      1",
+        "b        100",
+    ]
+    assert align_columns([("a", "bb")], (True, False)) == ["a  bb"]
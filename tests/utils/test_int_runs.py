@@ -0,0 +1,45 @@
+# test_int_runs
+
+from opyprint.utils import compress_ints, is_int_collection
+from opyprint.utils import int_runs
+
+
+def test_is_int_collection():
+    assert is_int_collection([1, 2, 3])
+    assert is_int_collection((1,))
+    assert is_int_collection({1, 2})
+    assert is_int_collection(range(0))
+
+    assert not is_int_collection([])
+    assert not is_int_collection([1, True])
+    assert not is_int_collection([1, 2.0])
+    assert not is_int_collection({1: 2})
+    assert not is_int_collection("123")
+
+
+def test_compress_ints():
+    assert compress_ints([1, 2, 3, 5, 7, 8, 9, 10]) == ["1..3", 5, "7..10"]
+    assert compress_ints([1, 2, 4, 5]) == [1, 2, 4, 5]
+    assert compress_ints({3, 1, 2, 9}) == ["1..3", 9]
+    assert compress_ints([3, 2, 1]) == [3, 2, 1]
+    assert compress_ints([1, 2, 3, 5, 6, 7, 9], limit=1) == ["1..3", "5..7"]
+
+
+def test_compress_ranges():
+    assert compress_ints(range(10 ** 15)) == [f"0..{10 ** 15 - 1}"]
+    assert compress_ints(range(2)) == [0, 1]
+    assert compress_ints(range(0, 10 ** 15, 2), limit=2) == [0, 2, 4]
+
+
+def test_compress_vectorized():
+    values = [*range(1, 501), 502, *range(510, 1901)]
+    assert len(values) >= int_runs.vectorize_threshold
+    assert compress_ints(values) == ["1..500", 502, "510..1900"]
+    assert compress_ints(values, limit=1) == ["1..500", 502]
+    values = list(range(0, 4000, 2))
+    assert compress_ints(values, limit=3) == [0, 2, 4, 6]
+
+    # Doesn't fit in 64 bits:
+    big = 2 ** 70
+    values = list(range(big, big + int_runs.vectorize_threshold))
+    assert compress_ints(values) == [f"{big}..{values[-1]}"]
@@ -3,7 +3,8 @@
 from frozendict import NoCopyFrozenDict as FrozenDict
 from pytest import raises
 
-from opyprint import dict_lt, lt
+from opyprint import dict_lt, lt, pp_sort_key
+from opyprint.utils import pp_sorted
 
 
 def test_basics():
@@ -56,3 +57,35 @@ def assert_dict_lt(obj_1, obj_2):
     assert not lt(obj_2, obj_1)
     assert not lt(obj_1, obj_1)
     assert not lt(obj_2, obj_2)
+
+
+def test_pp_sort_key():
+    items = [3, "a", None, 1.5, (1, "x"), {"b": 1}, {"a": 2}, b"z", {2, "q"},
+             True, [0]]
+    assert sorted(items, key=pp_sort_key) == [
+        None, True, 1.5, 3, "a", b"z", [0], (1, "x"), {2, "q"}, {"a": 2},
+        {"b": 1}]
+
+    # Other objects are grouped by their type and compared when possible:
+    assert sorted([2j, 3, 1j, 1], key=pp_sort_key)[:2] == [1, 3]
+
+
+def test_pp_sort_key_with_dicts():
+    dicts = [{'a': 1, 'b': 1}, {'a': 1}, {'a': 2}, {'b': 1}, {1: 'a'}]
+    expected = [{'a': 1}, {'a': 2}, {'a': 1, 'b': 1}, {'b': 1}]
+    assert sorted(dicts[:4], key=pp_sort_key) == expected
+    for dct_1, dct_2 in zip(expected, expected[1:]):
+        assert dict_lt(dct_1, dct_2)
+
+    # Mixed keys:
+    assert sorted(dicts, key=pp_sort_key)[0] == {1: 'a'}
+
+    frozen = [FrozenDict({'a': index % 2, 'b': -index}) for index in range(4)]
+    assert sorted(frozen, key=pp_sort_key) == [frozen[2], frozen[0],
+                                               frozen[3], frozen[1]]
+    assert pp_sort_key(frozen[0]) is pp_sort_key(frozen[0])
+
+
+def test_pp_sorted():
+    assert pp_sorted({3, 1, 2}) == [1, 2, 3]
+    assert pp_sorted(iter(["b", 1, None])) == [None, 1, "b"]
@@ -8,6 +8,7 @@ from opyprint.utils.predicates import (
     is_dict,
     is_multiliner,
     is_oneliner,
+    is_scalar,
     is_set,
     is_tuple,
 )
@@ -65,6 +66,17 @@ def test_is_oneliner():
     assert not is_oneliner("aa\nbb")
 
 
+def test_is_scalar():
+    for obj in (0, 1.5, True, 10 ** 30):
+        assert is_scalar(obj)
+
+    class Int(int):
+        pass
+
+    for obj in ("1", None, 1j, Int(1), [1]):
+        assert not is_scalar(obj)
+
+
 def test_is_bullettable():
     bullettables = (
         list(),
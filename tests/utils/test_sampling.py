@@ -0,0 +1,30 @@
+# test_sampling
+
+from collections import Counter
+from random import Random
+
+from opyprint.utils import reservoir_sample
+
+
+def test_small_populations():
+    assert reservoir_sample([1, 2, 3], 5) == [1, 2, 3]
+    assert reservoir_sample([1, 2, 3], 3) == [1, 2, 3]
+    assert reservoir_sample([1, 2, 3], 0) == []
+    assert reservoir_sample([], 2) == []
+
+
+def test_reproducible():
+    sample = reservoir_sample(range(10 ** 6), 10, Random(1))
+    assert len(sample) == 10
+    assert len(set(sample)) == 10
+    assert sample == reservoir_sample(range(10 ** 6), 10, Random(1))
+
+
+def test_uniform():
+    rng = Random(0)
+    counter: Counter = Counter()
+    for _ in range(5000):
+        counter.update(reservoir_sample(iter(range(50)), 5, rng))
+    # Each item is sampled 500 times on average:
+    assert len(counter) == 50
+    assert 400 < min(counter.values()) <= max(counter.values()) < 600
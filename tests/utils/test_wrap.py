@@ -0,0 +1,49 @@
+# test_wrap
+
+import textwrap
+import time
+
+from opyprint.utils import shorten, text_wrapper, wrap
+
+
+TEXT = (
+    "Lorem ipsum dolor sit amet,  consectetur\tadipiscing elit, sed do "
+    "eiusmod tempor-incididunt ut labore et dolore magna aliqua.\n Ut enim "
+    "ad minim veniam, quis nostrud exercitationullamcolaborisnisiutaliquip "
+    "ex ea commodo consequat."
+)
+
+
+def test_text_wrapper():
+    assert text_wrapper(20) is text_wrapper(20)
+    assert text_wrapper(20) is not text_wrapper(21)
+    assert text_wrapper(20, "  ", 2).subsequent_indent == "  "
+    assert text_wrapper(20, "  ", 2).max_lines == 2
+
+
+def test_wrap():
+    for width in range(8, 60):
+        for max_lines in (None, 1, 2, 3):
+            for indent in ("", "  "):
+                assert wrap(TEXT, width, indent, max_lines) == textwrap.wrap(
+                    TEXT, width=width, subsequent_indent=indent,
+                    max_lines=max_lines)
+    assert wrap("", 10) == []
+
+
+def test_shorten():
+    for width in range(5, 80):
+        assert shorten(TEXT, width) == textwrap.shorten(TEXT, width)
+    assert shorten("   ", 10) == ""
+
+
+def test_long_text():
+    text = TEXT * 20000
+    start = time.perf_counter()
+    for _ in range(100):
+        shortened = shorten(text, 40)
+        wrapped = wrap(text, 40, max_lines=3)
+    assert time.perf_counter() - start < 1
+
+    assert shortened == textwrap.shorten(text, 40)
+    assert wrapped == textwrap.wrap(text, 40, max_lines=3)